@@ -0,0 +1,196 @@
+"""
+End-to-end throughput against the ftx1emu radio (POSIX only).
+
+Measures, on one FTX1Cat connected to an emulated FTX-1:
+
+- cat:      raw CAT queries/sec, one at a time and pipelined (send_batch)
+- meters:   read_all_meters frames/sec
+- full_read: wall time of the GUI's full-read sequence (read_status + get_rts)
+- rigctl:   RigctlTCPServer requests/sec and tail latency with N concurrent clients,
+            reported twice: "cached" with the default RigStateCache TTLs (mostly
+            cache hits, no CAT traffic) and "uncached" with the FA / MD0 TTLs set
+            to 0 so every request goes to the radio
+
+Results are written as JSON so runs from different versions can be diffed:
+
+    python benchmarks/bench_e2e.py [--baud 38400] [--latency 0.002] [--duration 3]
+                                   [--clients 1,4,16] [--out bench_e2e.json]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ftx1cat import DEFAULT_STATE_TTL, FTX1Cat, _latency_summary  # noqa: E402
+from ftx1emu import FTX1Emulator  # noqa: E402
+from ftx1rigctl import RigctlTCPServer  # noqa: E402
+
+
+PREAMP_BANDS = ["HF50", "VHF", "UHF"]
+BATCH = 32
+# cache keys behind the rigctl "f" and "m" commands
+RIGCTL_KEYS = ("FA", "MD0")
+
+
+def _git_revision():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _run_for(duration, fn):
+    """Call fn() repeatedly for `duration` seconds; return per-call latencies (s)."""
+    samples = []
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def bench_cat(cat, duration):
+    single = _run_for(duration / 2, lambda: cat.query_raw(["FA"]))
+    batch = _run_for(duration / 2, lambda: cat.send_batch(["FA"] * BATCH))
+    return {
+        "sequential_cmds_per_s": len(single) / sum(single),
+        "pipelined_cmds_per_s": len(batch) * BATCH / sum(batch),
+        "sequential": _latency_summary(single),
+    }
+
+
+def bench_meters(cat, duration):
+    samples = _run_for(duration, cat.read_all_meters)
+    return {"frames_per_s": len(samples) / sum(samples), **_latency_summary(samples)}
+
+
+def bench_full_read(cat, duration):
+    def full_read():
+        cat.read_status(PREAMP_BANDS)
+        cat.get_rts()
+
+    samples = _run_for(duration, full_read)
+    return {"count": len(samples), "mean_ms": sum(samples) / len(samples) * 1000.0, **_latency_summary(samples)}
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def bench_rigctl(cat, duration, client_counts):
+    results = {"cached": _bench_rigctl(cat, duration, client_counts)}
+    for key in RIGCTL_KEYS:
+        cat.state.set_ttl(key, 0)
+    try:
+        results["uncached"] = _bench_rigctl(cat, duration, client_counts)
+    finally:
+        for key in RIGCTL_KEYS:
+            cat.state.set_ttl(key, DEFAULT_STATE_TTL[key])
+    return results
+
+
+def _bench_rigctl(cat, duration, client_counts):
+    port = _free_port()
+    server = RigctlTCPServer(cat, host="127.0.0.1", port=port)
+    server.start()
+    time.sleep(0.2)
+    results = {}
+    try:
+        for n in client_counts:
+            samples = [[] for _ in range(n)]
+            start = threading.Barrier(n + 1)
+
+            def client(out):
+                with socket.create_connection(("127.0.0.1", port)) as sock:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    f = sock.makefile("rwb", buffering=0)
+                    start.wait()
+                    end = time.perf_counter() + duration
+                    i = 0
+                    while time.perf_counter() < end:
+                        # rigctl clients (WSJT-X, fldigi) mostly poll frequency and mode
+                        t0 = time.perf_counter()
+                        if i % 2:
+                            f.write(b"m\n")
+                            f.readline()
+                            f.readline()
+                        else:
+                            f.write(b"f\n")
+                            f.readline()
+                        out.append(time.perf_counter() - t0)
+                        i += 1
+                    f.write(b"q\n")
+
+            threads = [threading.Thread(target=client, args=(out,), daemon=True) for out in samples]
+            for th in threads:
+                th.start()
+            cache0 = cat.cache_stats()
+            start.wait()
+            t0 = time.perf_counter()
+            for th in threads:
+                th.join()
+            elapsed = time.perf_counter() - t0
+            cache1 = cat.cache_stats()
+            hits = cache1["hits"] - cache0["hits"]
+            lookups = hits + cache1["misses"] - cache0["misses"]
+            flat = [s for out in samples for s in out]
+            results[str(n)] = {
+                "requests_per_s": len(flat) / elapsed,
+                "cache_hit_rate": hits / lookups if lookups else 0.0,
+                **_latency_summary(flat),
+            }
+    finally:
+        server.stop()
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--baud", type=int, default=38400)
+    ap.add_argument("--latency", type=float, default=0.002, help="emulated per-command processing time, s")
+    ap.add_argument("--duration", type=float, default=3.0, help="seconds per measurement")
+    ap.add_argument("--clients", default="1,4,16", help="comma-separated rigctl client counts")
+    ap.add_argument("--out", default="bench_e2e.json")
+    args = ap.parse_args()
+
+    radio = FTX1Emulator(baudrate=args.baud, latency_s=args.latency, register=False)
+    cat = FTX1Cat(port=radio.port, baudrate=args.baud, port2="loop://", timeout=0.3)
+    report = {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "baud": args.baud,
+        "latency_s": args.latency,
+        "duration_s": args.duration,
+    }
+    try:
+        report["cat"] = bench_cat(cat, args.duration)
+        report["meters"] = bench_meters(cat, args.duration)
+        report["full_read"] = bench_full_read(cat, args.duration)
+        report["rigctl"] = bench_rigctl(cat, args.duration, [int(n) for n in args.clients.split(",") if n.strip()])
+    finally:
+        cat.close()
+        radio.close()
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
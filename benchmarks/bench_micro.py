@@ -0,0 +1,198 @@
+"""
+Microbenchmarks for the per-frame parsers and meter converters in ftx1cat.
+
+Every meter frame goes through _parse_meter and convert_meter_value, and the
+converters (s_meter_from_raw, po_from_meter, _piecewise_lerp, swr_from_meter,
+...) run once per sample. This suite times each of them and compares the
+result against a stored baseline.
+
+    python benchmarks/bench_micro.py run [--out results.json] [--only meter]
+    python benchmarks/bench_micro.py save [--baseline benchmarks/micro_baseline.json]
+    python benchmarks/bench_micro.py compare [--tolerance 0.25]
+
+Converters are timed over all 256 raw values and reported per call;
+convert_meter_array is reported per sample of a 4096-sample batch.
+"compare" exits with status 1 if any case is slower than the baseline by
+more than the tolerance. Baselines are machine specific: save one on the
+machine you compare on.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import timeit
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import ftx1cat  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "micro_baseline.json")
+
+RAWS = list(range(256))
+RAW_ARRAY = np.random.default_rng(0).integers(0, 256, size=4096, dtype=np.int16)
+
+S_POINTS = [
+    (ftx1cat._S_RAW_S9, 0.0),
+    (ftx1cat._S_RAW_P20, 20.0),
+    (ftx1cat._S_RAW_P40, 40.0),
+    (ftx1cat._S_RAW_P60, 60.0),
+]
+
+STATUS_BANDS = ["HF50", "VHF", "UHF"]
+STATUS_RESPS = [b"FA014074000;", b"MD0C;", b"GT04;", b"PC1010;", b"BP00001;", b"BP01100;", b"PA01;", b"PA10;", b"PA21;"]
+# MetersPanel's default thresholds
+THRESHOLDS = [(3, 15), (4, 100), (5, 10), (6, 3), (7, 2), (8, 13.8)]
+METER_BATCH = b"".join(b"RM%d%03d000;" % (mid, mid * 30) for mid in range(1, 9))
+METER_HISTORY = ftx1cat.MeterHistory(1)
+
+
+class _Waiter:
+    """Stand-in for a Future: CatFrameDemux only needs done() / set_result()."""
+
+    __slots__ = ("result",)
+
+    def __init__(self):
+        self.result = None
+
+    def done(self):
+        return self.result is not None
+
+    def set_result(self, value):
+        self.result = value
+
+
+def _demux_meter_batch():
+    demux = ftx1cat.CatFrameDemux()
+    for mid in range(1, 9):
+        demux.add(b"RM%d" % mid, _Waiter())
+    demux.feed(METER_BATCH)
+
+
+def _over_raws(fn):
+    def run():
+        for raw in RAWS:
+            fn(raw)
+    return run
+
+
+# name -> (callable, calls per invocation)
+CASES = {
+    "parse_mox": (lambda: ftx1cat._parse_mox(b"MX0;"), 1),
+    "parse_freq": (lambda: ftx1cat._parse_freq(b"FA014074000;"), 1),
+    "parse_mode": (lambda: ftx1cat._parse_mode(b"MD0C;"), 1),
+    "parse_agc": (lambda: ftx1cat._parse_agc(b"GT04;", "0"), 1),
+    "parse_power_control": (lambda: ftx1cat._parse_power_control(b"PC1010;"), 1),
+    "parse_meter": (lambda: ftx1cat._parse_meter(b"RM5123000;", 5), 1),
+    "parse_notch_enabled": (lambda: ftx1cat._parse_notch_enabled(b"BP00001;"), 1),
+    "parse_notch_freq": (lambda: ftx1cat._parse_notch_freq(b"BP01100;"), 1),
+    "parse_preamp": (lambda: ftx1cat._parse_preamp(b"PA01;", "0"), 1),
+    "frame_key": (lambda: ftx1cat._frame_key(b"BP01100;"), 1),
+    "status_from_resps": (lambda: ftx1cat._status_from_resps(STATUS_BANDS, ["0", "1", "2"], STATUS_RESPS), 1),
+    "demux_meter_batch": (_demux_meter_batch, 1),
+    "read_meter_decode": (
+        lambda: ftx1cat.convert_meter_value(1, ftx1cat._parse_meter(b"RM1180000;", 1)),
+        1,
+    ),
+    "swr_from_meter": (_over_raws(ftx1cat.swr_from_meter), 256),
+    "vdd_from_meter": (_over_raws(ftx1cat.vdd_from_meter), 256),
+    "idd_from_meter": (_over_raws(ftx1cat.idd_from_meter), 256),
+    "comp_db_from_meter": (_over_raws(ftx1cat.comp_db_from_meter), 256),
+    "alc_from_meter": (_over_raws(ftx1cat.alc_from_meter), 256),
+    "po_from_meter": (_over_raws(ftx1cat.po_from_meter), 256),
+    "piecewise_lerp": (_over_raws(lambda raw: ftx1cat._piecewise_lerp(raw, S_POINTS)), 256),
+    "s_meter_from_raw": (_over_raws(ftx1cat.s_meter_from_raw), 256),
+    "s_meter_text_from_raw": (_over_raws(ftx1cat.s_meter_text_from_raw), 256),
+    "convert_meter_value": (
+        lambda: [ftx1cat.convert_meter_value(mid, raw) for mid in range(1, 9) for raw in RAWS],
+        8 * 256,
+    ),
+    "convert_meter_array": (lambda: ftx1cat.convert_meter_array(1, RAW_ARRAY), len(RAW_ARRAY)),
+    "meter_raw_for_value": (
+        lambda: [ftx1cat.meter_raw_for_value(mid, value) for mid, value in THRESHOLDS],
+        len(THRESHOLDS),
+    ),
+    "meter_history_append": (_over_raws(METER_HISTORY.append), 256),
+    "meter_history_window": (lambda: METER_HISTORY.window(1.0), 1),
+}
+
+
+def _ns_per_call(fn, calls, target_s=0.05, repeat=5):
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    number = max(1, int(number * target_s / 0.2))
+    return min(timer.repeat(number=number, repeat=repeat)) / number / calls * 1e9
+
+
+def run_cases(only=None):
+    results = {}
+    for name, (fn, calls) in CASES.items():
+        if only and not any(key in name for key in only):
+            continue
+        results[name] = _ns_per_call(fn, calls)
+    return results
+
+
+def _report(results):
+    return {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "ns_per_call": results,
+    }
+
+
+def compare(baseline, results, tolerance):
+    """Return [(name, base_ns, new_ns, ratio, slower)] for cases present in both."""
+    rows = []
+    for name, new_ns in results.items():
+        base_ns = baseline.get(name)
+        if base_ns is None:
+            continue
+        ratio = new_ns / base_ns
+        rows.append((name, base_ns, new_ns, ratio, ratio > 1.0 + tolerance))
+    return rows
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("action", choices=["run", "save", "compare"])
+    ap.add_argument("--baseline", default=DEFAULT_BASELINE)
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, as a fraction")
+    ap.add_argument("--only", action="append", help="run only cases whose name contains this (repeatable)")
+    ap.add_argument("--out", default=None, help="write results JSON here (run)")
+    args = ap.parse_args()
+
+    results = run_cases(args.only)
+
+    if args.action == "compare":
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["ns_per_call"]
+        rows = compare(baseline, results, args.tolerance)
+        print(f"{'case':<24} {'base ns':>10} {'now ns':>10} {'ratio':>7}")
+        for name, base_ns, new_ns, ratio, slower in rows:
+            flag = "  SLOWER" if slower else ""
+            print(f"{name:<24} {base_ns:10.1f} {new_ns:10.1f} {ratio:6.2f}x{flag}")
+        missing = sorted(set(results) - set(baseline))
+        if missing:
+            print("not in baseline: " + ", ".join(missing))
+        sys.exit(1 if any(row[4] for row in rows) else 0)
+
+    print(f"{'case':<24} {'ns/call':>10}")
+    for name, ns in results.items():
+        print(f"{name:<24} {ns:10.1f}")
+    report = _report(results)
+    path = args.baseline if args.action == "save" else args.out
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Per-reply parse cost: bytes-level parsers vs. the old decode-and-strip path.
+
+The old getters decoded every reply to str, stripped it and rebuilt digit
+strings before converting. The current parsers index the raw frame handed
+over by the reader thread. This script times both on representative frames.
+
+    python benchmarks/bench_parsers.py [--n 200000]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ftx1cat  # noqa: E402
+from ftx1cat import AGC_P3_TO_NAME, P2_TO_MODE  # noqa: E402
+
+
+# ---- previous str-based implementations, kept here for comparison only ----
+
+def _legacy_freq(resp):
+    r = resp.strip()
+    if r.startswith("FA") and r.endswith(";"):
+        try:
+            return int(r[2:-1])
+        except Exception:
+            return None
+    return None
+
+
+def _legacy_mode(resp):
+    r = resp.strip()
+    if not (r.startswith("MD") and r.endswith(";") and len(r) == 5):
+        return None
+    return P2_TO_MODE.get(r[3].upper())
+
+
+def _legacy_agc(resp, p1):
+    r = resp.strip()
+    if not (r.startswith("GT") and r.endswith(";")):
+        return None
+    digits = "".join(ch for ch in r[2:-1] if ch.isdigit())
+    if len(digits) < 2 or digits[0] != p1:
+        return None
+    return AGC_P3_TO_NAME.get(digits[1])
+
+
+def _legacy_power_control(resp):
+    r = resp.strip()
+    if not (r.startswith("PC") and r.endswith(";")):
+        return None, None
+    digits = "".join(ch for ch in r[2:-1] if ch.isdigit())
+    if len(digits) < 4:
+        return None, None
+    try:
+        watts = int(digits[1:4])
+    except Exception:
+        return None, None
+    return {"1": "FIELD", "2": "SPA1"}.get(digits[0]), watts
+
+
+def _legacy_meter(resp, meter_id):
+    r = resp.strip()
+    if not (r.startswith("RM") and r.endswith(";")):
+        return None
+    try:
+        if int(r[2]) != meter_id:
+            return None
+        if r[6:9] != "000":
+            return None
+        return int(r[3:6])
+    except Exception:
+        return None
+
+
+CASES = [
+    ("FA", b"FA014074000;", lambda f: _legacy_freq(f.decode(errors="ignore")), ftx1cat._parse_freq),
+    ("MD0", b"MD0C;", lambda f: _legacy_mode(f.decode(errors="ignore")), ftx1cat._parse_mode),
+    ("GT0", b"GT04;", lambda f: _legacy_agc(f.decode(errors="ignore"), "0"), lambda f: ftx1cat._parse_agc(f, "0")),
+    ("PC", b"PC1050;", lambda f: _legacy_power_control(f.decode(errors="ignore")), ftx1cat._parse_power_control),
+    ("RM5", b"RM5123000;", lambda f: _legacy_meter(f.decode(errors="ignore"), 5), lambda f: ftx1cat._parse_meter(f, 5)),
+]
+
+
+def _ns_per_call(fn, frame, n):
+    return min(timeit.repeat(lambda: fn(frame), number=n, repeat=5)) / n * 1e9
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=200_000)
+    args = ap.parse_args()
+
+    print(f"{'reply':<6} {'legacy ns':>10} {'bytes ns':>10} {'speedup':>8}")
+    for name, frame, legacy, current in CASES:
+        assert legacy(frame) == current(frame), name
+        old_ns = _ns_per_call(legacy, frame, args.n)
+        new_ns = _ns_per_call(current, frame, args.n)
+        print(f"{name:<6} {old_ns:10.1f} {new_ns:10.1f} {old_ns / new_ns:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
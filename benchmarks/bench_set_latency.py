@@ -0,0 +1,59 @@
+"""
+Set-command latency: legacy write+read_until path vs. fire-and-forget.
+
+The FTX-1 does not answer set commands, so the legacy path always waits out
+the serial timeout. This script runs both paths against the ftx1emu
+radio on a pseudo-terminal (POSIX only) and prints per-call latency.
+
+    python benchmarks/bench_set_latency.py [--n 20] [--timeout 0.3] [--baud 38400] [--latency 0.002]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ftx1cat import FTX1Cat  # noqa: E402
+from ftx1emu import FTX1Emulator  # noqa: E402
+
+
+def _measure(fn, n):
+    samples = []
+    for i in range(n):
+        t0 = time.perf_counter()
+        fn(14_000_000 + i * 10)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return samples
+
+
+def _report(name, samples):
+    print(f"{name:<22} mean {statistics.mean(samples):8.2f} ms   "
+          f"p50 {statistics.median(samples):8.2f} ms   max {max(samples):8.2f} ms")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=20)
+    ap.add_argument("--timeout", type=float, default=0.3)
+    ap.add_argument("--baud", type=int, default=38400)
+    ap.add_argument("--latency", type=float, default=0.002, help="emulated per-command processing time, s")
+    args = ap.parse_args()
+
+    radio = FTX1Emulator(baudrate=args.baud, latency_s=args.latency, register=False)
+    cat = FTX1Cat(port=radio.port, baudrate=args.baud, port2="loop://", timeout=args.timeout)
+    try:
+        wire_ms = 12 * 10.0 / args.baud * 1000.0
+        print(f"baud {args.baud}, timeout {args.timeout}s, wire time for 'FA014000000;' = {wire_ms:.2f} ms")
+        _report("legacy (query_raw)", _measure(lambda f: cat.query_raw([f"FA{f:09d}"]), args.n))
+        _report("set_freq", _measure(cat.set_freq, args.n))
+        _report("set_freq(verify=True)", _measure(lambda f: cat.set_freq(f, verify=True), args.n))
+    finally:
+        cat.close()
+        radio.close()
+
+
+if __name__ == "__main__":
+    main()
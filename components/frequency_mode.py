@@ -1,4 +1,5 @@
 import threading
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 import tkinter.font as tkfont
@@ -6,6 +7,72 @@ import tkinter.font as tkfont
 from ftx1cat import P2_TO_MODE
 
 
+class _FreqTuner:
+    """Latest-wins frequency setter for fast tuning.
+
+    Only the newest target is kept. It is sent at most once per
+    ``min_interval`` seconds; targets superseded in between are dropped.
+    Once no new target has arrived for ``idle`` seconds the frequency is
+    read back once and ``on_done(read_back, error, generation)`` is called
+    from the worker thread.
+    """
+
+    def __init__(self, cat_getter, on_done, min_interval: float = 0.05, idle: float = 0.3):
+        self._cat_getter = cat_getter
+        self._on_done = on_done
+        self._min_interval = min_interval
+        self._idle = idle
+        self._cond = threading.Condition()
+        self._target = None
+        self._running = False
+        self.generation = 0
+
+    def request(self, freq_hz: int):
+        with self._cond:
+            self._target = int(freq_hz)
+            self.generation += 1
+            self._cond.notify()
+            if not self._running:
+                self._running = True
+                threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        last_sent = 0.0
+        err = None
+        while True:
+            with self._cond:
+                if self._target is None:
+                    self._cond.wait(self._idle)
+                if self._target is None:
+                    # Knob went idle: confirm below; a new request starts a new worker
+                    self._running = False
+                    generation = self.generation
+                    break
+                wait = last_sent + self._min_interval - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                target, self._target = self._target, None
+            cat = self._cat_getter()
+            if cat is None:
+                continue
+            try:
+                cat.set_freq(target)
+                err = None
+            except Exception as e:
+                err = e
+            last_sent = time.monotonic()
+
+        read_back = None
+        cat = self._cat_getter()
+        if cat is not None:
+            try:
+                read_back, _ = cat.get_freq(max_age=0)
+            except Exception:
+                pass
+        self._on_done(read_back, err, generation)
+
+
 class FrequencyModePanel(ttk.LabelFrame):
     """Frequency and mode controls."""
 
@@ -18,7 +85,8 @@ class FrequencyModePanel(ttk.LabelFrame):
 
         self.digits = [0] * 9
         self._digit_cells = []
-        self._freq_op_seq = 0
+        self._last_op = (None, 0)
+        self._tuner = _FreqTuner(cat_getter, self._on_tune_done)
         self.current_freq_hz = 0
 
         self.mode_var = tk.StringVar()
@@ -132,7 +200,7 @@ class FrequencyModePanel(ttk.LabelFrame):
         cat = self._cat_getter()
         if not cat:
             return
-        freq_hz, _ = cat.get_freq()
+        freq_hz, _ = cat.get_freq(max_age=0)
         if freq_hz is None:
             messagebox.showerror(self._t("read_failed", "Read failed"), self._t("freq_parse_failed", "Cannot parse frequency"))
             return
@@ -142,7 +210,7 @@ class FrequencyModePanel(ttk.LabelFrame):
         cat = self._cat_getter()
         if not cat:
             return
-        mode_name, _ = cat.get_mode(main=True)
+        mode_name, _ = cat.get_mode(main=True, max_age=0)
         if mode_name is None:
             messagebox.showerror(self._t("read_failed", "Read failed"), self._t("illegal_mode_code", "Illegal mode code"))
             return
@@ -220,6 +288,29 @@ class FrequencyModePanel(ttk.LabelFrame):
         freq_hz = self._normalize_range(freq_hz, direction)
         self._send_and_confirm_freq(freq_hz, idx, direction)
 
+    def _on_tune_done(self, read_back, err, generation):
+        def apply():
+            if generation != self._tuner.generation:
+                # Tuning resumed meanwhile; the next idle readback will confirm
+                return
+            if err is not None:
+                messagebox.showerror(self._t("set_failed", "Set failed"), str(err))
+            if read_back is None:
+                return
+            # Flash the operated digit's half to indicate success
+            op_idx, op_dir = self._last_op
+            try:
+                if err is None and op_idx is not None and 0 <= op_idx < len(self._digit_cells):
+                    self._digit_cells[op_idx].flash_half(op_dir)
+            except Exception:
+                pass
+            self._set_digits_from_freq(read_back)
+
+        try:
+            self.after(0, apply)
+        except Exception:
+            pass
+
     def _set_digits_from_freq(self, freq_hz: int):
         try:
             freq_int = max(0, int(freq_hz))
@@ -278,42 +369,11 @@ class FrequencyModePanel(ttk.LabelFrame):
         cat = self._cat_getter()
         if not cat:
             return
-        self._freq_op_seq += 1
-        token = self._freq_op_seq
-
-        def worker():
-            err = None
-            read_back = None
-            try:
-                cat.set_freq(target_hz)
-            except Exception as e:
-                err = e
-            try:
-                read_back, _ = cat.get_freq()
-            except Exception:
-                pass
-
-            def apply():
-                if token != self._freq_op_seq:
-                    return
-                if err is not None:
-                    messagebox.showerror(self._t("set_failed", "Set failed"), str(err))
-                    return
-                if read_back is not None:
-                    # Flash the operated digit's half to indicate success
-                    try:
-                        if op_idx is not None and 0 <= op_idx < len(self._digit_cells):
-                            self._digit_cells[op_idx].flash_half(op_dir)
-                    except Exception:
-                        pass
-                    self._set_digits_from_freq(read_back)
-                    return
-            try:
-                self.after(0, apply)
-            except Exception:
-                pass
-
-        threading.Thread(target=worker, daemon=True).start()
+        # Show the target right away so further steps build on it; the tuner
+        # coalesces rapid steps and confirms with one readback when idle.
+        self._set_digits_from_freq(target_hz)
+        self._last_op = (op_idx, op_dir)
+        self._tuner.request(target_hz)
 
     class _DigitCell(ttk.Frame):
         def __init__(self, parent, idx, font_digit, on_step):
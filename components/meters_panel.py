@@ -2,7 +2,7 @@ import math
 import tkinter as tk
 from tkinter import ttk
 
-from ftx1cat import convert_meter_value, METER_CONVERT, s_meter_text_from_raw
+from ftx1cat import convert_meter_value, meter_raw_for_value, s_meter_text_from_raw
 
 
 class MeterHeader(ttk.Frame):
@@ -82,26 +82,14 @@ class MeterHeader(ttk.Frame):
         if value is None:
             return
 
-        fn = METER_CONVERT.get(self.meter_id)
-        if fn is None:
+        best_raw = meter_raw_for_value(self.meter_id, float(value))
+        if best_raw is None:
             v = max(0.0, min(1.0, float(value)))
             self.threshold_x = int(80 * v)
             self.bar_canvas.coords(self.threshold_id, self.threshold_x, 0, self.threshold_x, 12)
             return
 
-        target = float(value)
-        best_raw = 0
-        best_err = float("inf")
-        for r in range(256):
-            v = fn(r)
-            if math.isinf(v):
-                continue
-            err = abs(v - target)
-            if err < best_err:
-                best_err = err
-                best_raw = r
-
-        best_raw = max(0.0, min(255.0, float(best_raw)))
+        # Binary search in the shared inverse table (closest converted value)
         self.threshold_x = int(80 * best_raw / 255.0)
         self.bar_canvas.coords(self.threshold_id, self.threshold_x, 0, self.threshold_x, 12)
 
@@ -176,6 +164,12 @@ class MetersPanel(ttk.LabelFrame):
     def apply_language(self):
         self.configure(text=self._t("frame_meters"))
 
+    def set_threshold(self, name: str, value=None, raw=None):
+        """Move a meter's threshold marker at runtime (converted value or raw)."""
+        widget = self.meter_widgets.get(name)
+        if widget is not None:
+            widget.set_threshold(value=value, raw=raw)
+
     def update_meters(self, data):
         if data is None:
             self.clear()
@@ -339,7 +339,7 @@ class NotchControlsPanel(ttk.LabelFrame):
         cat = self._cat_getter()
         if not cat:
             return
-        enabled, freq_hz, _ = cat.get_manual_notch(main=True)
+        enabled, freq_hz, _ = cat.get_manual_notch(main=True, max_age=0)
         if enabled is None:
             self.notch_enabled_var.set(False)
         else:
@@ -70,7 +70,7 @@ class PreampAgcPanel(ttk.LabelFrame):
         if not cat:
             return
         try:
-            agc_name, _ = cat.get_agc(main=True)
+            agc_name, _ = cat.get_agc(main=True, max_age=0)
         except Exception as e:
             messagebox.showerror(self._t("read_failed", "Read failed"), self._t("agc_read_failed_fmt", "AGC read failed: {e}").format(e=e))
             return
@@ -124,7 +124,7 @@ class PttPowerPanel(ttk.LabelFrame):
 
             # After setting, read back current power control to confirm and update UI
             try:
-                dev, cur_w, raw = cat.get_power_control()
+                dev, cur_w, raw = cat.get_power_control(max_age=0)
             except Exception:
                 dev, cur_w, raw = None, None, None
 
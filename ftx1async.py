@@ -0,0 +1,513 @@
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Optional, Dict, Tuple
+
+import serial
+
+from ftx1cat import (
+    DISPLAY_TEXT,
+    METER_MAP,
+    CatFrameDemux,
+    CatMetrics,
+    _CatState,
+    _agc_cmd,
+    _band_p1,
+    _cmd_keys,
+    _freq_cmd,
+    _mode_cmd,
+    _mox_cmd,
+    _notch_cmds,
+    _parse_agc,
+    _parse_freq,
+    _parse_meter,
+    _parse_mode,
+    _parse_mox,
+    _parse_notch_enabled,
+    _parse_notch_freq,
+    _parse_power_control,
+    _parse_preamp,
+    _power_cmd,
+    _preamp_cmd,
+    _status_cmds,
+    _status_from_resps,
+    convert_meter_value,
+)
+
+
+# ==========================
+# asyncio 串口链路
+# ==========================
+
+class AsyncCatLink:
+    """
+    CatLink + CatScheduler 的 asyncio 版本。
+
+    串口以非阻塞方式打开，事件循环在可读时读入并交给 CatFrameDemux，
+    每个请求拿到一个 asyncio.Future，成百上千个等待者也不需要额外线程。
+    Windows 的串口句柄不能 add_reader，此时改为定时轮询 in_waiting。
+
+    与 CatScheduler 一样，命令先排队，由一个派发任务逐条写出：
+    - 在途（已写出、未收到应答）的查询不超过 depth 条，电台不会积压调用方早已放弃的命令
+    - 查询的超时从写出时刻算起，超时结果为 b""
+    - 写串口在线程池里完成，不阻塞事件循环
+    不分优先级，先进先出。
+    """
+
+    POLL_INTERVAL = 0.005
+
+    def __init__(self, ser, loop: asyncio.AbstractEventLoop, timeout: float = 1.0, on_unsolicited=None, depth: int = 4):
+        self._ser = ser
+        self._loop = loop
+        self._timeout = timeout
+        self._depth = max(1, depth)
+        self.on_unsolicited = on_unsolicited
+        self.metrics = CatMetrics(getattr(ser, "baudrate", 0) or 0)
+        self._demux = CatFrameDemux(set_hold_s=timeout)
+        # 排队的命令：(帧列表, Future, 是否等应答, 超时)；set 的一项可以是多条帧，一次写出
+        self._queue: deque = deque()
+        # 在途查询：Future -> 超时定时器
+        self._inflight: Dict[asyncio.Future, asyncio.TimerHandle] = {}
+        self._dispatch_task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._fd = None
+        self._poll_task = None
+        try:
+            fd = ser.fileno()
+            loop.add_reader(fd, self._on_readable)
+            self._fd = fd
+        except (AttributeError, NotImplementedError, OSError, ValueError):
+            self._poll_task = loop.create_task(self._poll())
+
+    def submit(self, cmds: list[str], timeout: Optional[float] = None) -> list[asyncio.Future]:
+        """
+        排队一组查询，返回与之一一对应的 Future（结果为应答帧 bytes）。
+        写出后 timeout 秒（默认为链路的 timeout）仍未收到应答的结果为 b""。
+        """
+        timeout = self._timeout if timeout is None else timeout
+        futs = [self._loop.create_future() for _ in cmds]
+        for cmd, fut in zip(cmds, futs):
+            self._enqueue([cmd if cmd.endswith(";") else cmd + ";"], fut, True, timeout)
+        return futs
+
+    def _on_done(self, fut: asyncio.Future, key: bytes, t_sent: float) -> None:
+        handle = self._inflight.pop(fut, None)
+        if handle is not None:
+            handle.cancel()
+        ok = not fut.cancelled() and fut.exception() is None and fut.result() not in (b"", b"?;")
+        self.metrics.record_reply(key, time.perf_counter() - t_sent if ok else None)
+        self._kick()
+
+    async def query(self, cmds: list[str], timeout: Optional[float] = None) -> list[bytes]:
+        """
+        排队一组查询并等待全部应答。
+        返回与 cmds 一一对应的应答帧；超时未收到的为 b""。
+        """
+        return list(await asyncio.gather(*self.submit(cmds, timeout)))
+
+    async def write(self, cmds: list[str]) -> None:
+        """排队一组 set 命令，整组在同一次写入中连续发出；写出即返回，不等应答。"""
+        fut = self._loop.create_future()
+        self._enqueue([c if c.endswith(";") else c + ";" for c in cmds], fut, False, self._timeout)
+        await fut
+
+    def _enqueue(self, frames: list[str], fut: asyncio.Future, expect_reply: bool, timeout: float) -> None:
+        if self._closed:
+            fut.set_exception(serial.SerialException("port closed"))
+            return
+        self._queue.append((frames, fut, expect_reply, timeout))
+        self._kick()
+
+    def _kick(self) -> None:
+        if self._dispatch_task is None and self._queue and not self._closed:
+            self._dispatch_task = self._loop.create_task(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        try:
+            while self._queue and len(self._inflight) < self._depth and not self._closed:
+                frames, fut, expect_reply, timeout = self._queue.popleft()
+                if fut.done():
+                    # 调用方已取消，不再发出
+                    continue
+                data = "".join(frames).encode("ascii")
+                keys = _cmd_keys(frames)
+                # 先登记再写出：应答可能在写入返回之前就到了。
+                # set 的占位也登记为 fut，写失败时整组一起移除
+                for frame in frames:
+                    self._demux.add(frame[:-1].encode("ascii") if expect_reply else None, fut)
+                try:
+                    await self._loop.run_in_executor(None, self._ser.write, data)
+                except Exception as e:
+                    self._demux.discard(fut)
+                    if not fut.done():
+                        fut.set_exception(e)
+                    continue
+                # 派发任务是唯一的写出者，没有锁，锁等待记为 0
+                t_sent = time.perf_counter()
+                self.metrics.record_write(keys, len(data), 0.0)
+                if not expect_reply:
+                    if not fut.done():
+                        fut.set_result(b"")
+                    continue
+                self._inflight[fut] = self._loop.call_later(timeout, self._expire, fut)
+                fut.add_done_callback(lambda fut, key=keys[0]: self._on_done(fut, key, t_sent))
+        finally:
+            self._dispatch_task = None
+
+    def _expire(self, fut: asyncio.Future) -> None:
+        """在途超时：从等待队列移除，Future 以 b"" 结束（同 CatLink.cancel）。"""
+        self._demux.discard(fut)
+        if not fut.done():
+            fut.set_result(b"")
+
+    def close(self):
+        self._closed = True
+        exc = serial.SerialException("port closed")
+        while self._queue:
+            fut = self._queue.popleft()[1]
+            if not fut.done():
+                fut.set_exception(exc)
+        for handle in self._inflight.values():
+            handle.cancel()
+        self._inflight.clear()
+        if self._fd is not None:
+            self._loop.remove_reader(self._fd)
+            self._fd = None
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+        self._demux.fail_all(exc)
+
+    def _on_readable(self):
+        try:
+            data = self._ser.read(self._ser.in_waiting or 1)
+        except Exception as e:
+            # 串口断开：停止读，在途请求立即失败
+            self.close()
+            self._demux.fail_all(e)
+            return
+        if data:
+            self._feed(data)
+
+    async def _poll(self):
+        while True:
+            try:
+                n = self._ser.in_waiting
+                data = self._ser.read(n) if n else b""
+            except Exception as e:
+                self._demux.fail_all(e)
+                return
+            if data:
+                self._feed(data)
+            else:
+                await asyncio.sleep(self.POLL_INTERVAL)
+
+    def _feed(self, data: bytes):
+        self.metrics.record_read(len(data))
+        for frame in self._demux.feed(data):
+            if self.on_unsolicited is not None:
+                try:
+                    self.on_unsolicited(frame)
+                except Exception:
+                    pass
+
+
+# ==========================
+# asyncio 版 FTX-1 CAT
+# ==========================
+
+class AsyncFTX1Cat(_CatState):
+    """
+    FTX1Cat 的 asyncio 版本：方法与 FTX1Cat 同名、参数和返回值相同，但都是协程。
+
+    用法:
+        cat = await AsyncFTX1Cat.open(port="COM11", port2="COM12")
+        freq_hz, _ = await cat.get_freq()
+        await cat.close()
+
+    所有请求都在同一个事件循环里完成，rigctl 服务、表头轮询等可以共用一个循环。
+    """
+
+    def __init__(
+        self,
+        ser,
+        ser2,
+        timeout: float = 1.0,
+        verify_sets: bool = False,
+        state_ttl: Optional[Dict[str, float]] = None,
+    ):
+        self._ser = ser
+        self._ser2 = ser2
+        self._timeout = timeout
+        self.verify_sets = verify_sets
+        self._init_state(state_ttl)
+        self._link = AsyncCatLink(ser, asyncio.get_running_loop(), timeout=timeout, on_unsolicited=self._on_unsolicited)
+        self.metrics = self._link.metrics
+
+    @classmethod
+    async def open(
+        cls,
+        port: str = "COM11",
+        baudrate: int = 38400,
+        port2: str = "COM12",
+        baudrate2: int = 38400,
+        timeout: float = 1.0,
+        verify_sets: bool = False,
+        auto_info: bool = False,
+        state_ttl: Optional[Dict[str, float]] = None,
+    ) -> "AsyncFTX1Cat":
+        loop = asyncio.get_running_loop()
+
+        def open_ports():
+            # CAT 口 timeout=0：非阻塞读，由事件循环负责等待
+            ser = serial.serial_for_url(port, baudrate=baudrate, bytesize=8, parity="N", stopbits=1, timeout=0)
+            ser2 = serial.serial_for_url(
+                port2,
+                baudrate=baudrate2,
+                bytesize=8,
+                parity="N",
+                stopbits=1,
+                timeout=timeout,
+                rtscts=False,
+                dsrdtr=False,
+            )
+            ser.reset_input_buffer()
+            ser.reset_output_buffer()
+            ser2.rts = False
+            return ser, ser2
+
+        ser, ser2 = await loop.run_in_executor(None, open_ports)
+        cat = cls(ser, ser2, timeout=timeout, verify_sets=verify_sets, state_ttl=state_ttl)
+        await cat.probe_capabilities()
+        if auto_info:
+            await cat.set_auto_info(True)
+        return cat
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    # ---------- 基础方法 ----------
+
+    async def close(self):
+        if self.auto_info:
+            try:
+                await self.set_auto_info(False)
+            except Exception:
+                pass
+        self._link.close()
+        if self._ser and self._ser.is_open:
+            self._ser.close()
+        if self._ser2 and self._ser2.is_open:
+            self._ser2.close()
+
+    def metrics_snapshot(self) -> Dict[str, object]:
+        """见 FTX1Cat.metrics_snapshot；异步客户端的队列不分优先级，不含 queue。"""
+        snap = self.metrics.snapshot()
+        snap["cache"] = self.cache_stats()
+        return snap
+
+    def dump_metrics(self, path: Optional[str] = None) -> str:
+        """见 FTX1Cat.dump_metrics。"""
+        text = json.dumps(self.metrics_snapshot(), indent=2, ensure_ascii=False)
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        return text
+
+    async def _query(self, cmds: list[str]) -> list[bytes]:
+        resps = await self._link.query(cmds)
+        for resp in resps:
+            self._remember(resp)
+        return resps
+
+    async def _send_cat(self, cmd: str) -> str:
+        return (await self._query([cmd]))[0].decode(errors="ignore")
+
+    async def send_batch(self, cmds: list[str]) -> list[str]:
+        """流水线批量查询，见 FTX1Cat.send_batch。"""
+        if not cmds:
+            return []
+        return [resp.decode(errors="ignore") for resp in await self._query(cmds)]
+
+    async def _read(self, cmd: str, max_age: Optional[float] = None) -> bytes:
+        """见 FTX1Cat._read。"""
+        frame = self._cached_frame(cmd.encode("ascii"), max_age)
+        if frame is not None:
+            return frame
+        return (await self._query([cmd]))[0]
+
+    async def _write_cat(self, cmd: str) -> None:
+        await self._link.write([cmd])
+
+    async def _set_cat(self, cmd: str, query: str, accept: Tuple[str, ...] = (), verify: Optional[bool] = None) -> str:
+        """见 FTX1Cat._set_cat。"""
+        if verify is None:
+            verify = self.verify_sets
+        await self._write_cat(cmd)
+        self._note_set(cmd, accept)
+        if not verify:
+            return ""
+        resp = await self._send_cat(query)
+        if resp.strip().rstrip(";") not in (accept or (cmd,)):
+            raise RuntimeError(DISPLAY_TEXT["err_set_verify_fmt"].format(cmd=cmd, resp=resp))
+        return resp
+
+    # ---------- 电台能力 ----------
+
+    async def probe_capabilities(self) -> Dict[str, Optional[str]]:
+        """见 FTX1Cat.probe_capabilities。"""
+        await self.get_power_control(max_age=0)
+        return dict(self.capabilities)
+
+    # ---------- AI 主动上报 ----------
+
+    async def set_auto_info(self, on: bool) -> None:
+        """见 FTX1Cat.set_auto_info；监听者在事件循环里调用。"""
+        await self._write_cat("AI1" if on else "AI0")
+        if on:
+            await self.send_batch(["FA", "MD0"])
+        self.auto_info = bool(on)
+
+    # ---------- TX ----------
+
+    async def set_rts(self, on: bool) -> None:
+        self._ser2.rts = bool(on)
+
+    async def get_rts(self) -> bool:
+        return bool(self._ser2.rts)
+
+    async def is_transmitting(self) -> bool:
+        return bool(self._ser2.rts) or self.state.peek(b"MX") == b"MX1;"
+
+    # ---------- MOX ----------
+
+    async def set_mox(self, on: bool, verify: Optional[bool] = None) -> str:
+        return await self._set_cat(*_mox_cmd(on), verify=verify)
+
+    async def get_mox(self, max_age: Optional[float] = None) -> Tuple[Optional[bool], str]:
+        frame = await self._read("MX", max_age)
+        return self._checked(frame, _parse_mox(frame)), frame.decode(errors="ignore")
+
+    # ---------- 频率 ----------
+
+    async def get_freq(self, max_age: Optional[float] = None) -> Tuple[Optional[int], str]:
+        frame = await self._read("FA", max_age)
+        return self._checked(frame, _parse_freq(frame)), frame.decode(errors="ignore")
+
+    async def set_freq(self, freq_hz: int, verify: Optional[bool] = None) -> str:
+        return await self._set_cat(*_freq_cmd(freq_hz), verify=verify)
+
+    # ---------- 模式 ----------
+
+    async def get_mode(self, main: bool = True, max_age: Optional[float] = None) -> Tuple[Optional[str], str]:
+        p1 = "0" if main else "1"
+        frame = await self._read(f"MD{p1}", max_age)
+        return self._checked(frame, _parse_mode(frame)), frame.decode(errors="ignore")
+
+    async def set_mode(self, mode_name: str, main: bool = True, verify: Optional[bool] = None) -> str:
+        return await self._set_cat(*_mode_cmd(mode_name, main), verify=verify)
+
+    # ---------- AGC ----------
+
+    async def get_agc(self, main: bool = True, max_age: Optional[float] = None) -> Tuple[Optional[str], str]:
+        p1 = "0" if main else "1"
+        frame = await self._read(f"GT{p1}", max_age)
+        return self._checked(frame, _parse_agc(frame, p1)), frame.decode(errors="ignore")
+
+    async def set_agc(self, agc: str, main: bool = True, verify: Optional[bool] = None) -> str:
+        return await self._set_cat(*_agc_cmd(agc, main), verify=verify)
+
+    # ---------- RF Power ----------
+
+    async def get_power_control(self, max_age: Optional[float] = None) -> Tuple[Optional[str], Optional[int], str]:
+        frame = await self._read("PC", max_age)
+        dev, watts = _parse_power_control(frame)
+        self._checked(frame, watts)
+        return dev, watts, frame.decode(errors="ignore")
+
+    async def set_power_watts(self, watts: int, verify: Optional[bool] = None) -> str:
+        if not isinstance(watts, int):
+            raise TypeError(DISPLAY_TEXT["err_watts_type"])
+        dev = self.capabilities["power_dev"]
+        if dev is None:
+            dev, _, raw = await self.get_power_control(max_age=0)
+            if dev is None:
+                raise RuntimeError(DISPLAY_TEXT["err_parse_pc_fmt"].format(raw=raw))
+        return await self._set_cat(*_power_cmd(watts, dev), verify=verify)
+
+    # ---------- METER ----------
+
+    async def read_meter(self, meter_id: int) -> Tuple[Optional[int], Optional[float], str]:
+        frame = (await self._query([f"RM{meter_id}"]))[0]
+        raw_val = self._checked(frame, _parse_meter(frame, meter_id))
+        resp = frame.decode(errors="ignore")
+        if raw_val is None:
+            return None, None, resp
+        return raw_val, convert_meter_value(meter_id, raw_val), resp
+
+    async def read_all_meters(self) -> Dict[str, Dict[str, int | float | None]]:
+        return await self.read_meters(range(1, 9))
+
+    async def read_meters(self, meter_ids) -> Dict[str, Dict[str, int | float | None]]:
+        mids = list(meter_ids)
+        if not mids:
+            return {}
+        resps = await self._query([f"RM{mid}" for mid in mids])
+        results: Dict[str, Dict[str, int | float | None]] = {}
+        for mid, resp in zip(mids, resps):
+            raw = self._checked(resp, _parse_meter(resp, mid))
+            if raw is not None:
+                results[METER_MAP.get(mid, f"METER_{mid}")] = {
+                    "raw": raw,
+                    "value": convert_meter_value(mid, raw),
+                }
+        return results
+
+    # ---------- Manual NOTCH ----------
+
+    async def set_manual_notch(
+        self,
+        main: bool = True,
+        enabled: Optional[bool] = None,
+        freq_hz: Optional[int] = None,
+        verify: Optional[bool] = None,
+    ) -> str:
+        last_resp = ""
+        for cmd in _notch_cmds(main, enabled, freq_hz):
+            last_resp = await self._set_cat(*cmd, verify=verify)
+        return last_resp
+
+    async def get_manual_notch(
+        self, main: bool = True, max_age: Optional[float] = None
+    ) -> Tuple[Optional[bool], Optional[int], Tuple[str, str]]:
+        p1 = "0" if main else "1"
+        cached = [self._cached_frame(f"BP{p1}{p2}".encode("ascii"), max_age) for p2 in "01"]
+        if None in cached:
+            cached = await self._query([f"BP{p1}0", f"BP{p1}1"])
+        frame_on, frame_freq = cached
+        return (
+            self._checked(frame_on, _parse_notch_enabled(frame_on)),
+            self._checked(frame_freq, _parse_notch_freq(frame_freq)),
+            (frame_on.decode(errors="ignore"), frame_freq.decode(errors="ignore")),
+        )
+
+    # ---------- 整机状态 ----------
+
+    async def read_status(self, bands: Optional[list[str]] = None) -> Dict[str, object]:
+        bands = list(bands or [])
+        cmds, band_p1 = _status_cmds(bands)
+        return _status_from_resps(bands, band_p1, await self._query(cmds))
+
+    # ---------- PRE-AMP / IPO ----------
+
+    async def get_preamp(self, band: str, max_age: Optional[float] = None) -> Tuple[Optional[str], str]:
+        p1 = _band_p1(band)
+        frame = await self._read(f"PA{p1}", max_age)
+        return self._checked(frame, _parse_preamp(frame, p1)), frame.decode(errors="ignore")
+
+    async def set_preamp(self, band: str, level: str, verify: Optional[bool] = None) -> str:
+        return await self._set_cat(*_preamp_cmd(band, level), verify=verify)
@@ -0,0 +1,329 @@
+"""
+ftx1capture：CAT 口收发录制与回放。
+
+录制：把 CAT 口上的每一次写出和读入连同时间戳记到一个二进制文件里，
+用户反馈表头卡顿、读数不对时可以直接把文件发过来分析：
+
+    cap = CaptureFactory("session.ftx1cap")
+    cat = FTX1Cat(port="COM11", port2="COM12", serial_factory=cap)
+    ...
+    cat.close()
+    cap.close()
+
+回放：用录下的文件代替电台，按原始时序（或尽快）把应答交给 FTX1Cat，
+在没有电台的情况下复现问题、分析解析和轮询逻辑：
+
+    cat = FTX1Cat(port="session.ftx1cap", port2="loop://", serial_factory=ReplayFactory(realtime=False))
+
+文件格式（小端）：
+    文件头  b"FTX1CAP1" + float64 录制开始的 time.time()
+    记录    kind(1 字节: W 写出 / R 读入 / O 打开串口) + float64 相对开始的秒数 (单调时钟) + uint16 长度 + 数据
+
+    python ftx1capture.py session.ftx1cap           # 打印记录
+    python ftx1capture.py session.ftx1cap --summary  # 只打印统计
+"""
+
+import argparse
+import struct
+import threading
+import time
+from collections import deque
+from typing import Iterator, NamedTuple, Optional
+
+import serial
+
+from ftx1cat import DISPLAY_TEXT
+
+
+CAPTURE_MAGIC = b"FTX1CAP1"
+_HEADER = struct.Struct("<8sd")
+_RECORD = struct.Struct("<cdH")
+
+KIND_WRITE = b"W"
+KIND_READ = b"R"
+KIND_OPEN = b"O"
+
+# 缓冲中的记录最多隔这么久写到磁盘一次（秒）
+FLUSH_INTERVAL_S = 1.0
+
+
+class CaptureRecord(NamedTuple):
+    kind: bytes
+    t: float
+    data: bytes
+
+
+def read_capture(path: str) -> Iterator[CaptureRecord]:
+    """逐条读出录制文件里的记录；文件末尾不完整的记录（录制中断）忽略。"""
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+        if len(header) != _HEADER.size or header[:8] != CAPTURE_MAGIC:
+            raise ValueError(DISPLAY_TEXT["err_capture_format_fmt"].format(path=path))
+        while True:
+            head = f.read(_RECORD.size)
+            if len(head) < _RECORD.size:
+                return
+            kind, t, n = _RECORD.unpack(head)
+            data = f.read(n)
+            if len(data) < n:
+                return
+            yield CaptureRecord(kind, t, data)
+
+
+# ==========================
+# 录制
+# ==========================
+
+class CaptureWriter:
+    """录制文件，线程安全（写出在调度线程、读入在读线程）。"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._f = open(path, "wb")
+        self._f.write(_HEADER.pack(CAPTURE_MAGIC, time.time()))
+        self._t0 = time.perf_counter()
+        self._last_flush = self._t0
+
+    def record(self, kind: bytes, data: bytes) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            if self._f.closed:
+                return
+            for i in range(0, max(len(data), 1), 0xFFFF):
+                chunk = data[i:i + 0xFFFF]
+                self._f.write(_RECORD.pack(kind, now - self._t0, len(chunk)))
+                self._f.write(chunk)
+            if now - self._last_flush > FLUSH_INTERVAL_S:
+                self._f.flush()
+                self._last_flush = now
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._f.closed:
+                self._f.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._f.closed:
+                self._f.close()
+
+
+class CaptureSerial:
+    """包在一个串口对象外面，转发全部调用，并把 write / read 的数据记下来。"""
+
+    def __init__(self, ser, writer: CaptureWriter):
+        self._ser = ser
+        self._writer = writer
+        writer.record(KIND_OPEN, str(getattr(ser, "port", "") or "").encode("utf-8", errors="replace"))
+
+    def write(self, data: bytes) -> int:
+        self._writer.record(KIND_WRITE, bytes(data))
+        return self._ser.write(data)
+
+    def read(self, size: int = 1) -> bytes:
+        data = self._ser.read(size)
+        if data:
+            self._writer.record(KIND_READ, data)
+        return data
+
+    def close(self) -> None:
+        self._writer.flush()
+        self._ser.close()
+
+    def __getattr__(self, name):
+        return getattr(self._ser, name)
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._ser, name, value)
+
+
+class CaptureFactory:
+    """
+    FTX1Cat 的 serial_factory：正常打开串口并录制。
+    断线重连后重开的串口记在同一个文件里（以一条 O 记录分隔）。
+    """
+
+    def __init__(self, path: str, opener=serial.serial_for_url):
+        self.writer = CaptureWriter(path)
+        self._opener = opener
+
+    def __call__(self, port: str, **kwargs) -> CaptureSerial:
+        return CaptureSerial(self._opener(port, **kwargs), self.writer)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+# ==========================
+# 回放
+# ==========================
+
+class ReplaySerial:
+    """
+    用录制文件模拟 CAT 口，提供 FTX1Cat / CatLink 用到的串口接口。
+
+    每次 write 对应文件里的下一条 W 记录，其后直到下一条 W 之前的 R 记录作为应答：
+    realtime=True 时按录制时与那次写出的时间差交付，否则立即交付。
+    写出的数据与录制不一致时照样推进，并计入 mismatches。
+    文件里的记录用完后写出不再有应答（像一台不回话的电台）。
+    """
+
+    def __init__(self, path: str, realtime: bool = True, timeout: Optional[float] = None, baudrate: int = 0, **_):
+        self.port = path
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.realtime = realtime
+        self.rts = False
+        self.dtr = False
+        self.writes = 0
+        self.mismatches = 0
+        self._records = [r for r in read_capture(path) if r.kind in (KIND_WRITE, KIND_READ)]
+        self._pos = 0
+        self._buf = bytearray()
+        self._pending = deque()   # (交付时刻, 数据)
+        self._cond = threading.Condition()
+        self._open = True
+        self._cancel = False
+        # 第一次写出之前读到的数据（如 AI 上报）按录制时刻交付
+        t_open = time.perf_counter()
+        while self._pos < len(self._records) and self._records[self._pos].kind == KIND_READ:
+            rec = self._records[self._pos]
+            self._pending.append((t_open + rec.t if realtime else t_open, rec.data))
+            self._pos += 1
+
+    @property
+    def is_open(self) -> bool:
+        return self._open
+
+    @property
+    def exhausted(self) -> bool:
+        """文件里的记录已全部交付。"""
+        with self._cond:
+            return self._pos >= len(self._records) and not self._pending and not self._buf
+
+    def write(self, data: bytes) -> int:
+        if not self._open:
+            raise serial.SerialException("port closed")
+        data = bytes(data)
+        with self._cond:
+            self.writes += 1
+            records = self._records
+            while self._pos < len(records) and records[self._pos].kind != KIND_WRITE:
+                self._pos += 1
+            if self._pos >= len(records):
+                return len(data)
+            rec = records[self._pos]
+            self._pos += 1
+            if rec.data != data:
+                self.mismatches += 1
+            now = time.perf_counter()
+            while self._pos < len(records) and records[self._pos].kind == KIND_READ:
+                reply = records[self._pos]
+                self._pending.append((now + (reply.t - rec.t) if self.realtime else now, reply.data))
+                self._pos += 1
+            self._cond.notify_all()
+        return len(data)
+
+    def read(self, size: int = 1) -> bytes:
+        deadline = None if self.timeout is None else time.perf_counter() + self.timeout
+        with self._cond:
+            self._cancel = False
+            while True:
+                now = time.perf_counter()
+                self._release(now)
+                if self._buf or self._cancel or not self._open:
+                    break
+                waits = []
+                if self._pending:
+                    waits.append(self._pending[0][0] - now)
+                if deadline is not None:
+                    if now >= deadline:
+                        break
+                    waits.append(deadline - now)
+                self._cond.wait(max(0.0, min(waits)) if waits else None)
+            out = bytes(self._buf[:size])
+            del self._buf[:size]
+        if not self._open and not out:
+            raise serial.SerialException("port closed")
+        return out
+
+    @property
+    def in_waiting(self) -> int:
+        with self._cond:
+            self._release(time.perf_counter())
+            return len(self._buf)
+
+    def _release(self, now: float) -> None:
+        while self._pending and self._pending[0][0] <= now:
+            self._buf += self._pending.popleft()[1]
+
+    def cancel_read(self) -> None:
+        with self._cond:
+            self._cancel = True
+            self._cond.notify_all()
+
+    def flush(self) -> None:
+        pass
+
+    def reset_input_buffer(self) -> None:
+        with self._cond:
+            self._buf.clear()
+
+    def reset_output_buffer(self) -> None:
+        pass
+
+    def close(self) -> None:
+        with self._cond:
+            self._open = False
+            self._cond.notify_all()
+
+
+class ReplayFactory:
+    """FTX1Cat 的 serial_factory：把 port 当作录制文件路径打开 ReplaySerial。"""
+
+    def __init__(self, realtime: bool = True):
+        self.realtime = realtime
+        self.last: Optional[ReplaySerial] = None
+
+    def __call__(self, port: str, timeout: Optional[float] = None, baudrate: int = 0, **_) -> ReplaySerial:
+        self.last = ReplaySerial(port, realtime=self.realtime, timeout=timeout, baudrate=baudrate)
+        return self.last
+
+
+# ==========================
+# 命令行
+# ==========================
+
+def main():
+    ap = argparse.ArgumentParser(description="Inspect an FTX-1 CAT capture file")
+    ap.add_argument("path")
+    ap.add_argument("--summary", action="store_true", help="print totals only")
+    args = ap.parse_args()
+
+    counts = {KIND_WRITE: 0, KIND_READ: 0, KIND_OPEN: 0}
+    nbytes = {KIND_WRITE: 0, KIND_READ: 0, KIND_OPEN: 0}
+    t_last = 0.0
+    for rec in read_capture(args.path):
+        counts[rec.kind] = counts.get(rec.kind, 0) + 1
+        nbytes[rec.kind] = nbytes.get(rec.kind, 0) + len(rec.data)
+        t_last = rec.t
+        if not args.summary:
+            print(f"{rec.t:12.6f} {rec.kind.decode()} {rec.data.decode('ascii', errors='backslashreplace')}")
+    print(
+        DISPLAY_TEXT["log_capture_summary_fmt"].format(
+            duration=t_last,
+            writes=counts[KIND_WRITE],
+            tx=nbytes[KIND_WRITE],
+            reads=counts[KIND_READ],
+            rx=nbytes[KIND_READ],
+            opens=counts[KIND_OPEN],
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,17 @@
+import json
 import time
 import math
+import bisect
+import heapq
+import itertools
 import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Optional, Dict, Tuple
 
+import numpy as np
 import serial
 
 import os
@@ -181,9 +190,7 @@ def s_meter_from_raw(raw: int) -> float:
     return float(db)
 
 
-def s_meter_text_from_raw(raw: int) -> str:
-    """字符串输出（隐藏备用）：Sx 或 +XdB。"""
-    v = s_meter_from_raw(raw)
+def _s_meter_text(v: float) -> str:
     if v < 10.0:
         # S 区：只会是 0/1/3/5/7/9
         return f"S{int(v)}"
@@ -192,6 +199,12 @@ def s_meter_text_from_raw(raw: int) -> str:
     return f"+{v:.1f}dB"
 
 
+def s_meter_text_from_raw(raw: int) -> str:
+    """字符串输出（隐藏备用）：Sx 或 +XdB。"""
+    r = 0 if raw < 0 else 255 if raw > 255 else int(raw)
+    return _S_METER_TEXT[r]
+
+
 METER_CONVERT = {
     1: s_meter_from_raw,   # S_MAIN (float: <10 => S, >=10 => dB)
     2: s_meter_from_raw,   # S_SUB  (float: <10 => S, >=10 => dB)
@@ -203,11 +216,321 @@ METER_CONVERT = {
     8: vdd_from_meter,     # VDD (V)
 }
 
+# raw 只有 0..255：导入时把每个 meter 的 256 个换算结果算好，
+# 每帧换算变成一次查表（上面的函数保留为换算公式本身）
+METER_TABLES = {mid: tuple(float(fn(raw)) for raw in range(256)) for mid, fn in METER_CONVERT.items()}
+_METER_ARRAYS = {mid: np.array(table, dtype=np.float64) for mid, table in METER_TABLES.items()}
+_S_METER_TEXT = tuple(_s_meter_text(v) for v in METER_TABLES[1])
+
+
 def convert_meter_value(meter_id: int, raw: int) -> float:
-    fn = METER_CONVERT.get(meter_id)
-    if fn is None:
+    table = METER_TABLES.get(meter_id)
+    if table is None:
         return raw
-    return fn(raw)
+    if type(raw) is int and 0 <= raw <= 255:
+        return table[raw]
+    # 超出 8 位或非整数（如阈值换算）：按公式算
+    return METER_CONVERT[meter_id](raw)
+
+
+def convert_meter_array(meter_id: int, raws) -> np.ndarray:
+    """
+    批量换算（日志、历史曲线）：raws 为任意形状的 raw 数组，返回同形状的 float64 数组。
+    raw 先截到 0..255 再查表；不认识的 meter_id 原样转成 float。
+    """
+    raws = np.asarray(raws)
+    table = _METER_ARRAYS.get(meter_id)
+    if table is None:
+        return raws.astype(np.float64)
+    return table[np.clip(raws, 0, 255).astype(np.intp)]
+
+
+# 反查表（阈值、报警门限用）：每个 meter 的有限换算值按 (值, raw) 排序，
+# 相同的值只保留最小的 raw，二分查找最接近的
+def _inverse_table(table: tuple) -> Tuple[tuple, tuple]:
+    values, raws = [], []
+    for v, raw in sorted((v, raw) for raw, v in enumerate(table) if not math.isinf(v)):
+        if values and values[-1] == v:
+            continue
+        values.append(v)
+        raws.append(raw)
+    return tuple(values), tuple(raws)
+
+
+METER_INVERSE = {mid: _inverse_table(table) for mid, table in METER_TABLES.items()}
+
+
+def meter_raw_for_value(meter_id: int, value: float) -> Optional[int]:
+    """
+    换算值 -> 换算结果最接近的 raw（0..255），距离相同取较小的 raw。
+    不认识的 meter_id 返回 None。
+    """
+    inverse = METER_INVERSE.get(meter_id)
+    if inverse is None:
+        return None
+    values, raws = inverse
+    i = bisect.bisect_left(values, value)
+    if i == 0:
+        return raws[0]
+    if i == len(values):
+        return raws[-1]
+    err_lo = value - values[i - 1]
+    err_hi = values[i] - value
+    if err_lo < err_hi:
+        return raws[i - 1]
+    if err_hi < err_lo:
+        return raws[i]
+    return min(raws[i - 1], raws[i])
+
+
+# ==========================
+# 表头轮询策略
+# ==========================
+
+# 各状态下要读的 meter 及最短读取间隔（秒）：
+# 接收时 COMP/ALC/PO/SWR/IDD 没有意义，发射时 S 表没有意义；
+# S_SUB 面板上不显示；VDD 变化很慢，几秒读一次
+METER_POLL_RX = {1: 0.1, 8: 5.0}
+METER_POLL_TX = {3: 0.1, 4: 0.1, 5: 0.1, 6: 0.1, 7: 0.5, 8: 5.0}
+
+
+class MeterPollPolicy:
+    """
+    按收/发状态和各 meter 的间隔决定这一轮读哪些 meter：
+
+        policy = MeterPollPolicy()
+        while True:
+            ids = policy.due(cat.is_transmitting())
+            if ids:
+                show(policy.update(ids, cat.read_meters(ids)))
+            time.sleep(policy.next_due())
+
+    收发切换后，新状态下的 meter 立即全部到期，上一状态的读数丢弃。
+    update() 返回当前状态下各 meter 最近一次的读数（格式同 read_all_meters），
+    本轮没读的沿用上一次的值。
+    """
+
+    def __init__(self, rx: Optional[Dict[int, float]] = None, tx: Optional[Dict[int, float]] = None):
+        self.rx = dict(METER_POLL_RX if rx is None else rx)
+        self.tx = dict(METER_POLL_TX if tx is None else tx)
+        self._transmitting: Optional[bool] = None
+        self._last: Dict[int, float] = {}
+        self._values: Dict[str, Dict[str, int | float | None]] = {}
+
+    def _intervals(self) -> Dict[int, float]:
+        return self.tx if self._transmitting else self.rx
+
+    def due(self, transmitting: bool, now: Optional[float] = None) -> list[int]:
+        if now is None:
+            now = time.monotonic()
+        transmitting = bool(transmitting)
+        if transmitting != self._transmitting:
+            self._transmitting = transmitting
+            self._last.clear()
+            self._values.clear()
+        return [mid for mid, interval in sorted(self._intervals().items())
+                if mid not in self._last or now - self._last[mid] >= interval]
+
+    def next_due(self, now: Optional[float] = None) -> float:
+        """距下一个 meter 到期的秒数。"""
+        if now is None:
+            now = time.monotonic()
+        waits = [0.0 if mid not in self._last else self._last[mid] + interval - now
+                 for mid, interval in self._intervals().items()]
+        return max(0.0, min(waits)) if waits else 0.1
+
+    def update(self, meter_ids, data: Dict[str, Dict[str, int | float | None]], now: Optional[float] = None):
+        if now is None:
+            now = time.monotonic()
+        for mid in meter_ids:
+            self._last[mid] = now
+            name = METER_MAP.get(mid, f"METER_{mid}")
+            if name in data:
+                self._values[name] = data[name]
+            else:
+                self._values.pop(name, None)
+        return dict(self._values)
+
+
+# ==========================
+# 表头历史
+# ==========================
+
+# 每个 meter 保留的样本数：10 Hz 轮询约 100 秒
+METER_HISTORY_SIZE = 1024
+
+
+class MeterHistory:
+    """
+    一个 meter 的定长历史（环形缓冲，NumPy 数组），样本为 (time.monotonic() 时间戳, raw)：
+
+        hist = MeterHistory(meter_id=5)
+        hist.append(raw, t)
+        t, raw = hist.window(2.0)       # 最近 2 秒（副本）
+        hist.min, hist.max, hist.mean   # 缓冲内全部样本的统计，O(1)
+        hist.peak()                     # 峰值保持（raw），hold_s 后按 decay_per_s 回落
+
+    环形缓冲存两份（下标 i 与 i + size），任意最近 n 个样本在数组里都是连续的一段，
+    samples() / window() 在锁内切片后复制一份返回，不受之后 append 的影响。
+    append 在表头线程、读取在 GUI / 日志 / 报警线程，内部用锁保护缓冲、下标和统计；
+    stats(seconds) 在锁内直接对切片计算，不复制。
+    统计和峰值均为 raw，换算值用 convert_meter_value / convert_meter_array。
+    """
+
+    def __init__(
+        self,
+        meter_id: int,
+        size: int = METER_HISTORY_SIZE,
+        hold_s: float = 1.0,
+        decay_per_s: float = 50.0,
+    ):
+        if size <= 0:
+            raise ValueError(size)
+        self.meter_id = meter_id
+        self.size = size
+        self.hold_s = hold_s
+        self.decay_per_s = decay_per_s
+        self._lock = threading.Lock()
+        self._t = np.zeros(2 * size, dtype=np.float64)
+        self._raw = np.zeros(2 * size, dtype=np.int16)
+        self._count = 0      # 累计 append 次数
+        self._sum = 0        # 缓冲内 raw 之和（整数，不累积误差）
+        # 单调队列 [(序号, raw)]：队首为缓冲内的最小 / 最大值，append 均摊 O(1)
+        self._minq: deque = deque()
+        self._maxq: deque = deque()
+        self._peak: Optional[int] = None
+        self._peak_t = 0.0
+
+    def __len__(self) -> int:
+        return min(self._count, self.size)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._count = 0
+            self._sum = 0
+            self._minq.clear()
+            self._maxq.clear()
+            self._peak = None
+
+    def append(self, raw: int, t: Optional[float] = None) -> None:
+        if t is None:
+            t = time.monotonic()
+        raw = int(raw)
+        with self._lock:
+            n = self._count
+            i = n % self.size
+            if n >= self.size:
+                self._sum -= int(self._raw[i])
+            self._t[i] = self._t[i + self.size] = t
+            self._raw[i] = self._raw[i + self.size] = raw
+            self._sum += raw
+            self._count = n + 1
+            oldest = self._count - self.size
+            minq, maxq = self._minq, self._maxq
+            while minq and minq[-1][1] >= raw:
+                minq.pop()
+            minq.append((n, raw))
+            if minq[0][0] < oldest:
+                minq.popleft()
+            while maxq and maxq[-1][1] <= raw:
+                maxq.pop()
+            maxq.append((n, raw))
+            if maxq[0][0] < oldest:
+                maxq.popleft()
+            peak = self._decayed_peak(t)
+            if peak is None or raw >= peak:
+                self._peak = raw
+                self._peak_t = t
+
+    # ---------- 读取 ----------
+
+    def samples(self, n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """最近 n 个（默认全部）样本 (t, raw)，按时间先后，副本。"""
+        with self._lock:
+            have = min(self._count, self.size)
+            n = have if n is None else max(0, min(n, have))
+            end = self._count % self.size + self.size
+            return self._t[end - n:end].copy(), self._raw[end - n:end].copy()
+
+    def window(self, seconds: float, now: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """最近 seconds 秒内的样本 (t, raw)，副本。"""
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            start, end = self._window_range(now - seconds)
+            return self._t[start:end].copy(), self._raw[start:end].copy()
+
+    def _window_range(self, t_from: float) -> Tuple[int, int]:
+        """时间戳 >= t_from 的样本在缓冲里的 [start, end)。调用方持有 _lock。"""
+        end = self._count % self.size + self.size
+        begin = end - min(self._count, self.size)
+        return begin + int(np.searchsorted(self._t[begin:end], t_from, side="left")), end
+
+    def latest(self) -> Optional[Tuple[float, int]]:
+        with self._lock:
+            if not self._count:
+                return None
+            i = (self._count - 1) % self.size
+            return float(self._t[i]), int(self._raw[i])
+
+    @property
+    def min(self) -> Optional[int]:
+        with self._lock:
+            return self._minq[0][1] if self._minq else None
+
+    @property
+    def max(self) -> Optional[int]:
+        with self._lock:
+            return self._maxq[0][1] if self._maxq else None
+
+    @property
+    def mean(self) -> Optional[float]:
+        with self._lock:
+            n = min(self._count, self.size)
+            return self._sum / n if n else None
+
+    def stats(self, seconds: Optional[float] = None, now: Optional[float] = None) -> Optional[Dict[str, float]]:
+        """
+        {"n", "min", "max", "mean"}（raw）；seconds 为 None 时统计整个缓冲（O(1)），
+        否则只统计最近 seconds 秒。没有样本时返回 None。
+        """
+        if seconds is None:
+            with self._lock:
+                n = min(self._count, self.size)
+                if not n:
+                    return None
+                return {"n": n, "min": self._minq[0][1], "max": self._maxq[0][1], "mean": self._sum / n}
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            start, end = self._window_range(now - seconds)
+            if start == end:
+                return None
+            raw = self._raw[start:end]
+            return {"n": end - start, "min": int(raw.min()), "max": int(raw.max()), "mean": float(raw.mean())}
+
+    def peak(self, now: Optional[float] = None) -> Optional[float]:
+        """峰值保持：最近的峰值保持 hold_s 秒，之后每秒回落 decay_per_s（raw），不低于当前读数。"""
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            peak = self._decayed_peak(now)
+            if peak is None:
+                return None
+            return max(peak, float(self._raw[(self._count - 1) % self.size]))
+
+    def _decayed_peak(self, now: float) -> Optional[float]:
+        if self._peak is None:
+            return None
+        late = now - self._peak_t - self.hold_s
+        if late <= 0:
+            return float(self._peak)
+        return self._peak - self.decay_per_s * late
+
+
+def meter_histories(meter_ids=range(1, 9), size: int = METER_HISTORY_SIZE, **kwargs) -> Dict[str, MeterHistory]:
+    """按 meter 名（METER_MAP）建一组 MeterHistory。"""
+    return {METER_MAP.get(mid, f"METER_{mid}"): MeterHistory(mid, size, **kwargs) for mid in meter_ids}
 
 
 # 模式映射表：CAT字符 <-> 模式名
@@ -286,73 +609,1643 @@ VU_PREAMP_TO_P2 = {
 
 VU_P2_TO_PREAMP = {v: k for k, v in VU_PREAMP_TO_P2.items()}
 
-class FTX1Cat:
+
+# ==========================
+# CAT 应答解析
+# 直接在 CatFrameDemux 交回的 bytes 帧上按固定位置取值，不经过 str 中间结果
+# （帧已去掉前导空白、以 ";" 结尾）；
+# 单条查询、批量查询、主动上报共用，解析失败一律返回 None
+# ==========================
+
+# 按字节值（ord）查表，免去 decode / upper
+_MODE_BY_BYTE = {ord(k): v for k, v in P2_TO_MODE.items()}
+_MODE_BY_BYTE.update({ord(k.lower()): v for k, v in P2_TO_MODE.items()})
+_AGC_BY_BYTE = {ord(k): v for k, v in AGC_P3_TO_NAME.items()}
+_HF50_PREAMP_BY_BYTE = {ord(k): v for k, v in HF50_P2_TO_PREAMP.items()}
+_VU_PREAMP_BY_BYTE = {ord(k): v for k, v in VU_P2_TO_PREAMP.items()}
+_PC_DEV_BY_BYTE = {ord("1"): "FIELD", ord("2"): "SPA1"}
+_DIGIT_0 = ord("0")
+_DIGIT_1 = ord("1")
+_SEMI = ord(";")
+
+
+def _parse_mox(r: bytes) -> Optional[bool]:
+    # MX P1 ;
+    if len(r) == 4 and r[:2] == b"MX" and r[3] == _SEMI:
+        if r[2] == _DIGIT_0:
+            return False
+        if r[2] == _DIGIT_1:
+            return True
+    return None
+
+
+def _parse_freq(r: bytes) -> Optional[int]:
+    # 典型返回: FA014250000;
+    if len(r) == 12 and r[:2] == b"FA" and r[11] == _SEMI:
+        digits = r[2:11]
+        if digits.isdigit():
+            return int(digits)
+    return None
+
+
+def _parse_mode(r: bytes) -> Optional[str]:
+    # MD P1 P2 ;
+    if len(r) == 5 and r[:2] == b"MD" and r[4] == _SEMI:
+        return _MODE_BY_BYTE.get(r[3])
+    return None
+
+
+def _parse_agc(r: bytes, p1: str) -> Optional[str]:
+    # Answer: GT P1 P3 ;
+    if len(r) == 5 and r[:2] == b"GT" and r[4] == _SEMI and r[2] == ord(p1):
+        return _AGC_BY_BYTE.get(r[3])
+    return None
+
+
+def _parse_power_control(r: bytes) -> Tuple[Optional[str], Optional[int]]:
+    # PC P1(1位) P2(3位) ;
+    if len(r) == 7 and r[:2] == b"PC" and r[6] == _SEMI:
+        digits = r[3:6]
+        if digits.isdigit():
+            return _PC_DEV_BY_BYTE.get(r[2]), int(digits)
+    return None, None
+
+
+def _parse_meter(r: bytes, meter_id: int) -> Optional[int]:
+    # RM P1 P2(000-255) P3(000) ;  如 RM5123000;
+    # P1 不匹配视为错误，P3 固定 000
+    if len(r) == 10 and r[2] == _DIGIT_0 + meter_id and r[6:] == b"000;" and r[:2] == b"RM":
+        digits = r[3:6]
+        if digits.isdigit():
+            return int(digits)
+    return None
+
+
+def _parse_notch_enabled(r: bytes) -> Optional[bool]:
+    # 典型返回: BP0001; 索引: B(0) P(1) P1(2) P2(3) P3(4:7) ;(7)
+    if len(r) == 8 and r[:2] == b"BP" and r[3] == _DIGIT_0:
+        p3 = r[4:]
+        if p3 == b"000;":
+            return False
+        if p3 == b"001;":
+            return True
+    return None
+
+
+def _parse_notch_freq(r: bytes) -> Optional[int]:
+    if len(r) == 8 and r[:2] == b"BP" and r[3] == _DIGIT_1 and r[7] == _SEMI:
+        digits = r[4:7]
+        if digits.isdigit():
+            p3 = int(digits)
+            if 1 <= p3 <= 320:
+                return p3 * 10  # 单位 10 Hz
+    return None
+
+
+def _parse_preamp(r: bytes, p1: str) -> Optional[str]:
+    # PA P1 P2 ;  确认返回的 band 和请求一致
+    if len(r) == 5 and r[:2] == b"PA" and r[4] == _SEMI and r[2] == ord(p1):
+        if P1_TO_BAND_CANON.get(p1) == "HF50":
+            return _HF50_PREAMP_BY_BYTE.get(r[3])
+        # VHF/UHF 都是 OFF/ON
+        return _VU_PREAMP_BY_BYTE.get(r[3])
+    return None
+
+
+# ==========================
+# CAT set 命令构造（含参数校验）
+# 同步/异步客户端共用，返回 (set 命令, 回读查询, 可接受的回读)；
+# 可接受的回读为空表示回读应与 set 命令相同
+# ==========================
+
+def _mox_cmd(on: bool) -> Tuple[str, str, Tuple[str, ...]]:
+    p1 = "1" if on else "0"
+    return f"MX{p1}", "MX", ()
+
+
+def _freq_cmd(freq_hz: int) -> Tuple[str, str, Tuple[str, ...]]:
+    # FTX-1 要求 9 位十进制数字
+    if freq_hz < 0 or freq_hz > 999_999_999:
+        raise ValueError(DISPLAY_TEXT["err_freq_range_fmt"].format(freq_hz=freq_hz))
+    return f"FA{freq_hz:09d}", "FA", ()
+
+
+def _mode_cmd(mode_name: str, main: bool = True) -> Tuple[str, str, Tuple[str, ...]]:
+    mode_name = mode_name.upper()
+    if mode_name not in MODE_TO_P2:
+        raise ValueError(DISPLAY_TEXT["err_invalid_mode_fmt"].format(mode_name=mode_name))
+    p1 = "0" if main else "1"
+    return f"MD{p1}{MODE_TO_P2[mode_name]}", f"MD{p1}", ()
+
+
+def _agc_cmd(agc: str, main: bool = True) -> Tuple[str, str, Tuple[str, ...]]:
+    agc_u = agc.strip().upper()
+    if agc_u not in AGC_NAME_TO_P2:
+        raise ValueError(DISPLAY_TEXT["err_invalid_agc_fmt"].format(agc=agc, opts=list(AGC_NAME_TO_P2.keys())))
+    p1 = "0" if main else "1"
+    # AUTO 回读的是 P3=4/5/6（AUTO-FAST/MID/SLOW）
+    accept = tuple(f"GT{p1}{p3}" for p3 in "456") if agc_u == "AUTO" else ()
+    return f"GT{p1}{AGC_NAME_TO_P2[agc_u]}", f"GT{p1}", accept
+
+
+def _power_cmd(watts: int, dev: str) -> Tuple[str, str, Tuple[str, ...]]:
+    """dev 为当前功率控制设备 "FIELD" / "SPA1"（来自 PC 读取）。"""
+    if not isinstance(watts, int):
+        raise TypeError(DISPLAY_TEXT["err_watts_type"])
+    if dev == "FIELD":
+        if watts < 1 or watts > 10:
+            raise ValueError(DISPLAY_TEXT["err_field_power_range"])
+        p1 = "1"  # P2: 001~010
+    else:
+        # SPA1
+        if watts < 5 or watts > 100:
+            raise ValueError(DISPLAY_TEXT["err_spa1_power_range"])
+        p1 = "2"  # P2: 005~100
+    return f"PC{p1}{watts:03d}", "PC", ()
+
+
+def _notch_cmds(
+    main: bool = True, enabled: Optional[bool] = None, freq_hz: Optional[int] = None
+) -> list[Tuple[str, str, Tuple[str, ...]]]:
+    """先 ON/OFF 再频率；两项都先校验，避免只发出一半。"""
+    if enabled is None and freq_hz is None:
+        raise ValueError(DISPLAY_TEXT["err_notch_args"])
+    p1 = "0" if main else "1"
+    cmds = []
+    if enabled is not None:
+        # P2 = 0, P3 = 000/001
+        cmds.append((f"BP{p1}0{1 if enabled else 0:03d}", f"BP{p1}0", ()))
+    if freq_hz is not None:
+        # FTX-1: P3 = 001-320, 单位 10 Hz，即 10~3200 Hz
+        steps = int(round(freq_hz / 10))
+        if steps < 1 or steps > 320:
+            raise ValueError(DISPLAY_TEXT["err_notch_range"])
+        cmds.append((f"BP{p1}1{steps:03d}", f"BP{p1}1", ()))
+    return cmds
+
+
+def _preamp_cmd(band: str, level: str) -> Tuple[str, str, Tuple[str, ...]]:
+    p1 = _band_p1(band)
+    lvl = level.upper()
+    # 根据 band 选择不同的合法值
+    if p1 == "0":
+        # HF/50
+        if lvl not in HF50_PREAMP_TO_P2:
+            raise ValueError(DISPLAY_TEXT["err_hf50_preamp_level_fmt"].format(opts=list(HF50_PREAMP_TO_P2.keys()), level=level))
+        p2 = HF50_PREAMP_TO_P2[lvl]
+    else:
+        # VHF/UHF
+        if lvl not in VU_PREAMP_TO_P2:
+            raise ValueError(DISPLAY_TEXT["err_vu_preamp_level_fmt"].format(opts=list(VU_PREAMP_TO_P2.keys()), level=level))
+        p2 = VU_PREAMP_TO_P2[lvl]
+    # Set: PA P1 P2 ;
+    return f"PA{p1}{p2}", f"PA{p1}", ()
+
+
+def _band_p1(band: str) -> str:
+    # 规范化 band 字符串
+    b = band.upper()
+    if b not in BAND_TO_P1:
+        raise ValueError(DISPLAY_TEXT["err_invalid_band_fmt"].format(band=band))
+    return BAND_TO_P1[b]
+
+
+def _status_cmds(bands: list[str]) -> Tuple[list[str], list[str]]:
+    """read_status 的批量查询命令，返回 (cmds, 各 band 的 P1)。"""
+    band_p1 = [_band_p1(band) for band in bands]
+    return ["FA", "MD0", "GT0", "PC", "BP00", "BP01"] + [f"PA{p1}" for p1 in band_p1], band_p1
+
+
+def _status_from_resps(bands: list[str], band_p1: list[str], resps: list[bytes]) -> Dict[str, object]:
+    fa, md, gt, pc, bp_on, bp_freq = resps[:6]
+    power_dev, power_watts = _parse_power_control(pc)
+    return {
+        "freq_hz": _parse_freq(fa),
+        "mode_name": _parse_mode(md),
+        "agc_name": _parse_agc(gt, "0"),
+        "power_dev": power_dev,
+        "power_watts": power_watts,
+        "notch_enabled": _parse_notch_enabled(bp_on),
+        "notch_freq_hz": _parse_notch_freq(bp_freq),
+        "preamp": {band: _parse_preamp(resp, p1) for band, p1, resp in zip(bands, band_p1, resps[6:])},
+    }
+
+
+# ==========================
+# 帧 -> 状态
+# ==========================
+
+# 帧的 key：前 N 个字符标识是哪个参数（FA / MD0 / BP01 ...），默认 2
+_FRAME_KEY_LEN = {b"MD": 3, b"GT": 3, b"PA": 3, b"RM": 3, b"BP": 4}
+
+# AI (Auto Information) 模式下电台会主动上报的参数，这些可以直接从内存读
+AI_PUSH_KEYS = (b"FA", b"FB", b"MD0", b"MD1")
+
+
+def _frame_key(frame: bytes) -> bytes:
+    return frame[:_FRAME_KEY_LEN.get(frame[:2], 2)]
+
+
+def _frame_status(frame: bytes) -> Dict[str, object]:
+    """
+    把一帧解析成 read_status() 同名字段的部分结果，
+    例如 b"FA014074000;" -> {"freq_hz": 14074000}；不认识的帧返回 {}。
+    """
+    key = _frame_key(frame)
+    r = frame
+    if key == b"FA":
+        return {"freq_hz": _parse_freq(r)}
+    if key == b"MD0":
+        return {"mode_name": _parse_mode(r)}
+    if key == b"GT0":
+        return {"agc_name": _parse_agc(r, "0")}
+    if key == b"PC":
+        dev, watts = _parse_power_control(r)
+        return {"power_dev": dev, "power_watts": watts}
+    if key == b"BP00":
+        return {"notch_enabled": _parse_notch_enabled(r)}
+    if key == b"BP01":
+        return {"notch_freq_hz": _parse_notch_freq(r)}
+    if key == b"MX":
+        return {"mox": _parse_mox(r)}
+    return {}
+
+
+def _split_if_frame(frame: bytes) -> list[bytes]:
+    """
+    IF（综合信息）上报拆成等价的 FA / MD0 帧。
+    格式按 FT-710 系列：IF P1(3) P2(9 频率) P3(5 CLAR) P4 P5 P6(模式) ... ;
+    """
+    if len(frame) < 23 or not frame[5:14].isdigit():
+        return []
+    return [b"FA" + frame[5:14] + b";", b"MD0" + frame[21:22] + b";"]
+
+
+# ==========================
+# 串口链路：后台读线程 + 应答分发
+# ==========================
+
+class CatFrameDemux:
+    """
+    把串口字节流切成 ";" 结尾的帧，按命令前缀把应答交给等待中的请求。
+
+    - 查询的应答以查询命令本身开头（FA; -> FA014250000;  RM1; -> RM1123000;），
+      按写出顺序找第一个前缀匹配的等待者
+    - "?;" 交给最早写出、还没有结果的命令
+    - set 命令没有应答，只在队列里占位，用来把它可能引起的 "?;" 归属正确；
+      后面的应答到了说明它已执行完，占位随之清掉
+    - 匹配不上的帧由 feed() 返回，交给调用方当作主动上报处理
+
+    waiter 只要求有 done() / set_result() / set_exception()，
+    concurrent.futures.Future 和 asyncio.Future 都可以。
+    本类不做 I/O、不加锁，由调用方保证串行调用。
+    """
+
+    MAX_BUFFER = 4096
+
+    def __init__(self, set_hold_s: float = 1.0):
+        self._set_hold_s = set_hold_s
+        self._buf = b""
+        # (key, waiter, 写出时刻)；set 命令的 key 为 None，waiter 可以为 None
+        self._pending: deque = deque()
+
+    def add(self, key: Optional[bytes], waiter=None) -> None:
+        self._pending.append((key, waiter, time.monotonic()))
+
+    def discard(self, waiter) -> None:
+        """移除 waiter 的所有登记项（一组 set 的占位可以共用一个 waiter）。"""
+        if any(entry[1] is waiter for entry in self._pending):
+            kept = [entry for entry in self._pending if entry[1] is not waiter]
+            self._pending.clear()
+            self._pending.extend(kept)
+
+    def fail_all(self, exc: BaseException) -> None:
+        while self._pending:
+            _, waiter, _ = self._pending.popleft()
+            if waiter is not None and not waiter.done():
+                waiter.set_exception(exc)
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """喂入新收到的字节，返回其中未被认领的帧。"""
+        buf = self._buf + data
+        unsolicited = []
+        start = 0
+        while True:
+            end = buf.find(b";", start)
+            if end < 0:
+                break
+            frame = buf[start:end + 1].lstrip()
+            start = end + 1
+            if not self._dispatch(frame):
+                unsolicited.append(frame)
+        buf = buf[start:]
+        # 没有 ";" 的垃圾数据不能无限累积
+        self._buf = buf[-self.MAX_BUFFER:]
+        return unsolicited
+
+    def _dispatch(self, frame: bytes) -> bool:
+        pending = self._pending
+        now = time.monotonic()
+        while pending and pending[0][0] is None and now - pending[0][2] > self._set_hold_s:
+            pending.popleft()
+
+        if frame == b"?;":
+            if not pending:
+                return False
+            _, waiter, _ = pending.popleft()
+            if waiter is not None and not waiter.done():
+                waiter.set_result(frame)
+            return True
+
+        for i, (key, waiter, _) in enumerate(pending):
+            if key is not None and frame.startswith(key):
+                break
+        else:
+            return False
+
+        # 电台按顺序执行：写在它前面的 set 都已处理完，占位一并清掉
+        kept = [e for j, e in enumerate(pending) if j > i or (j < i and e[0] is not None)]
+        pending.clear()
+        pending.extend(kept)
+        if not waiter.done():
+            waiter.set_result(frame)
+        return True
+
+
+# ==========================
+# 串口链路统计
+# ==========================
+
+def _percentile(sorted_vals: list[float], q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    idx = min(len(sorted_vals) - 1, max(0, int(round(q * (len(sorted_vals) - 1)))))
+    return sorted_vals[idx]
+
+
+def _latency_summary(samples) -> Dict[str, float]:
+    vals = sorted(samples)
+    return {
+        "p50_ms": _percentile(vals, 0.50) * 1000.0,
+        "p95_ms": _percentile(vals, 0.95) * 1000.0,
+        "p99_ms": _percentile(vals, 0.99) * 1000.0,
+        "max_ms": (vals[-1] if vals else 0.0) * 1000.0,
+    }
+
+
+class CatMetrics:
+    """
+    CAT 口的运行统计，由 CatLink 记录，线程安全。
+
+    - 按命令前缀（帧 key，如 FA / MD0 / RM5）：发出次数、错误次数
+      （"?;"、超时、串口异常）、解析失败次数、往返时间 p50/p95/p99
+    - 链路锁的等待时间
+    - 收发字节数，以及占配置波特率的比例（8N1，每字节 10 bit）
+
+    往返时间和锁等待各保留最近 SAMPLES 个样本。
+    """
+
+    SAMPLES = 1024
+
+    def __init__(self, baudrate: int = 0):
+        self.baudrate = baudrate
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._t0 = time.monotonic()
+            self._tx_bytes = 0
+            self._rx_bytes = 0
+            self._lock_waits = deque(maxlen=self.SAMPLES)
+            self._lock_wait_total = 0.0
+            self._cmds: Dict[bytes, Dict[str, object]] = {}
+
+    def _entry(self, key: bytes) -> Dict[str, object]:
+        entry = self._cmds.get(key)
+        if entry is None:
+            entry = self._cmds[key] = {
+                "count": 0,
+                "errors": 0,
+                "parse_failures": 0,
+                "rtt": deque(maxlen=self.SAMPLES),
+            }
+        return entry
+
+    def record_write(self, keys: list[bytes], nbytes: int, lock_wait: float) -> None:
+        with self._lock:
+            self._tx_bytes += nbytes
+            self._lock_waits.append(lock_wait)
+            self._lock_wait_total += lock_wait
+            for key in keys:
+                self._entry(key)["count"] += 1
+
+    def record_read(self, nbytes: int) -> None:
+        with self._lock:
+            self._rx_bytes += nbytes
+
+    def record_reply(self, key: bytes, rtt: Optional[float]) -> None:
+        """rtt 为 None 表示没有拿到有效应答。"""
+        with self._lock:
+            entry = self._entry(key)
+            if rtt is None:
+                entry["errors"] += 1
+            else:
+                entry["rtt"].append(rtt)
+
+    def record_parse_failure(self, key: bytes) -> None:
+        with self._lock:
+            self._entry(key)["parse_failures"] += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            elapsed = max(time.monotonic() - self._t0, 1e-9)
+            capacity = self.baudrate / 10.0 * elapsed if self.baudrate else 0.0
+            commands = {}
+            for key, entry in sorted(self._cmds.items()):
+                commands[key.decode(errors="ignore")] = {
+                    "count": entry["count"],
+                    "errors": entry["errors"],
+                    "parse_failures": entry["parse_failures"],
+                    **_latency_summary(entry["rtt"]),
+                }
+            lock_wait = {
+                "count": len(self._lock_waits),
+                "total_ms": self._lock_wait_total * 1000.0,
+                **_latency_summary(self._lock_waits),
+            }
+            return {
+                "elapsed_s": elapsed,
+                "baudrate": self.baudrate,
+                "tx_bytes": self._tx_bytes,
+                "rx_bytes": self._rx_bytes,
+                "tx_utilization": self._tx_bytes / capacity if capacity else 0.0,
+                "rx_utilization": self._rx_bytes / capacity if capacity else 0.0,
+                "lock_wait": lock_wait,
+                "commands": commands,
+            }
+
+
+def _cmd_keys(frames: list[str]) -> list[bytes]:
+    return [_frame_key(frame[:-1].encode("ascii")) for frame in frames]
+
+
+class CatLink:
+    """
+    CAT 串口链路。
+
+    后台读线程持续读串口并交给 CatFrameDemux 分发，每个请求拿到自己的 Future。
+    请求方只在写出的那一下持锁，随后各自等待，互不阻塞：
+    表头线程、整机读取线程、rigctl 客户端可以同时有请求在途。
+    """
+
+    def __init__(self, ser, timeout: float = 1.0, on_unsolicited=None, on_lost=None, metrics: Optional[CatMetrics] = None):
+        self._ser = ser
+        self._timeout = timeout
+        self.on_unsolicited = on_unsolicited
+        # on_lost(exc)：读串口出错（USB 断开等）时在读线程里调用，主动 close() 不会触发
+        self.on_lost = on_lost
+        self.metrics = metrics if metrics is not None else CatMetrics(getattr(ser, "baudrate", 0) or 0)
+        # 保护 demux，并保证登记顺序与写出顺序一致
+        self._lock = threading.Lock()
+        self._demux = CatFrameDemux(set_hold_s=timeout)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._reader, name="ftx1-cat-reader", daemon=True)
+        self._thread.start()
+
+    def submit(self, cmds: list[str]) -> list[Future]:
+        """写出一组查询，返回与之一一对应的 Future（结果为应答帧 bytes）。"""
+        frames = [c if c.endswith(";") else c + ";" for c in cmds]
+        data = "".join(frames).encode("ascii")
+        keys = _cmd_keys(frames)
+        futs = [Future() for _ in frames]
+        t_wait = time.perf_counter()
+        with self._lock:
+            t_sent = time.perf_counter()
+            for frame, fut in zip(frames, futs):
+                self._demux.add(frame[:-1].encode("ascii"), fut)
+            try:
+                self._ser.write(data)
+            except Exception:
+                for fut in futs:
+                    self._demux.discard(fut)
+                raise
+        self.metrics.record_write(keys, len(data), t_sent - t_wait)
+        for key, fut in zip(keys, futs):
+            fut.add_done_callback(lambda fut, key=key: self._on_done(fut, key, t_sent))
+        return futs
+
+    def _on_done(self, fut: Future, key: bytes, t_sent: float) -> None:
+        ok = not fut.cancelled() and fut.exception() is None and fut.result() not in (b"", b"?;")
+        self.metrics.record_reply(key, time.perf_counter() - t_sent if ok else None)
+
+    def query(self, cmds: list[str], timeout: Optional[float] = None) -> list[bytes]:
+        """
+        写出一组查询并等待全部应答。
+        返回与 cmds 一一对应的应答帧；超时未收到的为 b""。
+        """
+        futs = self.submit(cmds)
+        deadline = time.monotonic() + (self._timeout if timeout is None else timeout)
+        out = []
+        for fut in futs:
+            try:
+                out.append(fut.result(max(0.0, deadline - time.monotonic())))
+            except FutureTimeout:
+                with self._lock:
+                    self._demux.discard(fut)
+                out.append(b"")
+        return out
+
+    def write(self, cmds: list[str]) -> None:
+        """写出一组 set 命令，不等应答。"""
+        frames = [c if c.endswith(";") else c + ";" for c in cmds]
+        data = "".join(frames).encode("ascii")
+        t_wait = time.perf_counter()
+        with self._lock:
+            t_locked = time.perf_counter()
+            for _ in frames:
+                self._demux.add(None)
+            self._ser.write(data)
+            self._ser.flush()
+        self.metrics.record_write(_cmd_keys(frames), len(data), t_locked - t_wait)
+
+    def cancel(self, fut: Future) -> None:
+        """放弃一个在途请求：从等待队列移除，Future 以 b"" 结束（等同超时）。"""
+        with self._lock:
+            self._demux.discard(fut)
+        if not fut.done():
+            fut.set_result(b"")
+
+    def close(self):
+        self._stop.set()
+        try:
+            self._ser.cancel_read()
+        except Exception:
+            pass
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=max(self._timeout, 0.5) + 0.5)
+        with self._lock:
+            self._demux.fail_all(serial.SerialException("port closed"))
+
+    def _reader(self):
+        while not self._stop.is_set():
+            try:
+                data = self._ser.read(self._ser.in_waiting or 1)
+            except Exception as e:
+                # 串口断开/关闭：让所有在途请求立即失败，而不是等超时
+                if self.on_lost is not None and not self._stop.is_set():
+                    try:
+                        self.on_lost(e)
+                    except Exception:
+                        pass
+                with self._lock:
+                    self._demux.fail_all(e)
+                return
+            if not data:
+                continue
+            self.metrics.record_read(len(data))
+            with self._lock:
+                unsolicited = self._demux.feed(data)
+            if unsolicited and self.on_unsolicited is not None:
+                for frame in unsolicited:
+                    try:
+                        self.on_unsolicited(frame)
+                    except Exception:
+                        pass
+
+
+# ==========================
+# 优先级调度
+# ==========================
+
+# 优先级，数值越小越先发
+PRIO_TX = 0          # MOX 等发射控制
+PRIO_SET = 1         # 用户操作的 set
+PRIO_READ = 2        # 普通读取（rigctl 等）
+PRIO_METER = 3       # 表头轮询
+PRIO_FULL_READ = 4   # 整机读取
+
+PRIORITY_NAMES = {
+    PRIO_TX: "tx",
+    PRIO_SET: "set",
+    PRIO_READ: "read",
+    PRIO_METER: "meter",
+    PRIO_FULL_READ: "full_read",
+}
+
+# 各优先级排队的最长时间（秒），超过就不再发出、按超时处理；表头数据过时就没有意义
+QUEUE_DEADLINE_S = {
+    PRIO_METER: 1.0,
+}
+
+# 断线重连：重开串口的退避间隔（起始, 上限），秒
+RECONNECT_BACKOFF_S = (0.2, 5.0)
+# 断线期间命令在队列里最多保留多久，超过仍未恢复就以 SerialException 结束
+RECONNECT_HOLD_S = 10.0
+
+# 当前线程/协程上下文里的优先级覆盖，见 FTX1Cat.priority()
+_CAT_PRIORITY: ContextVar[Optional[int]] = ContextVar("ftx1_cat_priority", default=None)
+
+
+class CatScheduler:
+    """
+    串口命令调度器，位于 CatLink 之前。
+
+    - 所有命令按优先级排队，同优先级先进先出，由一个派发线程逐条写出
+    - 在途（已写出、未收到应答）的查询不超过 depth 条：
+      整轮表头扫描或整机读取被拆成单条命令，PTT/按键最多等 depth 条应答就能插队
+    - 带 deadline 的命令排队过期后直接丢弃，结果为 b""（等同超时）
+    - 在途超过 timeout 没有应答的查询由调度器放弃，结果为 b""
+    - 记录每个优先级的排队延迟，见 stats()
+    - 链路断开时 pause()：命令留在队列里（在途的重新排队），resume(link) 后继续发出；
+      暂停超过 hold_s 仍未恢复的命令以 SerialException 结束
+    """
+
+    def __init__(self, link: CatLink, timeout: float = 1.0, depth: int = 4, hold_s: float = 10.0, on_link_error=None):
+        self._link = link
+        self._timeout = timeout
+        self._depth = max(1, depth)
+        self._hold_s = hold_s
+        # on_link_error(exc)：写串口出错时调用（调度器已自动暂停）
+        self.on_link_error = on_link_error
+        self._paused = False
+        self._cond = threading.Condition()
+        self._heap: list = []
+        self._seq = itertools.count()
+        # 在途查询：link Future -> (写出时刻, 队列项)
+        self._inflight: Dict[Future, Tuple[float, tuple]] = {}
+        self._waits = {prio: deque(maxlen=1024) for prio in PRIORITY_NAMES}
+        self._stop = False
+        self._thread = threading.Thread(target=self._run, name="ftx1-cat-scheduler", daemon=True)
+        self._thread.start()
+
+    def submit(self, cmds: list[str], prio: int, expect_reply: bool = True, deadline: Optional[float] = None) -> list[Future]:
+        """
+        排队一组命令，返回一一对应的 Future。
+        查询的结果为应答帧 bytes；set（expect_reply=False）在写出后以 b"" 结束。
+        set 的某一项可以是一组命令 (tuple)，整组在同一次写入中连续发出，中间不会插入别的命令。
+        deadline 为 time.monotonic() 时刻。
+        """
+        now = time.monotonic()
+        futs = [Future() for _ in cmds]
+        with self._cond:
+            if self._stop:
+                for fut in futs:
+                    fut.set_exception(serial.SerialException("port closed"))
+                return futs
+            for cmd, fut in zip(cmds, futs):
+                heapq.heappush(self._heap, (prio, next(self._seq), now, deadline, cmd, expect_reply, fut))
+            self._cond.notify()
+        return futs
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """各优先级的排队延迟：count / p50_ms / p95_ms / max_ms（最近 1024 条）。"""
+        out = {}
+        with self._cond:
+            snapshot = {prio: sorted(waits) for prio, waits in self._waits.items()}
+        for prio, waits in snapshot.items():
+            out[PRIORITY_NAMES[prio]] = {
+                "count": len(waits),
+                "p50_ms": _percentile(waits, 0.50) * 1000.0,
+                "p95_ms": _percentile(waits, 0.95) * 1000.0,
+                "max_ms": (waits[-1] if waits else 0.0) * 1000.0,
+            }
+        return out
+
+    def pause(self) -> None:
+        with self._cond:
+            self._paused = True
+
+    def resume(self, link: CatLink) -> None:
+        """换上新的链路继续派发。"""
+        with self._cond:
+            self._link = link
+            self._paused = False
+            self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            self._stop = True
+            pending = [item[-1] for item in self._heap]
+            self._heap.clear()
+            self._cond.notify()
+        for fut in pending:
+            if not fut.done():
+                fut.set_exception(serial.SerialException("port closed"))
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+
+    def _run(self):
+        while True:
+            item = None
+            with self._cond:
+                if self._stop:
+                    return
+                now = time.monotonic()
+                if self._paused:
+                    self._fail_held(now)
+                    self._cond.wait(0.1)
+                    continue
+                expired = [lf for lf, (t, _) in self._inflight.items() if now - t > self._timeout]
+                if self._heap and len(self._inflight) < self._depth:
+                    item = heapq.heappop(self._heap)
+                elif not expired:
+                    self._cond.wait(self._wait_time(now))
+            # cancel 会回调 _on_reply，不能在持有 _cond 时调用（读线程持 link 锁时也会回调）
+            for lf in expired:
+                self._link.cancel(lf)
+            if item is not None:
+                self._dispatch(item)
+
+    def _wait_time(self, now: float) -> Optional[float]:
+        if not self._inflight:
+            return None
+        return max(0.0, min(t for t, _ in self._inflight.values()) + self._timeout - now) + 0.001
+
+    def _fail_held(self, now: float) -> None:
+        """暂停期间：排队超过 hold_s 或过了 deadline 的命令结束掉。调用方持有 _cond。"""
+        kept = []
+        for item in self._heap:
+            _, _, t_submit, deadline, _, _, fut = item
+            if deadline is not None and now > deadline:
+                fut.set_result(b"")
+            elif now - t_submit > self._hold_s:
+                fut.set_exception(serial.SerialException("port lost"))
+            else:
+                kept.append(item)
+        if len(kept) != len(self._heap):
+            heapq.heapify(kept)
+            self._heap = kept
+
+    def _requeue(self, item) -> None:
+        with self._cond:
+            self._paused = True
+            heapq.heappush(self._heap, item)
+
+    def _dispatch(self, item) -> None:
+        prio, _, t_submit, deadline, cmd, expect_reply, fut = item
+        now = time.monotonic()
+        if deadline is not None and now > deadline:
+            fut.set_result(b"")
+            return
+        with self._cond:
+            self._waits[prio].append(now - t_submit)
+            link = self._link
+        try:
+            if not expect_reply:
+                link.write(list(cmd) if isinstance(cmd, tuple) else [cmd])
+                fut.set_result(b"")
+                return
+            lf = link.submit([cmd])[0]
+        except Exception as e:
+            if self.on_link_error is None:
+                fut.set_exception(e)
+                return
+            # 串口写失败：放回队列等链路恢复
+            self._requeue(item)
+            self.on_link_error(e)
+            return
+        with self._cond:
+            self._inflight[lf] = (now, item)
+        lf.add_done_callback(lambda lf: self._on_reply(lf))
+
+    def _on_reply(self, lf: Future) -> None:
+        with self._cond:
+            _, item = self._inflight.pop(lf, (None, None))
+            paused = self._paused
+            self._cond.notify()
+        if item is None:
+            return
+        fut = item[-1]
+        exc = lf.exception()
+        if exc is not None and paused and not self._stop:
+            # 链路断开时在途的查询：重新排队，恢复后再发
+            self._requeue(item)
+        elif exc is not None:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(lf.result())
+
+
+# ==========================
+# 参数缓存
+# ==========================
+
+# 各参数默认的最长缓存时间（秒），按帧 key；不在表里的（如 RM 表头）不从缓存读
+DEFAULT_STATE_TTL = {
+    "FA": 0.5,
+    "FB": 0.5,
+    "MD0": 1.0,
+    "MD1": 1.0,
+    "GT0": 2.0,
+    "GT1": 2.0,
+    "PA0": 2.0,
+    "PA1": 2.0,
+    "PA2": 2.0,
+    "PC": 2.0,
+    "BP00": 2.0,
+    "BP01": 2.0,
+    "BP10": 2.0,
+    "BP11": 2.0,
+    "MX": 0.2,
+}
+
+
+class RigStateCache:
+    """
+    电台参数缓存，GUI 和 rigctl 共用同一个 FTX1Cat 实例上的这一份。
+
+    每个参数（帧 key，如 FA / MD0 / BP01）保存最近一帧、收到的时刻和是否来自电台；
+    应答、主动上报、刚发出的 set 都会写进来。set 不回应答，被拒绝时也只回 "?;"，
+    由 set 推出的值只按 TTL 使用，见 reported()。
+    get() 在有效期内直接返回缓存的帧，期间不产生任何串口读写。
+    """
+
+    def __init__(self, ttl: Optional[Dict[str, float]] = None):
+        self._lock = threading.Lock()
+        self._frames: Dict[bytes, Tuple[float, bytes, bool]] = {}
+        self._ttl: Dict[bytes, float] = {}
+        self.hits = 0
+        self.misses = 0
+        for key, seconds in {**DEFAULT_STATE_TTL, **(ttl or {})}.items():
+            self.set_ttl(key, seconds)
+
+    def set_ttl(self, key: str, seconds: float) -> None:
+        """设置某个参数的最长缓存时间，0 表示总是实际读取。"""
+        self._ttl[key.encode("ascii")] = float(seconds)
+
+    def put(self, frame: bytes, reported: bool = True) -> None:
+        """reported=False 表示帧由刚发出的 set 推出，电台没有确认过。"""
+        if frame.endswith(b";") and len(frame) > 3:
+            with self._lock:
+                self._frames[_frame_key(frame)] = (time.monotonic(), frame, reported)
+
+    def reported(self, key: bytes) -> bool:
+        """缓存的帧是否来自电台（应答 / 主动上报）。"""
+        entry = self._frames.get(key)
+        return entry is not None and entry[2]
+
+    def get(self, key: bytes, max_age: Optional[float] = None) -> Optional[bytes]:
+        """
+        在有效期内返回缓存的帧，否则 None。
+        max_age=None 按该参数的 TTL，0 表示不用缓存。
+        """
+        if max_age is None:
+            max_age = self._ttl.get(key, 0.0)
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is not None and max_age > 0 and time.monotonic() - entry[0] <= max_age:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def peek(self, key: bytes) -> Optional[bytes]:
+        """不论新旧返回最近一帧，不计入命中统计。"""
+        entry = self._frames.get(key)
+        return entry[1] if entry is not None else None
+
+    def invalidate(self, key: Optional[bytes] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._frames.clear()
+            else:
+                self._frames.pop(key, None)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+class _CatState:
+    """
+    同步 / 异步客户端共用的内存状态：
+    参数缓存 (RigStateCache)、AI 模式开关、主动上报监听者。
+    """
+
+    def _init_state(self, state_ttl: Optional[Dict[str, float]] = None) -> None:
+        self.state = RigStateCache(state_ttl)
+        # 主动上报的监听者：fn(update: dict)，update 字段同 read_status()
+        self._listeners = []
+        self.auto_info = False
+        # 电台能力：连接时探测一次，之后只在 PC 应答的 P1 变化时更新
+        # power_dev: "FIELD" / "SPA1"，未知为 None
+        self.capabilities: Dict[str, Optional[str]] = {"power_dev": None}
+        # 通过 CAT 设置、之后电台还没有报告过（应答 / 主动上报）的参数：帧 key -> set 命令
+        self._last_sets: Dict[bytes, str] = {}
+
+    def cache_stats(self) -> Dict[str, float]:
+        """参数缓存的命中/未命中计数。"""
+        return self.state.stats()
+
+    def _checked(self, frame: bytes, value):
+        """收到了应答却解析不出值时计入 metrics 的解析失败次数，原样返回 value。"""
+        if value is None and frame not in (b"", b"?;"):
+            self.metrics.record_parse_failure(_frame_key(frame))
+        return value
+
+    def add_listener(self, fn) -> None:
+        """
+        注册主动上报监听者 fn(update: dict)，在读线程里调用，应尽快返回。
+        串口断开/恢复时另外收到 {"link_up": False} / {"link_up": True, "recovery_s": 秒}。
+        """
+        self._listeners.append(fn)
+
+    def remove_listener(self, fn) -> None:
+        try:
+            self._listeners.remove(fn)
+        except ValueError:
+            pass
+
+    def _remember(self, frame: bytes, reported: bool = True) -> None:
+        """
+        把一帧记入缓存。reported 表示帧来自电台（应答 / 主动上报），
+        此时该参数以电台为准，不再算作未确认的 set。
+        """
+        self.state.put(frame, reported)
+        if reported and frame.endswith(b";") and len(frame) > 3:
+            self._last_sets.pop(_frame_key(frame), None)
+        if frame[:2] == b"PC":
+            dev, _ = _parse_power_control(frame)
+            if dev is not None and dev != self.capabilities["power_dev"]:
+                self.capabilities["power_dev"] = dev
+
+    def _cached_frame(self, key: bytes, max_age: Optional[float] = None) -> Optional[bytes]:
+        """
+        取缓存的帧，过期返回 None。
+        AI 模式下电台会主动上报的参数不会过期，但只限电台报告过的值：
+        由 set 推出的值可能被电台拒绝（"?;"），仍按 TTL 过期。
+        """
+        if max_age is None and self.auto_info and key in AI_PUSH_KEYS and self.state.reported(key):
+            max_age = math.inf
+        return self.state.get(key, max_age)
+
+    def _on_unsolicited(self, frame: bytes) -> None:
+        frames = _split_if_frame(frame) if frame.startswith(b"IF") else [frame]
+        update: Dict[str, object] = {}
+        for f in frames:
+            self._remember(f)
+            update.update(_frame_status(f))
+        if update:
+            self._notify(update)
+
+    def _notify(self, update: Dict[str, object]) -> None:
+        for fn in list(self._listeners):
+            try:
+                fn(update)
+            except Exception:
+                pass
+
+    def _note_set(self, cmd: str, accept: Tuple[str, ...]) -> None:
+        if not accept:
+            # set 帧和应答帧格式相同，直接当作该参数的最新值
+            self._remember(cmd.encode("ascii") + b";", reported=False)
+        else:
+            # 回读不确定（如 AGC AUTO），丢掉旧值
+            self.state.invalidate(_frame_key(cmd.encode("ascii")))
+
+
+# ==========================
+# 波特率探测
+# ==========================
+
+# FTX-1 菜单 CAT RATE 可选的速率，从快到慢
+BAUD_CANDIDATES = (115200, 38400, 19200, 9600, 4800)
+
+# 每个串口探测出的波特率，下次连接先试这个
+BAUD_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".ftx1ctl_baud.json")
+
+
+def _load_baud_cache(path: str) -> Dict[str, int]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return {str(k): int(v) for k, v in data.items()}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def remembered_baud(port: str, path: str = BAUD_CACHE_PATH) -> Optional[int]:
+    return _load_baud_cache(path).get(port)
+
+
+def remember_baud(port: str, baudrate: int, path: str = BAUD_CACHE_PATH) -> None:
+    data = _load_baud_cache(path)
+    data[port] = int(baudrate)
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+    except OSError:
+        pass
+
+
+def measure_baud(port: str, baudrate: int, n: int = 10, timeout: float = 0.2) -> float:
+    """
+    以 baudrate 打开 port，连续 n 次 ID 查询（最便宜的一问一答），
+    全部得到正确应答时返回达到的 命令数/秒，否则返回 0.0。
+    """
+    try:
+        ser = serial.serial_for_url(port, baudrate=baudrate, bytesize=8, parity="N", stopbits=1, timeout=timeout)
+    except (serial.SerialException, OSError, ValueError):
+        return 0.0
+    try:
+        # 先发一个 ";" 结束电台里可能残留的半条（上一个速率下的乱码）
+        ser.write(b";")
+        ser.flush()
+        time.sleep(timeout / 2)
+        ser.reset_input_buffer()
+        t0 = time.perf_counter()
+        for _ in range(n):
+            ser.write(b"ID;")
+            resp = ser.read_until(b";")
+            # 应答: ID P1(4 位机型号) ;
+            if not (len(resp) == 7 and resp.startswith(b"ID") and resp[2:6].isdigit()):
+                return 0.0
+        return n / (time.perf_counter() - t0)
+    except (serial.SerialException, OSError):
+        return 0.0
+    finally:
+        ser.close()
+
+
+def probe_baud(
+    port: str,
+    candidates=BAUD_CANDIDATES,
+    n: int = 10,
+    timeout: float = 0.2,
+    path: Optional[str] = BAUD_CACHE_PATH,
+) -> Tuple[Optional[int], Dict[int, float]]:
+    """
+    逐个速率测 measure_baud()，选实测 命令数/秒 最高的可靠速率，
+    找到时记入 path（None 则不记）。
+    注意 CAT 速率由电台菜单决定，这里只能找出当前能通的（以及其中最快的）速率。
+
+    返回 (baudrate 或 None, {baudrate: 命令数/秒})
+    """
+    results = {int(baud): measure_baud(port, int(baud), n=n, timeout=timeout) for baud in candidates}
+    working = {baud: rate for baud, rate in results.items() if rate > 0}
+    if not working:
+        return None, results
+    # 实测差距在 5% 以内视为一样快（USB 虚拟串口常常如此），取标称更高的速率
+    top = max(working.values())
+    best = max(baud for baud, rate in working.items() if rate >= top * 0.95)
+    if path:
+        remember_baud(port, best, path)
+    return best, results
+
+
+def auto_baud(port: str, candidates=BAUD_CANDIDATES, path: str = BAUD_CACHE_PATH) -> Optional[int]:
+    """
+    连接用的波特率：上次记住的速率还能用就直接用（只需 2 次查询），
+    否则完整探测一遍。都不通返回 None。
     """
-    FTX-1 CAT 封装，内部带 RLock，保证整个一次操作是串行的。
+    cached = remembered_baud(port, path)
+    if cached is not None and measure_baud(port, cached, n=2) > 0:
+        return cached
+    best, _ = probe_baud(port, candidates, path=path)
+    return best
 
-    所有对串口的访问都必须通过 public 方法，这些方法都会:
-    - with self._lock:   # 严格串行化
-    - 使用同一个 serial.Serial 对象
+
+# ==========================
+# 多参数事务
+# ==========================
+
+class CatTransaction:
+    """
+    一次性设置多个参数（换波段常用：频率 + 模式 + AGC + PRE-AMP）：
+
+        with cat.transaction(verify=True) as tx:
+            tx.set_freq(14_074_000)
+            tx.set_mode("DATA-U")
+            tx.set_agc("FAST")
+            tx.set_preamp("HF", "AMP1")
+
+    每个 set_xxx 在调用时就完成参数校验，出错直接抛出，什么都不会发出；
+    退出 with（或 commit()）时所有 set 命令在同一次写入中连续发出，
+    表头轮询等其他命令不会插在中间。verify 时再把所有回读一次批量查询，
+    整个事务约一个往返。
     """
 
-    def __init__(self, port: str = "COM11", baudrate: int = 38400, port2: str = "COM12", baudrate2: int = 38400, timeout: float = 1.0):
+    def __init__(self, cat: "FTX1Cat", verify: Optional[bool] = None, prio: int = PRIO_SET):
+        self._cat = cat
+        self._verify = cat.verify_sets if verify is None else verify
+        self._prio = prio
+        self._cmds: list[Tuple[str, str, Tuple[str, ...]]] = []
+        self.committed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        return False
+
+    def _add(self, cmd: Tuple[str, str, Tuple[str, ...]]) -> "CatTransaction":
+        if self.committed:
+            raise RuntimeError(DISPLAY_TEXT["err_transaction_committed"])
+        self._cmds.append(cmd)
+        return self
+
+    def set_freq(self, freq_hz: int) -> "CatTransaction":
+        return self._add(_freq_cmd(freq_hz))
+
+    def set_mode(self, mode_name: str, main: bool = True) -> "CatTransaction":
+        return self._add(_mode_cmd(mode_name, main))
+
+    def set_agc(self, agc: str, main: bool = True) -> "CatTransaction":
+        return self._add(_agc_cmd(agc, main))
+
+    def set_preamp(self, band: str, level: str) -> "CatTransaction":
+        return self._add(_preamp_cmd(band, level))
+
+    def set_power_watts(self, watts: int) -> "CatTransaction":
+        dev = self._cat.capabilities["power_dev"]
+        if dev is None:
+            dev, _, raw = self._cat.get_power_control(max_age=0)
+            if dev is None:
+                raise RuntimeError(DISPLAY_TEXT["err_parse_pc_fmt"].format(raw=raw))
+        return self._add(_power_cmd(watts, dev))
+
+    def set_manual_notch(self, main: bool = True, enabled: Optional[bool] = None, freq_hz: Optional[int] = None) -> "CatTransaction":
+        for cmd in _notch_cmds(main, enabled, freq_hz):
+            self._add(cmd)
+        return self
+
+    def commit(self) -> Dict[str, str]:
+        """
+        发出全部命令。返回 {set 命令: 回读应答}，不校验时为空 dict。
+        校验不符时抛 RuntimeError（列出所有不符的项）。
+        """
+        if self.committed:
+            raise RuntimeError(DISPLAY_TEXT["err_transaction_committed"])
+        self.committed = True
+        if not self._cmds:
+            return {}
+        return self._cat._commit_sets(self._cmds, self._verify, self._prio)
+
+
+class FTX1Cat(_CatState):
+    """
+    FTX-1 CAT 封装。
+
+    所有对串口的访问都必须通过 public 方法，这些方法最终都走
+    self._sched (CatScheduler) -> self._link (CatLink):
+    - 命令按优先级排队，MOX > 用户 set > 普通读取 > 表头 > 整机读取，
+      调用方可以用 with cat.priority(PRIO_xxx) 覆盖默认优先级
+    - 写出由链路串行化，应答由后台读线程按命令前缀分发
+    - 多个线程可以同时有请求在途，互不阻塞；需要整体原子性的一组 set
+      作为调度器里的一项一次写出（见 _commit_sets），不另加锁
+    """
+
+    def __init__(
+        self,
+        port: str = "COM11",
+        baudrate: int = 38400,
+        port2: str = "COM12",
+        baudrate2: int = 38400,
+        timeout: float = 1.0,
+        verify_sets: bool = False,
+        auto_info: bool = False,
+        state_ttl: Optional[Dict[str, float]] = None,
+        serial_factory=None,
+    ):
         self._port = port
         self._baudrate = baudrate
         self._port2 = port2
         self._baudrate2 = baudrate2
         self._timeout = timeout
+        # serial_factory(port, **kwargs)：打开 CAT 口用的函数，默认 serial.serial_for_url；
+        # 断线重连时同样用它重开。录制/回放见 ftx1capture
+        self._serial_factory = serial_factory or serial.serial_for_url
+
+        # set 命令默认只写不读；为 True 时每次 set 后回读校验
+        self.verify_sets = verify_sets
+
+        self._ser, self._ser2 = self._open_ports()
+
+        # state_ttl: 覆盖 DEFAULT_STATE_TTL 中的缓存时间，如 {"FA": 0.2}
+        self._init_state(state_ttl)
+
+        self._closing = False
+        self._reconnect_thread: Optional[threading.Thread] = None
+        # 只保护 _closing / _reconnect_thread 和换链路，持有期间不等待调度器或串口应答：
+        # _on_link_lost 会在调度线程和读线程里调用
+        self._reconnect_lock = threading.Lock()
+        # 上次恢复的时刻和当时的退避间隔，跨多次断线保留
+        self._recovered_at: Optional[float] = None
+        self._reconnect_delay = 0.0
+        # diverged：上次恢复时读回的值与断线前未确认的 set 不同的参数（以电台为准）
+        self.reconnect_stats: Dict[str, object] = {"count": 0, "last_recovery_s": None, "last_error": None, "diverged": []}
+
+        self.metrics = CatMetrics(self._baudrate)
+        self._link = self._new_link(self._ser)
+        self._sched = CatScheduler(
+            self._link,
+            timeout=self._timeout,
+            hold_s=RECONNECT_HOLD_S,
+            on_link_error=self._on_link_lost,
+        )
+
+        self.probe_capabilities()
+        if auto_info:
+            self.set_auto_info(True)
 
-        # 使用 RLock，方便方法内部再调用其他需要锁的方法
-        self._lock = threading.RLock()
+    # ---------- 基础方法 ----------
 
-        self._ser = serial.Serial(
-            port=self._port,
+    def _open_ports(self):
+        # serial_for_url 对普通设备名 (COM11, /dev/ttyUSB0) 等同 serial.Serial，
+        # 另外也支持 pyserial 的 loop:// socket:// spy:// 等 URL
+        ser = self._serial_factory(
+            self._port,
             baudrate=self._baudrate,
             bytesize=8,
             parity="N",
             stopbits=1,
             timeout=self._timeout,
         )
-        self._ser2 = serial.Serial(
-            port=self._port2,
-            baudrate=self._baudrate2,
-            bytesize=8,
-            parity="N",
-            stopbits=1,
+        try:
+            ser2 = serial.serial_for_url(
+                self._port2,
+                baudrate=self._baudrate2,
+                bytesize=8,
+                parity="N",
+                stopbits=1,
+                timeout=self._timeout,
+                rtscts=False,
+                dsrdtr=False,
+            )
+        except Exception:
+            ser.close()
+            raise
+        ser.reset_input_buffer()
+        ser.reset_output_buffer()
+        ser2.rts = False
+        return ser, ser2
+
+    def _new_link(self, ser) -> CatLink:
+        return CatLink(
+            ser,
             timeout=self._timeout,
-            rtscts=False,
-            dsrdtr=False,
+            on_unsolicited=self._on_unsolicited,
+            on_lost=self._on_link_lost,
+            metrics=self.metrics,
         )
-        self._ser.reset_input_buffer()
-        self._ser.reset_output_buffer()
-        self._ser2.rts = False
 
-    # ---------- 基础方法 ----------
+    # ---------- 断线重连 ----------
+
+    def _on_link_lost(self, exc: BaseException) -> None:
+        """
+        读/写串口出错时调用（读线程或调度线程）。
+        暂停调度器，命令留在队列里；后台线程按退避间隔重开串口。
+        """
+        self._sched.pause()
+        with self._reconnect_lock:
+            if self._closing or self._reconnect_thread is not None:
+                return
+            self.reconnect_stats["last_error"] = str(exc)
+            self._reconnect_thread = threading.Thread(target=self._reconnect, name="ftx1-cat-reconnect", daemon=True)
+            self._reconnect_thread.start()
+        self._notify({"link_up": False})
+
+    def _reconnect(self) -> None:
+        t_lost = time.monotonic()
+        self._close_link(self._link, self._ser, self._ser2)
+
+        # 刚恢复不久又断开（重开成功、下一次写又失败）算作连续断线，接着上次的退避间隔；
+        # 链路稳定过 RECONNECT_BACKOFF_S[1] 以上才从立即重连开始
+        if self._recovered_at is not None and t_lost - self._recovered_at < RECONNECT_BACKOFF_S[1]:
+            delay = self._next_backoff(self._reconnect_delay)
+        else:
+            delay = 0.0
+        while not self._closing:
+            if delay:
+                time.sleep(delay)
+            try:
+                ser, ser2 = self._open_ports()
+            except Exception as e:
+                self.reconnect_stats["last_error"] = str(e)
+                delay = self._next_backoff(delay)
+                continue
+            link = self._new_link(ser)
+            try:
+                # 先确认电台能应答，再恢复调度
+                if not link.query(["ID"])[0].startswith(b"ID"):
+                    raise serial.SerialException("no reply to ID")
+                # 断开期间电台状态可能被面板改过：不重发之前的 set，只重新打开 AI，
+                # 面板参数从电台读回缓存
+                if self.auto_info:
+                    link.write(["AI1"])
+                keys = list(DEFAULT_STATE_TTL)
+                resps = link.query(keys)
+            except Exception as e:
+                self.reconnect_stats["last_error"] = str(e)
+                self._close_link(link, ser, ser2)
+                delay = self._next_backoff(delay)
+                continue
+            break
+        else:
+            return
+
+        self.state.invalidate()
+        diverged = []
+        update: Dict[str, object] = {}
+        for key, resp in zip(keys, resps):
+            sent = self._last_sets.get(key.encode("ascii"))
+            if resp in (b"", b"?;"):
+                continue
+            if sent is not None and resp != sent.encode("ascii") + b";":
+                diverged.append(key)
+            self._remember(resp)
+            update.update(_frame_status(resp))
+
+        with self._reconnect_lock:
+            if self._closing:
+                self._close_link(link, ser, ser2)
+                return
+            self._ser, self._ser2 = ser, ser2
+            self._link = link
+            self._sched.resume(link)
+            self._recovered_at = time.monotonic()
+            self._reconnect_delay = delay
+            recovery_s = self._recovered_at - t_lost
+            self.reconnect_stats["count"] += 1
+            self.reconnect_stats["last_recovery_s"] = recovery_s
+            self.reconnect_stats["diverged"] = diverged
+            self._reconnect_thread = None
+        if update:
+            self._notify(update)
+        self._notify({"link_up": True, "recovery_s": recovery_s})
+
+    @staticmethod
+    def _next_backoff(delay: float) -> float:
+        return min(max(delay * 2, RECONNECT_BACKOFF_S[0]), RECONNECT_BACKOFF_S[1])
+
+    @staticmethod
+    def _close_link(link: CatLink, ser, ser2) -> None:
+        link.close()
+        for port in (ser, ser2):
+            try:
+                port.close()
+            except Exception:
+                pass
 
     def close(self):
-        with self._lock:
-            if self._ser and self._ser.is_open:
-                self._ser.close()
-            if self._ser2 and self._ser2.is_open:
-                self._ser2.close()
+        with self._reconnect_lock:
+            self._closing = True
+            reconnecting = self._reconnect_thread is not None
+        if self.auto_info and not reconnecting:
+            # 关闭 AI 模式；链路在这时断开的话不再重连，最多等一个 timeout
+            fut = self._sched.submit(["AI0"], PRIO_SET, expect_reply=False)[0]
+            try:
+                fut.result(self._timeout)
+            except Exception:
+                pass
+        self._sched.close()
+        self._link.close()
+        if self._ser and self._ser.is_open:
+            self._ser.close()
+        if self._ser2 and self._ser2.is_open:
+            self._ser2.close()
+
+    @contextmanager
+    def priority(self, prio: int):
+        """
+        在 with 块内把本线程发出的 CAT 命令改为指定优先级 (PRIO_xxx)，例如:
+            with cat.priority(PRIO_READ):
+                cat.read_all_meters()
+        """
+        token = _CAT_PRIORITY.set(prio)
+        try:
+            yield
+        finally:
+            _CAT_PRIORITY.reset(token)
+
+    def scheduler_stats(self) -> Dict[str, Dict[str, float]]:
+        """各优先级的排队延迟统计，见 CatScheduler.stats()。"""
+        return self._sched.stats()
 
-    def _send_cat(self, cmd: str) -> str:
+    def metrics_snapshot(self) -> Dict[str, object]:
         """
-        低层 CAT 发送/接收，内部自己持锁；
-        所有 CAT 调用都应该通过本函数间接完成，确保串口串行访问。
+        串口统计快照：CatMetrics.snapshot() 的内容，
+        另加 queue（各优先级排队延迟）、cache（参数缓存命中）和 reconnect（断线重连次数与恢复耗时）。
         """
-        with self._lock:
-            if not cmd.endswith(";"):
-                cmd = cmd + ";"
+        snap = self.metrics.snapshot()
+        snap["queue"] = self._sched.stats()
+        snap["cache"] = self.cache_stats()
+        snap["reconnect"] = dict(self.reconnect_stats)
+        return snap
+
+    def dump_metrics(self, path: Optional[str] = None) -> str:
+        """把 metrics_snapshot() 格式化为 JSON 返回；给出 path 时同时写入文件。"""
+        text = json.dumps(self.metrics_snapshot(), indent=2, ensure_ascii=False)
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        return text
+
+    def _submit(self, cmds: list[str], prio: int) -> list[Future]:
+        ctx_prio = _CAT_PRIORITY.get()
+        if ctx_prio is not None:
+            prio = ctx_prio
+        deadline_s = QUEUE_DEADLINE_S.get(prio)
+        deadline = time.monotonic() + deadline_s if deadline_s is not None else None
+        return self._sched.submit(cmds, prio, deadline=deadline)
+
+    def _query(self, cmds: list[str], prio: int) -> list[bytes]:
+        resps = [fut.result() for fut in self._submit(cmds, prio)]
+        for resp in resps:
+            self._remember(resp)
+        return resps
+
+    def _send_cat(self, cmd: str, prio: int = PRIO_READ) -> str:
+        """
+        低层 CAT 查询：排队写出后等待后台读线程把对应应答交回来。
+        所有 CAT 调用都应该通过本函数（或 send_batch / _write_cat）间接完成。
+        超时返回 ""。
+        """
+        return self._query([cmd], prio)[0].decode(errors="ignore")
 
-            # 清一下缓冲，避免旧数据干扰
-            self._ser.reset_input_buffer()
+    def send_batch(self, cmds: list[str], prio: int = PRIO_READ) -> list[str]:
+        """
+        流水线批量查询：全部命令一起排队、连续写出（如 RM1;RM2;...RM8;），
+        应答由读线程按命令前缀匹配回各自的请求。
+        更高优先级的命令可以插在批量命令之间发出。
 
-            self._ser.write(cmd.encode("ascii"))
-            # 稍微等一下，避免读空
-            time.sleep(0.002)
-            resp = self._ser.read_until(b";")
-            return resp.decode(errors="ignore")
+        返回:
+            与 cmds 一一对应的原始应答；超时未收到的为 ""，出错的命令为 "?;"
+        """
+        if not cmds:
+            return []
+        return [resp.decode(errors="ignore") for resp in self._query(cmds, prio)]
+
+    def query_raw(self, cmds: list[str], prio: int = PRIO_READ) -> list[bytes]:
+        """
+        同 send_batch，但返回原始应答帧 bytes，给 ftx1mem 等自己解析应答的模块用。
+        应答同样会更新参数缓存。
+        """
+        if not cmds:
+            return []
+        return self._query(cmds, prio)
+
+    def _read(self, cmd: str, max_age: Optional[float] = None) -> bytes:
+        """读一个参数的原始帧：缓存有效期内直接返回缓存的帧，否则实际查询。"""
+        frame = self._cached_frame(cmd.encode("ascii"), max_age)
+        if frame is not None:
+            return frame
+        return self._query([cmd], PRIO_READ)[0]
+
+    def _write_cat(self, cmd: str, prio: int = PRIO_SET) -> None:
+        """
+        只写不读。FTX-1 对 set 命令不回应答，
+        等应答只会白等一个完整的 timeout。
+        排队轮到后写出即返回。
+        """
+        ctx_prio = _CAT_PRIORITY.get()
+        self._sched.submit([cmd], prio if ctx_prio is None else ctx_prio, expect_reply=False)[0].result()
+
+    def _note_last_set(self, cmd: str) -> None:
+        # 记下面板参数（DEFAULT_STATE_TTL 中的那些）最近一次的 set，电台报告该参数后清掉；
+        # 断线恢复时只用来和读回的值比对（见 reconnect_stats["diverged"]），不重发
+        key = _frame_key(cmd.encode("ascii"))
+        if key.decode("ascii") in DEFAULT_STATE_TTL:
+            self._last_sets[key] = cmd
+
+    def _set_cat(
+        self,
+        cmd: str,
+        query: str,
+        accept: Tuple[str, ...] = (),
+        verify: Optional[bool] = None,
+        prio: int = PRIO_SET,
+    ) -> str:
+        """
+        发送 set 命令，可选回读校验。
+
+        参数:
+            cmd:    set 命令，如 "FA014250000"
+            query:  对应的读命令，如 "FA"
+            verify: None -> 按 self.verify_sets；True/False -> 本次强制校验/不校验
+            accept: 校验时可接受的应答（不含 ";"），默认只接受与 cmd 相同的应答
+
+        返回:
+            不校验时返回 ""；校验时返回回读的原始应答。
+            回读与期望不符时抛 RuntimeError。
+        """
+        if verify is None:
+            verify = self.verify_sets
+
+        # 电台按顺序执行，紧跟在 set 后面（同优先级）的查询读到的就是设置后的值
+        self._write_cat(cmd, prio)
+        self._note_set(cmd, accept)
+        self._note_last_set(cmd)
+        if not verify:
+            return ""
+        resp = self._send_cat(query, prio)
+
+        expected = accept or (cmd,)
+        if resp.strip().rstrip(";") not in expected:
+            raise RuntimeError(DISPLAY_TEXT["err_set_verify_fmt"].format(cmd=cmd, resp=resp))
+        return resp
+
+    # ---------- 多参数事务 ----------
+
+    def transaction(self, verify: Optional[bool] = None, prio: int = PRIO_SET) -> CatTransaction:
+        """开始一个多参数事务，见 CatTransaction。"""
+        return CatTransaction(self, verify=verify, prio=prio)
+
+    def commit_raw(
+        self,
+        cmds: list[Tuple[str, str, Tuple[str, ...]]],
+        verify: Optional[bool] = None,
+        prio: int = PRIO_SET,
+    ) -> Dict[str, str]:
+        """
+        把一组 (set 命令, 回读命令, 可接受的应答) 作为一个事务写出，
+        用于 CatTransaction 没有封装的命令（如 ftx1mem 的 MW / MT）。
+        返回值和校验失败时的 RuntimeError 同 CatTransaction.commit()。
+        """
+        if not cmds:
+            return {}
+        return self._commit_sets(list(cmds), self.verify_sets if verify is None else verify, prio)
+
+    def apply_settings(self, settings: Dict[str, object], verify: Optional[bool] = None) -> Dict[str, str]:
+        """
+        用 dict 描述的一组参数执行一次事务（便于 ftx1d 等远程调用），键可以是:
+            freq_hz, mode_name, agc_name, power_watts, notch_enabled, notch_freq_hz,
+            preamp: {band: level}
+        与 read_status() 返回的字段同名。
+        """
+        tx = self.transaction(verify=verify)
+        if settings.get("freq_hz") is not None:
+            tx.set_freq(int(settings["freq_hz"]))
+        if settings.get("mode_name") is not None:
+            tx.set_mode(str(settings["mode_name"]))
+        if settings.get("agc_name") is not None:
+            tx.set_agc(str(settings["agc_name"]))
+        for band, level in (settings.get("preamp") or {}).items():
+            tx.set_preamp(band, level)
+        if settings.get("power_watts") is not None:
+            tx.set_power_watts(int(settings["power_watts"]))
+        if settings.get("notch_enabled") is not None or settings.get("notch_freq_hz") is not None:
+            tx.set_manual_notch(enabled=settings.get("notch_enabled"), freq_hz=settings.get("notch_freq_hz"))
+        return tx.commit()
+
+    def _commit_sets(self, cmds: list[Tuple[str, str, Tuple[str, ...]]], verify: bool, prio: int) -> Dict[str, str]:
+        ctx_prio = _CAT_PRIORITY.get()
+        if ctx_prio is not None:
+            prio = ctx_prio
+        # 整组 set 作为一项排队，一次写出；原子性由调度器保证，这里不持锁等待
+        group = tuple(cmd for cmd, _, _ in cmds)
+        self._sched.submit([group], prio, expect_reply=False)[0].result()
+        for cmd, _, accept in cmds:
+            self._note_set(cmd, accept)
+            self._note_last_set(cmd)
+        if not verify:
+            return {}
+        # 同优先级先进先出：回读排在整组 set 后面，读到的就是设置后的值
+        resps = [resp.decode(errors="ignore") for resp in self._query([query for _, query, _ in cmds], prio)]
+
+        readback = {}
+        mismatched = []
+        for (cmd, _, accept), resp in zip(cmds, resps):
+            readback[cmd] = resp
+            if resp.strip().rstrip(";") not in (accept or (cmd,)):
+                mismatched.append(DISPLAY_TEXT["err_set_verify_fmt"].format(cmd=cmd, resp=resp))
+        if mismatched:
+            raise RuntimeError("; ".join(mismatched))
+        return readback
+
+    # ---------- 电台能力 ----------
+
+    def probe_capabilities(self) -> Dict[str, Optional[str]]:
+        """
+        读一次 PC，确定功率控制设备（FIELD / SPA-1）。
+        连接时自动调用；之后任何 PC 应答或主动上报的 P1 变化都会更新 capabilities。
+        """
+        self.get_power_control(max_age=0)
+        return dict(self.capabilities)
+
+    # ---------- AI 主动上报 ----------
+
+    def set_auto_info(self, on: bool) -> None:
+        """
+        开关 AI (Auto Information) 模式。
+
+        开启后电台会主动上报 FA/MD 等变化（旋钮调频也会上报），
+        get_freq / get_mode 直接返回内存里的最新值，不再占用串口；
+        上报同时推送给 add_listener 注册的监听者。
+        """
+        self._write_cat("AI1" if on else "AI0")
+        if on:
+            # 先查一次作为初始值，之后靠上报保持最新
+            self.send_batch(["FA", "MD0"])
+        self.auto_info = bool(on)
 
     # ---------- TX ----------
 
@@ -362,9 +2255,13 @@ class FTX1Cat:
     def get_rts(self) -> bool:
         return bool(self._ser2.rts)
 
+    def is_transmitting(self) -> bool:
+        """RTS 拉高或最近一次已知的 MOX 为 ON；不占用串口。"""
+        return self.get_rts() or self.state.peek(b"MX") == b"MX1;"
+
     # ---------- MOX ----------
 
-    def set_mox(self, on: bool) -> str:
+    def set_mox(self, on: bool, verify: Optional[bool] = None) -> str:
         """
         设置 MOX ON/OFF
         MX 命令：MOX SET
@@ -372,76 +2269,52 @@ class FTX1Cat:
           P1=1: ON
         """
         
-        p1 = "1" if on else "0"
-        resp = self._send_cat(f"MX{p1}")
-        return resp
+        return self._set_cat(*_mox_cmd(on), verify=verify, prio=PRIO_TX)
 
-    def get_mox(self) -> Tuple[Optional[bool], str]:
+    def get_mox(self, max_age: Optional[float] = None) -> Tuple[Optional[bool], str]:
         """
         读取 MOX 状态
         MX; → MX0; 或 MX1;
         """
 
-        resp = self._send_cat("MX")
-        r = resp.strip()
-        if r.startswith("MX") and r.endswith(";") and len(r) >= 3:
-            try:
-                val = int(r[2])
-                return bool(val), resp
-            except Exception:
-                return None, resp
-        return None, resp
+        frame = self._read("MX", max_age)
+        return self._checked(frame, _parse_mox(frame)), frame.decode(errors="ignore")
 
     # ---------- 频率 ----------
 
-    def get_freq(self) -> Tuple[Optional[int], str]:
+    def get_freq(self, max_age: Optional[float] = None) -> Tuple[Optional[int], str]:
         """
         读取 MAIN 频率 (FA;)
         返回 (freq_hz, 原始应答)
+
+        max_age: 可接受的缓存时间（秒），None 按缓存 TTL，0 表示实际读取
         """
         
-        resp = self._send_cat("FA")
-        r = resp.strip()
-        # 典型返回: FA014250000;
-        if r.startswith("FA") and r.endswith(";"):
-            freq_str = r[2:-1]
-            try:
-                return int(freq_str), resp
-            except Exception:
-                return None, resp
-        return None, resp
+        frame = self._read("FA", max_age)
+        return self._checked(frame, _parse_freq(frame)), frame.decode(errors="ignore")
 
-    def set_freq(self, freq_hz: int) -> str:
+    def set_freq(self, freq_hz: int, verify: Optional[bool] = None) -> str:
         """
         设置 MAIN 频率
         freq_hz 为整数，如 14250000
         FTX-1 要求 9 位十进制数字
         """
 
-        freq_str = f"{freq_hz:09d}"
-        resp = self._send_cat(f"FA{freq_str}")
-        return resp
+        return self._set_cat(*_freq_cmd(freq_hz), verify=verify)
 
     # ---------- 模式 ----------
 
-    def get_mode(self, main: bool = True) -> Tuple[Optional[str], str]:
+    def get_mode(self, main: bool = True, max_age: Optional[float] = None) -> Tuple[Optional[str], str]:
         """
         读取模式，输出：("LSB" / "USB" / ...)，绝不输出数字编码
         遇到非法码（0,G,J 等）返回 None
         """
         
         p1 = "0" if main else "1"
-        resp = self._send_cat(f"MD{p1}")
-        r = resp.strip()
+        frame = self._read(f"MD{p1}", max_age)
+        return self._checked(frame, _parse_mode(frame)), frame.decode(errors="ignore")
 
-        if not (r.startswith("MD") and r.endswith(";") and len(r) == 5):
-            return None, resp
-
-        p2 = r[3].upper()
-        mode_name = P2_TO_MODE.get(p2)
-        return mode_name, resp
-
-    def set_mode(self, mode_name: str, main: bool = True) -> str:
+    def set_mode(self, mode_name: str, main: bool = True, verify: Optional[bool] = None) -> str:
         """
         设置模式，输入为字符串，例如：
             set_mode("USB")
@@ -450,18 +2323,12 @@ class FTX1Cat:
         若模式名非法，抛 ValueError
         """
         
-        mode_name = mode_name.upper()
-        if mode_name not in MODE_TO_P2:
-            raise ValueError(DISPLAY_TEXT["err_invalid_mode_fmt"].format(mode_name=mode_name))
-        p2 = MODE_TO_P2[mode_name]
-        p1 = "0" if main else "1"
-        resp = self._send_cat(f"MD{p1}{p2}")
-        return resp
+        return self._set_cat(*_mode_cmd(mode_name, main), verify=verify)
 
 
     # ---------- AGC ----------
 
-    def get_agc(self, main: bool = True) -> Tuple[Optional[str], str]:
+    def get_agc(self, main: bool = True, max_age: Optional[float] = None) -> Tuple[Optional[str], str]:
         """
         读取 AGC（GT 命令）
 
@@ -476,26 +2343,10 @@ class FTX1Cat:
         """
 
         p1 = "0" if main else "1"
-        resp = self._send_cat(f"GT{p1}")
-        r = resp.strip()
-
-        # Answer: GT P1 P3 ;
-        if not (r.startswith("GT") and r.endswith(";")):
-            return None, resp
-        body = r[2:-1]
-        digits = "".join(ch for ch in body if ch.isdigit())
-        # 期望至少两位：P1 + P3
-        if len(digits) < 2:
-            return None, resp
-
-        recv_p1 = digits[0]
-        p3 = digits[1]
-        if recv_p1 != p1:
-            return None, resp
+        frame = self._read(f"GT{p1}", max_age)
+        return self._checked(frame, _parse_agc(frame, p1)), frame.decode(errors="ignore")
 
-        return AGC_P3_TO_NAME.get(p3), resp
-
-    def set_agc(self, agc: str, main: bool = True) -> str:
+    def set_agc(self, agc: str, main: bool = True, verify: Optional[bool] = None) -> str:
         """
         设置 AGC（GT 命令）
 
@@ -506,17 +2357,11 @@ class FTX1Cat:
                 True=MAIN-side, False=SUB-side
         """
 
-        agc_u = agc.strip().upper()
-        if agc_u not in AGC_NAME_TO_P2:
-            raise ValueError(DISPLAY_TEXT["err_invalid_agc_fmt"].format(agc=agc, opts=list(AGC_NAME_TO_P2.keys())))
-
-        p1 = "0" if main else "1"
-        p2 = AGC_NAME_TO_P2[agc_u]
-        return self._send_cat(f"GT{p1}{p2}")
+        return self._set_cat(*_agc_cmd(agc, main), verify=verify)
 
     # ---------- RF Power (PC POWER CONTROL) ----------
 
-    def get_power_control(self) -> Tuple[Optional[str], Optional[int], str]:
+    def get_power_control(self, max_age: Optional[float] = None) -> Tuple[Optional[str], Optional[int], str]:
         """
         读取功率控制（PC 命令）
 
@@ -535,36 +2380,18 @@ class FTX1Cat:
         但实测 field head 可用 001-010W，这里 set_power_watts 会按实测放开到 1W 起。
         """
 
-        resp = self._send_cat("PC")
-        r = resp.strip()
-        if not (r.startswith("PC") and r.endswith(";")):
-            return None, None, resp
-
-        body = r[2:-1]
-        digits = "".join(ch for ch in body if ch.isdigit())
-        # 期望：P1(1位) + P2(3位) = 4 位
-        if len(digits) < 4:
-            return None, None, resp
-
-        p1 = digits[0]
-        p2 = digits[1:4]
-        try:
-            watts = int(p2)
-        except Exception:
-            return None, None, resp
-
-        if p1 == "1":
-            return "FIELD", watts, resp
-        if p1 == "2":
-            return "SPA1", watts, resp
-        return None, watts, resp
+        frame = self._read("PC", max_age)
+        dev, watts = _parse_power_control(frame)
+        self._checked(frame, watts)
+        return dev, watts, frame.decode(errors="ignore")
 
-    def set_power_watts(self, watts: int) -> str:
+    def set_power_watts(self, watts: int, verify: Optional[bool] = None) -> str:
         """
         设置输出功率（PC 命令）
         
         说明：
-        - 先执行一次读取，判断当前连接的是 FIELD 还是 SPA-1
+        - 按 capabilities["power_dev"] 判断当前连接的是 FIELD 还是 SPA-1，
+          未知时才先读一次 PC
         - FIELD: 允许 1~10W（发送 P1=1，P2=001~010）
         - SPA-1: 允许 5~100W（发送 P1=2，P2=005~100）
 
@@ -575,23 +2402,13 @@ class FTX1Cat:
         if not isinstance(watts, int):
             raise TypeError(DISPLAY_TEXT["err_watts_type"])
 
-        dev, cur_w, raw = self.get_power_control()
+        dev = self.capabilities["power_dev"]
         if dev is None:
-            raise RuntimeError(DISPLAY_TEXT["err_parse_pc_fmt"].format(raw=raw))
-
-        if dev == "FIELD":
-            if watts < 1 or watts > 10:
-                raise ValueError(DISPLAY_TEXT["err_field_power_range"])
-            p1 = "1"
-            p2 = f"{watts:03d}"  # 001~010
-        else:
-            # SPA1
-            if watts < 5 or watts > 100:
-                raise ValueError(DISPLAY_TEXT["err_spa1_power_range"])
-            p1 = "2"
-            p2 = f"{watts:03d}"  # 005~100
+            dev, cur_w, raw = self.get_power_control(max_age=0)
+            if dev is None:
+                raise RuntimeError(DISPLAY_TEXT["err_parse_pc_fmt"].format(raw=raw))
 
-        return self._send_cat(f"PC{p1}{p2}")
+        return self._set_cat(*_power_cmd(watts, dev), verify=verify)
 
 
     # ---------- METER 读取 ----------
@@ -606,41 +2423,70 @@ class FTX1Cat:
         返回 (raw_value, conv_value, 原始应答)
         """
         
-        resp = self._send_cat(f"RM{meter_id}")
-        r = resp.strip()
-        # 解析，如: "RM5 123000;" 或 "RM5123000;"
-        if not (r.startswith("RM") and r.endswith(";")):
-            return None, None, resp
-        try:
-            p1 = int(r[2])          # 第三个字符是 P1 (1..8)
-            if p1 != meter_id:
-                # 不匹配的话直接视为错误
-                return None, None, resp
-            p2_str = r[3:6]         # 接下来 3 位是 P2 (000-255)
-            p3_str = r[6:9]
-            if p3_str != "000":
-                return None, None, resp
-            raw_val = int(p2_str)
-            conv_val = convert_meter_value(meter_id, raw_val)
-            return raw_val, conv_val, resp
-        except Exception:
+        return self._meter_result(self._query([f"RM{meter_id}"], PRIO_READ)[0], meter_id)
+
+    def _meter_result(self, frame: bytes, meter_id: int) -> Tuple[Optional[int], Optional[float], str]:
+        raw_val = self._checked(frame, _parse_meter(frame, meter_id))
+        resp = frame.decode(errors="ignore")
+        if raw_val is None:
             return None, None, resp
+        return raw_val, convert_meter_value(meter_id, raw_val), resp
+
+    def tune_and_read_meter(
+        self, freq_hz: int, meter_id: int, dwell_s: float = 0.0, prio: int = PRIO_FULL_READ
+    ) -> Future:
+        """
+        调到 freq_hz 再读一次 RM meter_id（ftx1scan 的一步）。
+        FA 写出、再等 dwell_s 后返回，不等表头应答：
+        返回的 Future 结果同 read_meter()，连续调用时各步的 RM 在调度器里流水线发出。
+        频率和 set_freq 一样记入缓存。
+        """
+        cmd, _, accept = _freq_cmd(freq_hz)
+        self._write_cat(cmd, prio)
+        self._note_set(cmd, accept)
+        self._note_last_set(cmd)
+        if dwell_s > 0:
+            time.sleep(dwell_s)
+        out = Future()
+
+        def on_reply(fut: Future) -> None:
+            try:
+                frame = fut.result()
+            except BaseException as e:
+                out.set_exception(e)
+                return
+            self._remember(frame)
+            out.set_result(self._meter_result(frame, meter_id))
+
+        self._submit([f"RM{meter_id}"], prio)[0].add_done_callback(on_reply)
+        return out
 
     def read_all_meters(self) -> Dict[str, Dict[str, int | float | None]]:
         """
-        依次读 1..8 meter
+        一次批量读 1..8 meter（RM1;RM2;...RM8; 一起排队、连续写出）
         """
-        
+
+        return self.read_meters(range(1, 9))
+
+    def read_meters(self, meter_ids) -> Dict[str, Dict[str, int | float | None]]:
+        """
+        批量读指定的 meter（如 [1, 8]），返回格式同 read_all_meters。
+        按收发状态选择要读的 meter 见 MeterPollPolicy。
+        """
+
+        mids = list(meter_ids)
+        if not mids:
+            return {}
+        resps = self._query([f"RM{mid}" for mid in mids], PRIO_METER)
+
         results: Dict[str, Dict[str, int | float | None]] = {}
-        for mid in range(1, 9):
-            with self._lock:
-                name = METER_MAP.get(mid, f"METER_{mid}")
-                raw, conv, resp = self.read_meter(mid)  # read_meter 内部也会锁，但 RLock 可重入
-                if raw is not None:
-                    results[name] = {
-                        "raw": raw,
-                        "value": conv,
-                    }
+        for mid, resp in zip(mids, resps):
+            raw = self._checked(resp, _parse_meter(resp, mid))
+            if raw is not None:
+                results[METER_MAP.get(mid, f"METER_{mid}")] = {
+                    "raw": raw,
+                    "value": convert_meter_value(mid, raw),
+                }
         return results
 
     # ---------- Manual NOTCH ----------
@@ -650,6 +2496,7 @@ class FTX1Cat:
         main: bool = True,
         enabled: Optional[bool] = None,
         freq_hz: Optional[int] = None,
+        verify: Optional[bool] = None,
     ) -> str:
         """
         设置 Manual NOTCH（手动陷波）
@@ -665,39 +2512,16 @@ class FTX1Cat:
                 - None -> 不改变频率
 
         返回:
-            最后一条 CAT 命令的原始返回字符串（如果两个都设置，则是频率那条的返回）
+            最后一条 CAT 命令的回读应答（仅校验时有内容，如果两个都设置，则是频率那条的回读）
         """
-        if enabled is None and freq_hz is None:
-            raise ValueError(DISPLAY_TEXT["err_notch_args"])
-
-        
-        p1 = "0" if main else "1"
         last_resp = ""
-
-        # 先设置 ON/OFF
-        if enabled is not None:
-            # P2 = 0, P3 = 000/001
-            p2 = "0"
-            p3 = 1 if enabled else 0
-            cmd = f"BP{p1}{p2}{p3:03d}"
-            last_resp = self._send_cat(cmd)
-
-        # 再设置频率
-        if freq_hz is not None:
-            # FTX-1: P3 = 001-320, 单位 10 Hz，即 10~3200 Hz
-            steps = int(round(freq_hz / 10))
-            if steps < 1 or steps > 320:
-                raise ValueError(DISPLAY_TEXT["err_notch_range"])
-
-            p2 = "1"
-            p3 = steps
-            cmd = f"BP{p1}{p2}{p3:03d}"
-            last_resp = self._send_cat(cmd)
-
+        # 先设置 ON/OFF，再设置频率
+        for cmd in _notch_cmds(main, enabled, freq_hz):
+            last_resp = self._set_cat(*cmd, verify=verify)
         return last_resp
 
     def get_manual_notch(
-        self, main: bool = True
+        self, main: bool = True, max_age: Optional[float] = None
     ) -> Tuple[Optional[bool], Optional[int], Tuple[str, str]]:
         """
         读取 Manual NOTCH 状态和频率
@@ -716,45 +2540,39 @@ class FTX1Cat:
 
         p1 = "0" if main else "1"
 
-        # 先读 ON/OFF: BP P1 0 ;
-        resp_on = self._send_cat(f"BP{p1}0")
-        r_on = resp_on.strip()
-        enabled: Optional[bool] = None
+        # ON/OFF (BP P1 0 ;) 和频率 (BP P1 1 ;) 都在缓存里就不读，否则一次批量读
+        cached = [self._cached_frame(f"BP{p1}{p2}".encode("ascii"), max_age) for p2 in "01"]
+        if None in cached:
+            cached = self._query([f"BP{p1}0", f"BP{p1}1"], PRIO_READ)
+        frame_on, frame_freq = cached
+        return (
+            self._checked(frame_on, _parse_notch_enabled(frame_on)),
+            self._checked(frame_freq, _parse_notch_freq(frame_freq)),
+            (frame_on.decode(errors="ignore"), frame_freq.decode(errors="ignore")),
+        )
+            
+    # ---------- 整机状态 ----------
 
-        # 典型返回: BP0001; 等
-        if r_on.startswith("BP") and r_on.endswith(";") and len(r_on) == 8:
-            try:
-                # 索引: B(0) P(1) P1(2) P2(3) P3(4:7) ;(7)
-                p2 = r_on[3]
-                p3 = int(r_on[4:7])
-
-                if p2 == "0":
-                    if p3 == 0:
-                        enabled = False
-                    elif p3 == 1:
-                        enabled = True
-            except Exception:
-                enabled = None
+    def read_status(self, bands: Optional[list[str]] = None) -> Dict[str, object]:
+        """
+        一次批量读取面板需要的全部状态（频率/模式/PRE-AMP/AGC/功率/NOTCH），
+        只占一次往返。
 
-        # 再读频率: BP P1 1 ;
-        resp_freq = self._send_cat(f"BP{p1}1")
-        r_freq = resp_freq.strip()
-        freq_hz: Optional[int] = None
+        参数:
+            bands: 需要读取 PRE-AMP 的频段列表，如 ["HF50", "VHF", "UHF"]
 
-        if r_freq.startswith("BP") and r_freq.endswith(";") and len(r_freq) == 8:
-            try:
-                p2 = r_freq[3]
-                p3 = int(r_freq[4:7])
-                if p2 == "1" and 1 <= p3 <= 320:
-                    freq_hz = p3 * 10  # 单位 10 Hz
-            except Exception:
-                freq_hz = None
+        返回 dict:
+            freq_hz, mode_name, preamp{band: level}, agc_name,
+            power_dev, power_watts, notch_enabled, notch_freq_hz
+            无法解析的项为 None
+        """
+        bands = list(bands or [])
+        cmds, band_p1 = _status_cmds(bands)
+        return _status_from_resps(bands, band_p1, self._query(cmds, PRIO_FULL_READ))
 
-        return enabled, freq_hz, (resp_on, resp_freq)
-            
     # ---------- PRE-AMP / IPO ----------
 
-    def get_preamp(self, band: str) -> Tuple[Optional[str], str]:
+    def get_preamp(self, band: str, max_age: Optional[float] = None) -> Tuple[Optional[str], str]:
         """
         读取 PRE-AMP/IPO 状态（按频段）
 
@@ -772,42 +2590,13 @@ class FTX1Cat:
         VHF/UHF 下:
             level ∈ {"OFF", "ON"}
         """
-        # 规范化 band 字符串
-        b = band.upper()
-        if b not in BAND_TO_P1:
-            raise ValueError(DISPLAY_TEXT["err_invalid_band_fmt"].format(band=band))
+        p1 = _band_p1(band)
 
-        p1 = BAND_TO_P1[b]
-
-    
         # Read: PA P1 ;
-        resp = self._send_cat(f"PA{p1}")
-        r = resp.strip()
-        if not (r.startswith("PA") and r.endswith(";")):
-            return None, resp
-
-        body = r[2:-1]
-        digits = "".join(ch for ch in body if ch.isdigit())
-        if len(digits) < 2:
-            return None, resp
-
-        recv_p1 = digits[0]
-        recv_p2 = digits[1]
-
-        # 确认返回的 band 和请求一致
-        if recv_p1 != p1:
-            return None, resp
-
-        band_canon = P1_TO_BAND_CANON.get(recv_p1)
-        if band_canon == "HF50":
-            level = HF50_P2_TO_PREAMP.get(recv_p2)
-        else:
-            # VHF/UHF 都是 OFF/ON
-            level = VU_P2_TO_PREAMP.get(recv_p2)
+        frame = self._read(f"PA{p1}", max_age)
+        return self._checked(frame, _parse_preamp(frame, p1)), frame.decode(errors="ignore")
 
-        return level, resp
-
-    def set_preamp(self, band: str, level: str) -> str:
+    def set_preamp(self, band: str, level: str, verify: Optional[bool] = None) -> str:
         """
         设置 PRE-AMP/IPO 状态（按频段）
 
@@ -822,26 +2611,4 @@ class FTX1Cat:
             VHF/UHF 下:
                 "OFF", "ON"
         """
-        b = band.upper()
-        if b not in BAND_TO_P1:
-            raise ValueError(DISPLAY_TEXT["err_invalid_band_fmt"].format(band=band))
-
-        p1 = BAND_TO_P1[b]
-
-        lvl = level.upper()
-        # 根据 band 选择不同的合法值
-        if p1 == "0":
-            # HF/50
-            if lvl not in HF50_PREAMP_TO_P2:
-                raise ValueError(DISPLAY_TEXT["err_hf50_preamp_level_fmt"].format(opts=list(HF50_PREAMP_TO_P2.keys()), level=level))
-            p2 = HF50_PREAMP_TO_P2[lvl]
-        else:
-            # VHF/UHF
-            if lvl not in VU_PREAMP_TO_P2:
-                raise ValueError(DISPLAY_TEXT["err_vu_preamp_level_fmt"].format(opts=list(VU_PREAMP_TO_P2.keys()), level=level))
-            p2 = VU_PREAMP_TO_P2[lvl]
-
-        cmd = f"PA{p1}{p2}"
-
-        # Set: PA P1 P2 ;
-        return self._send_cat(cmd)
\ No newline at end of file
+        return self._set_cat(*_preamp_cmd(band, level), verify=verify)
\ No newline at end of file
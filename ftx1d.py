@@ -0,0 +1,422 @@
+"""
+ftx1d：FTX-1 本地代理进程。
+
+独占 CAT / PTT 两个串口，本机的 GUI、rigctl、脚本都通过它访问电台：
+
+    python ftx1d.py --port COM11 --port2 COM12
+    python ftx1d.py --port /dev/ttyUSB0 --port2 /dev/ttyUSB1 --listen /tmp/ftx1d.sock
+
+所有请求进入同一个 FTX1Cat：由 CatScheduler 按优先级排成一个队列写出，
+读取优先用 RigStateCache 中未过期的值，多个客户端同时轮询也不会成倍占用串口。
+
+协议：Unix socket（Windows 没有 AF_UNIX 时改用 127.0.0.1 TCP），每行一个 JSON。
+能连上代理就能控制发射，默认 socket 放在当前用户私有的目录（$XDG_RUNTIME_DIR，
+没有时为临时目录下权限 0700 的 ftx1d-<uid>），socket 本身权限为 0600：
+
+    请求  {"id": 1, "method": "get_freq", "args": [], "kwargs": {"max_age": 0}}
+    应答  {"id": 1, "result": [14074000, "FA014074000;"]}
+    出错  {"id": 1, "error": {"type": "ValueError", "message": "..."}}
+    上报  {"event": "status", "data": {"freq_hz": 7074000}}   （订阅后，见 FTX1Client.add_listener）
+
+同一连接上的请求可以并发，应答按完成顺序返回，用 id 对应。
+GUI 的 CAT 口填 "ftx1d" 或 "ftx1d:<地址>" 即通过本代理连接。
+
+加 --rigctl-port 4532 时同时提供 Hamlib NET rigctl 服务（见 ftx1rigctl），
+WSJT-X 等 hamlib 客户端不需要运行 GUI 也能和其他客户端共用电台。
+"""
+
+import argparse
+import asyncio
+import functools
+import itertools
+import json
+import os
+import socket
+import stat
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from ftx1capture import CaptureFactory
+from ftx1cat import DISPLAY_TEXT, FTX1Cat, auto_baud
+from ftx1rigctl import RigctlTCPServer
+
+
+DEFAULT_TCP_PORT = 4533
+
+
+def _runtime_dir() -> str:
+    """放 socket 的本用户私有目录：$XDG_RUNTIME_DIR，没有时为临时目录下的 ftx1d-<uid>。"""
+    xdg = os.environ.get("XDG_RUNTIME_DIR")
+    if xdg and os.path.isdir(xdg):
+        return xdg
+    uid = os.getuid() if hasattr(os, "getuid") else os.getpid()
+    return os.path.join(tempfile.gettempdir(), f"ftx1d-{uid}")
+
+
+DEFAULT_SOCKET_PATH = os.path.join(_runtime_dir(), "ftx1d.sock")
+
+# 客户端可以调用的 FTX1Cat 方法
+BROKER_METHODS = frozenset(
+    {
+        "get_mox",
+        "set_mox",
+        "get_freq",
+        "set_freq",
+        "get_mode",
+        "set_mode",
+        "get_agc",
+        "set_agc",
+        "get_power_control",
+        "set_power_watts",
+        "read_meter",
+        "read_all_meters",
+        "read_meters",
+        "get_manual_notch",
+        "set_manual_notch",
+        "read_status",
+        "get_preamp",
+        "set_preamp",
+        "set_rts",
+        "get_rts",
+        "is_transmitting",
+        "send_batch",
+        "set_auto_info",
+        "probe_capabilities",
+        "cache_stats",
+        "scheduler_stats",
+        "metrics_snapshot",
+        "apply_settings",
+    }
+)
+
+# 客户端收到这些类型的错误时按原类型重新抛出，其余一律 RuntimeError
+_ERROR_TYPES = {cls.__name__: cls for cls in (ValueError, TypeError, RuntimeError, TimeoutError)}
+
+
+def default_address() -> str:
+    if hasattr(socket, "AF_UNIX"):
+        return DEFAULT_SOCKET_PATH
+    return f"127.0.0.1:{DEFAULT_TCP_PORT}"
+
+
+def _ensure_private_dir(path: str) -> None:
+    """建立（或检查）只有当前用户能访问的目录；别人建的或对别人开放的目录拒绝使用。"""
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.stat(path)
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(DISPLAY_TEXT["err_broker_path_fmt"].format(path=path))
+
+
+def _unix_socket_alive(path: str) -> bool:
+    """path 上是否有进程在监听。"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(1.0)
+        try:
+            sock.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+def parse_address(address: Optional[str]) -> Tuple[str, object]:
+    """
+    "host:port" -> ("tcp", (host, port))；其余按 Unix socket 路径处理 -> ("unix", path)。
+    None / "" 用 default_address()。
+    """
+    address = address or default_address()
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit() and "/" not in address and "\\" not in address:
+        return "tcp", (host or "127.0.0.1", int(port))
+    return "unix", address
+
+
+# ==========================
+# 代理服务端
+# ==========================
+
+class FTX1Broker:
+    """
+    在一个 asyncio 事件循环里服务所有客户端连接。
+    FTX1Cat 的阻塞调用放到线程池执行，排队和缓存都由 FTX1Cat 完成。
+    """
+
+    def __init__(self, cat: FTX1Cat, address: Optional[str] = None, workers: int = 8):
+        self.cat = cat
+        self.kind, self.addr = parse_address(address)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ftx1d")
+        self._subscribers: set = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = None
+        cat.add_listener(self._on_push)
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        if self.kind == "unix":
+            if self.addr == DEFAULT_SOCKET_PATH:
+                _ensure_private_dir(os.path.dirname(self.addr))
+            if os.path.lexists(self.addr):
+                if not stat.S_ISSOCK(os.lstat(self.addr).st_mode):
+                    raise FileExistsError(DISPLAY_TEXT["err_broker_path_fmt"].format(path=self.addr))
+                if _unix_socket_alive(self.addr):
+                    # 另一个 ftx1d 还在运行，不能把它的地址抢过来
+                    raise FileExistsError(DISPLAY_TEXT["err_broker_running_fmt"].format(addr=self.addr))
+                # 上次异常退出留下的 socket 文件
+                os.unlink(self.addr)
+            self._server = await asyncio.start_unix_server(self._handle_client, path=self.addr)
+            os.chmod(self.addr, 0o600)
+        else:
+            host, port = self.addr
+            self._server = await asyncio.start_server(self._handle_client, host=host, port=port)
+        print(DISPLAY_TEXT["log_broker_listen_fmt"].format(addr=self.address_text()))
+
+    def address_text(self) -> str:
+        if self.kind == "unix":
+            return self.addr
+        return "{}:{}".format(*self.addr)
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            if self.kind == "unix":
+                try:
+                    os.unlink(self.addr)
+                except OSError:
+                    pass
+        self.cat.remove_listener(self._on_push)
+        self._pool.shutdown(wait=False)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        print(DISPLAY_TEXT["log_broker_client_fmt"].format(addr=writer.get_extra_info("peername") or self.address_text()))
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                task = asyncio.ensure_future(self._serve_line(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._subscribers.discard(writer)
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _serve_line(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        req_id = None
+        try:
+            req = json.loads(line)
+            req_id = req.get("id")
+            method = req.get("method")
+            if method == "subscribe":
+                self._subscribers.add(writer)
+                result = True
+            elif method == "unsubscribe":
+                self._subscribers.discard(writer)
+                result = True
+            elif method == "state":
+                result = {"auto_info": self.cat.auto_info, "capabilities": dict(self.cat.capabilities)}
+            elif method in BROKER_METHODS:
+                fn = functools.partial(getattr(self.cat, method), *req.get("args", []), **req.get("kwargs", {}))
+                result = await self._loop.run_in_executor(self._pool, fn)
+            else:
+                raise ValueError(DISPLAY_TEXT["err_broker_method_fmt"].format(method=method))
+            reply = {"id": req_id, "result": result}
+        except Exception as e:
+            reply = {"id": req_id, "error": {"type": type(e).__name__, "message": str(e)}}
+        self._send(writer, reply)
+
+    def _send(self, writer: asyncio.StreamWriter, msg: dict) -> None:
+        if writer.is_closing():
+            return
+        writer.write(json.dumps(msg, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    def _on_push(self, update: dict) -> None:
+        # 在串口读线程里被调用，转回事件循环再发
+        if self._loop is not None and self._subscribers:
+            self._loop.call_soon_threadsafe(self._broadcast, update)
+
+    def _broadcast(self, update: dict) -> None:
+        for writer in list(self._subscribers):
+            self._send(writer, {"event": "status", "data": update})
+
+
+# ==========================
+# 客户端
+# ==========================
+
+class FTX1Client:
+    """
+    ftx1d 的客户端，接口与 FTX1Cat 相同（返回的 tuple 经 JSON 后变为 list）：
+
+        cat = FTX1Client()
+        freq_hz, raw = cat.get_freq()
+        cat.set_freq(7_074_000)
+
+    后台读线程按 id 把应答交给各自的调用方，多个线程可以共用一个连接。
+    """
+
+    def __init__(self, address: Optional[str] = None, timeout: float = 5.0):
+        self.address = address
+        self._timeout = timeout
+        kind, addr = parse_address(address)
+        if kind == "unix":
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock.connect(addr)
+        self._rfile = self._sock.makefile("rb")
+        self._wlock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._pending: dict = {}
+        self._listeners = []
+        self._closed = False
+        self._thread = threading.Thread(target=self._reader, name="ftx1d-client", daemon=True)
+        self._thread.start()
+
+    def call(self, method: str, *args, **kwargs):
+        """调用代理上的一个方法并等待结果；代理端抛出的错误在这里重新抛出。"""
+        req_id = next(self._ids)
+        fut = Future()
+        self._pending[req_id] = fut
+        data = json.dumps({"id": req_id, "method": method, "args": args, "kwargs": kwargs}).encode("utf-8") + b"\n"
+        try:
+            with self._wlock:
+                self._sock.sendall(data)
+            return fut.result(self._timeout)
+        finally:
+            self._pending.pop(req_id, None)
+
+    def __getattr__(self, name: str):
+        if name in BROKER_METHODS:
+            return functools.partial(self.call, name)
+        raise AttributeError(name)
+
+    @property
+    def auto_info(self) -> bool:
+        return bool(self.call("state")["auto_info"])
+
+    @property
+    def capabilities(self) -> dict:
+        return self.call("state")["capabilities"]
+
+    def add_listener(self, fn) -> None:
+        """见 FTX1Cat.add_listener；第一个监听者加入时向代理订阅上报。"""
+        if fn not in self._listeners:
+            self._listeners.append(fn)
+        if len(self._listeners) == 1:
+            self.call("subscribe")
+
+    def remove_listener(self, fn) -> None:
+        if fn in self._listeners:
+            self._listeners.remove(fn)
+            if not self._listeners and not self._closed:
+                self.call("unsubscribe")
+
+    def close(self) -> None:
+        self._closed = True
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+
+    def _reader(self) -> None:
+        try:
+            for line in self._rfile:
+                msg = json.loads(line)
+                if "event" in msg:
+                    for fn in list(self._listeners):
+                        try:
+                            fn(msg.get("data", {}))
+                        except Exception:
+                            pass
+                    continue
+                fut = self._pending.get(msg.get("id"))
+                if fut is None or fut.done():
+                    continue
+                if "error" in msg:
+                    err = msg["error"]
+                    fut.set_exception(_ERROR_TYPES.get(err.get("type"), RuntimeError)(err.get("message", "")))
+                else:
+                    fut.set_result(msg.get("result"))
+        except (OSError, ValueError):
+            pass
+        # 连接断开：在途调用立即失败
+        exc = ConnectionError(DISPLAY_TEXT["err_broker_disconnected"])
+        for fut in list(self._pending.values()):
+            if not fut.done():
+                fut.set_exception(exc)
+
+
+# ==========================
+# 命令行
+# ==========================
+
+def main():
+    ap = argparse.ArgumentParser(description="FTX-1 CAT broker")
+    ap.add_argument("--port", default="COM11", help="CAT port")
+    ap.add_argument("--baud", default="38400", help='CAT baud rate, or "auto" to probe')
+    ap.add_argument("--port2", default="COM12", help="PTT (RTS) port")
+    ap.add_argument("--baud2", type=int, default=38400)
+    ap.add_argument("--timeout", type=float, default=0.3)
+    ap.add_argument("--listen", default=None, help=f"socket path or host:port (default {default_address()})")
+    ap.add_argument("--auto-info", action="store_true", help="enable AI push mode")
+    ap.add_argument("--capture", default=None, help="record CAT traffic to this file (see ftx1capture)")
+    ap.add_argument("--rigctl-port", type=int, default=None, help="also serve Hamlib NET rigctl on this TCP port (e.g. 4532)")
+    ap.add_argument("--rigctl-host", default="127.0.0.1", help="address for the rigctl server")
+    args = ap.parse_args()
+
+    if args.baud == "auto":
+        baud = auto_baud(args.port)
+        if baud is None:
+            raise SystemExit(DISPLAY_TEXT["err_baud_probe_failed_fmt"].format(port=args.port))
+    else:
+        baud = int(args.baud)
+
+    capture = CaptureFactory(args.capture) if args.capture else None
+    cat = FTX1Cat(
+        port=args.port,
+        baudrate=baud,
+        port2=args.port2,
+        baudrate2=args.baud2,
+        timeout=args.timeout,
+        auto_info=args.auto_info,
+        serial_factory=capture,
+    )
+    broker = FTX1Broker(cat, args.listen)
+    rigctl = None
+    if args.rigctl_port is not None:
+        rigctl = RigctlTCPServer(cat, host=args.rigctl_host, port=args.rigctl_port)
+        rigctl.start()
+    try:
+        asyncio.run(broker.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        # 地址被占用（另一个 ftx1d）、socket 路径不安全等
+        raise SystemExit(str(e))
+    finally:
+        if rigctl is not None:
+            rigctl.stop()
+        cat.close()
+        if capture is not None:
+            capture.close()
+
+
+if __name__ == "__main__":
+    main()
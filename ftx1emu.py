@@ -0,0 +1,273 @@
+"""
+ftx1emu：在伪终端 (pty) 上模拟一台 FTX-1，用于没有电台时的测试和性能测量（仅 POSIX）。
+
+支持 FTX1Cat 用到的 CAT 子集：FA FB MD GT PC PA BP RM MX AI ID，以及 MR / MW / MT 存储器。
+与真机一样：查询回应答，set 不回任何东西，不认识的命令回 "?;"。
+按波特率模拟每个字节的线路时间，每条命令另加 latency_s 处理时间；
+客户端打开 pty 用的波特率与模拟器不同时回乱码（真机串口速率不匹配时的表现）。
+
+    python ftx1emu.py --baud 38400 --latency 0.002
+
+打印出的 /dev/pts/N 可直接作为 CAT 口；PTT 口用 "loop://"（pty 不支持 RTS）。
+运行中的模拟器会登记在临时目录里，GUI 的串口列表中可以直接选择。
+"""
+
+import argparse
+import glob
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+from ftx1cat import DISPLAY_TEXT
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None
+
+
+# 模拟器 pty 的登记文件：<目录>/ftx1emu-<pid>-<序号>.port，内容为 pty 路径
+REGISTRY_DIR = tempfile.gettempdir()
+_REGISTRY_GLOB = "ftx1emu-*.port"
+
+# 上电时的面板状态：命令 key -> 参数（应答 = key + 参数 + ";"）
+DEFAULT_STATE = {
+    "FA": "014074000",
+    "FB": "007074000",
+    "MD0": "C",
+    "MD1": "2",
+    "GT0": "4",
+    "GT1": "4",
+    "PC": "1010",
+    "PA0": "1",
+    "PA1": "0",
+    "PA2": "0",
+    "BP00": "000",
+    "BP01": "100",
+    "MX": "0",
+    "AI": "0",
+}
+
+RADIO_ID = "0840"
+
+# 表头 1..8 的基准读数（0..255），RM1 另按频率叠加 signals 中的信号
+DEFAULT_METERS = {1: 30, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0, 7: 190, 8: 0}
+
+
+def emulator_ports() -> List[str]:
+    """本机正在运行的模拟器 pty 路径（按登记顺序）。"""
+    ports = []
+    for path in sorted(glob.glob(os.path.join(REGISTRY_DIR, _REGISTRY_GLOB))):
+        try:
+            pid = int(os.path.basename(path).split("-")[1])
+            os.kill(pid, 0)
+            with open(path, encoding="utf-8") as f:
+                port = f.read().strip()
+        except (ValueError, IndexError, OSError):
+            continue
+        if os.path.exists(port):
+            ports.append(port)
+    return ports
+
+
+class FTX1Emulator:
+    """
+    一台模拟电台。创建后 port 即可被 FTX1Cat 打开：
+
+        with FTX1Emulator(baudrate=38400, latency_s=0.002) as emu:
+            cat = FTX1Cat(port=emu.port, baudrate=38400, port2="loop://")
+
+    state / meters / memories 可以在运行中直接修改；
+    signals 为 [(频率 Hz, RM1 读数)]，调到信号 ±bandwidth_hz 内时 RM1 读到该值；
+    log 保存最近收到的命令（不含 ";"）。
+    """
+
+    _registry_seq = 0
+
+    def __init__(
+        self,
+        baudrate: int = 38400,
+        latency_s: float = 0.002,
+        state: Optional[Dict[str, str]] = None,
+        register: bool = True,
+        seed: Optional[int] = None,
+    ):
+        if termios is None or not hasattr(os, "openpty"):
+            raise RuntimeError(DISPLAY_TEXT["err_emulator_posix"])
+        self.baudrate = baudrate
+        self.latency_s = latency_s
+        self.state = dict(DEFAULT_STATE)
+        if state:
+            self.state.update(state)
+        self.meters = dict(DEFAULT_METERS)
+        self.signals: List[tuple] = []
+        self.bandwidth_hz = 1500
+        self.memories: Dict[int, str] = {}
+        self.tags: Dict[int, str] = {}
+        self.log = deque(maxlen=4096)
+        self.commands = 0
+        self._rng = random.Random(seed)
+        self._byte_s = 10.0 / baudrate
+        self._speed = getattr(termios, f"B{baudrate}", None)
+        # 按长度从长到短匹配，BP00 先于 BP0x、MD0 先于 MD
+        self._keys = sorted(self.state, key=len, reverse=True)
+
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._master)
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+        self._stop = threading.Event()
+        self._registry = None
+        if register:
+            FTX1Emulator._registry_seq += 1
+            self._registry = os.path.join(REGISTRY_DIR, f"ftx1emu-{os.getpid()}-{FTX1Emulator._registry_seq}.port")
+            with open(self._registry, "w", encoding="utf-8") as f:
+                f.write(self.port)
+        self._thread = threading.Thread(target=self._run, name="ftx1-emulator", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        if self._registry:
+            try:
+                os.unlink(self._registry)
+            except OSError:
+                pass
+        for fd in (self._master, self._slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def push(self, key: str) -> None:
+        """AI 打开时主动上报 key 的当前值（模拟旋钮/面板操作）。"""
+        if self.state.get("AI") == "1" and key in self.state:
+            self._write(f"{key}{self.state[key]};".encode("ascii"))
+
+    # ---------- 内部 ----------
+
+    def _run(self) -> None:
+        buf = b""
+        while not self._stop.is_set():
+            try:
+                data = os.read(self._master, 256)
+            except OSError:
+                return
+            if not data:
+                return
+            buf += data
+            while b";" in buf:
+                frame, buf = buf.split(b";", 1)
+                # 命令在线路上的时间 + 电台处理时间
+                time.sleep(self._byte_s * (len(frame) + 1) + self.latency_s)
+                cmd = frame.decode("ascii", errors="replace")
+                self.log.append(cmd)
+                self.commands += 1
+                reply = self._handle(cmd)
+                if reply:
+                    self._write(reply.encode("ascii"))
+
+    def _write(self, reply: bytes) -> None:
+        if self._speed is not None and not self._baud_matches():
+            reply = bytes(self._rng.randrange(128, 256) for _ in reply)
+        time.sleep(self._byte_s * len(reply))
+        try:
+            os.write(self._master, reply)
+        except OSError:
+            pass
+
+    def _baud_matches(self) -> bool:
+        try:
+            return termios.tcgetattr(self._master)[4] == self._speed
+        except termios.error:
+            return True
+
+    def _handle(self, cmd: str) -> Optional[str]:
+        if cmd == "ID":
+            return f"ID{RADIO_ID};"
+        if cmd.startswith("RM"):
+            if len(cmd) == 3 and cmd[2].isdigit() and int(cmd[2]) in self.meters:
+                return f"RM{cmd[2]}{self._meter(int(cmd[2])):03d}000;"
+            return "?;"
+        if cmd.startswith(("MR", "MW", "MT")):
+            return self._memory(cmd)
+        for key in self._keys:
+            if not cmd.startswith(key):
+                continue
+            value = cmd[len(key):]
+            if not value:
+                return f"{key}{self.state[key]};"
+            if len(value) == len(self.state[key]) and value.isalnum():
+                self.state[key] = value
+                return None
+            return "?;"
+        return "?;"
+
+    def _meter(self, meter_id: int) -> int:
+        base = self.meters[meter_id]
+        if meter_id == 1:
+            freq = int(self.state["FA"])
+            for sig_hz, level in self.signals:
+                if abs(freq - sig_hz) <= self.bandwidth_hz:
+                    base = max(base, level)
+            base += self._rng.randint(-3, 3)
+        return max(0, min(255, base))
+
+    def _memory(self, cmd: str) -> Optional[str]:
+        ch_text = cmd[2:7]
+        if len(ch_text) != 5 or not ch_text.isdigit():
+            return "?;"
+        ch = int(ch_text)
+        if cmd.startswith("MR"):
+            if len(cmd) != 7 or ch not in self.memories:
+                return "?;"
+            return f"MR{ch_text}{self.memories[ch]};"
+        if cmd.startswith("MW"):
+            if len(cmd) != 29:
+                return "?;"
+            self.memories[ch] = cmd[7:]
+            return None
+        if len(cmd) == 7:
+            return f"MT{ch_text}{self.tags.get(ch, ' ' * 12)};"
+        if len(cmd) != 19:
+            return "?;"
+        self.tags[ch] = cmd[7:]
+        return None
+
+
+# ==========================
+# 命令行
+# ==========================
+
+def main():
+    ap = argparse.ArgumentParser(description="Virtual FTX-1 on a pseudo-terminal")
+    ap.add_argument("--baud", type=int, default=38400)
+    ap.add_argument("--latency", type=float, default=0.002, help="per-command processing time, s")
+    args = ap.parse_args()
+
+    emu = FTX1Emulator(baudrate=args.baud, latency_s=args.latency)
+    print(DISPLAY_TEXT["log_emulator_port_fmt"].format(port=emu.port, baud=args.baud))
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emu.close()
+
+
+if __name__ == "__main__":
+    main()
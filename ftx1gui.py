@@ -1,7 +1,7 @@
 import os
 import queue
-import socket
 import threading
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 
@@ -9,7 +9,10 @@ import matplotlib
 
 matplotlib.use("TkAgg")
 
-from ftx1cat import FTX1Cat
+from ftx1cat import FTX1Cat, MeterPollPolicy, auto_baud, meter_histories
+from ftx1d import FTX1Client
+from ftx1emu import emulator_ports
+from ftx1rigctl import RigctlTCPServer
 from i18n import I18N_TEXT as I18N_TEXT
 from serial.tools import list_ports
 
@@ -47,217 +50,8 @@ COMMON_BAUD_RATES = [
     "576000",
 ]
 DEFAULT_BAUD_RATE = "38400"
-
-
-# ==========================
-# Hamlib net rigctl 服务器
-# ==========================
-
-
-class RigctlTCPServer(threading.Thread):
-    def __init__(self, cat: FTX1Cat, host: str = "127.0.0.1", port: int = 4532, on_activity=None):
-        super().__init__(daemon=True)
-        self.cat = cat
-        self.host = host
-        self.port = port
-        self.on_activity = on_activity
-        self._stop_event = threading.Event()
-        self._server_sock = None
-
-    def stop(self):
-        self._stop_event.set()
-        if self._server_sock:
-            try:
-                self._server_sock.close()
-            except Exception:
-                pass
-
-    def run(self):
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._server_sock = sock
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        try:
-            sock.bind((self.host, self.port))
-            sock.listen(5)
-        except OSError as e:
-            print(DISPLAY_TEXT["log_rigctl_listen_failed_fmt"].format(e=e))
-            return
-
-        print(DISPLAY_TEXT["log_rigctl_listen_fmt"].format(host=self.host, port=self.port))
-
-        while not self._stop_event.is_set():
-            try:
-                sock.settimeout(1.0)
-                try:
-                    conn, addr = sock.accept()
-                except socket.timeout:
-                    continue
-            except OSError:
-                break
-
-            print(DISPLAY_TEXT["log_rigctl_client_fmt"].format(addr=addr))
-            th = threading.Thread(target=self.handle_client, args=(conn,), daemon=True)
-            th.start()
-
-        print(DISPLAY_TEXT["log_rigctl_exit"])
-
-    def handle_client(self, conn: socket.socket):
-        with conn:
-            conn.settimeout(20)
-            f = conn.makefile("rwb", buffering=0)
-            while not self._stop_event.is_set():
-                try:
-                    line = f.readline()
-                except Exception:
-                    break
-                if not line:
-                    break
-                try:
-                    text = line.decode("utf-8", errors="ignore").strip()
-                except Exception:
-                    continue
-                if not text:
-                    continue
-
-                parts = text.split()
-                cmd = parts[0]
-
-                if cmd.lower() == "q":
-                    break
-
-                resp = self._handle_command(parts)
-                try:
-                    f.write(resp.encode("utf-8"))
-                except Exception:
-                    break
-
-    def _handle_command(self, parts):
-        def ok():
-            return "RPRT 0\n"
-
-        def err():
-            return "RPRT -1\n"
-
-        cmd = parts[0]
-
-        if cmd.startswith("\\"):
-            long_cmd = cmd.lower()
-            if long_cmd == "\\get_powerstat":
-                return "1\n"
-            if long_cmd == "\\chk_vfo":
-                return "0\n"
-            if long_cmd == "\\dump_state":
-                lines = [
-                    "1",
-                    "6",
-                    "0",
-                    "0 0 0 0 0 0 0",
-                    "0 0 0 0 0 0 0",
-                    "0 0",
-                    "0 0",
-                    "0",
-                    "0",
-                    "0",
-                    "0",
-                    "0 0 0 0 0 0 0 0",
-                    "0 0 0 0 0 0 0 0",
-                    "0x00000000",
-                    "0x00000000",
-                    "0x00000000",
-                    "0x00000000",
-                    "0x00000000",
-                    "0x00000000",
-                    "vfo_opts=0x00000000",
-                    "ptt_type=0x00000001",
-                    "targetable_vfo=0x00000000",
-                    "has_set_vfo=0",
-                    "has_get_vfo=0",
-                    "has_set_freq=1",
-                    "has_get_freq=1",
-                    "has_set_conf=0",
-                    "has_get_conf=0",
-                    "has_power2mW=0",
-                    "has_mw2power=0",
-                    "timeout=0",
-                    "rig_model=6",
-                    "rigctl_version=4.5.5",
-                    "agc_levels=",
-                    "done",
-                    "0",
-                ]
-                return "\n".join(lines) + "\n"
-            return err()
-
-        if cmd == "f":
-            freq_hz, _ = self.cat.get_freq()
-            if freq_hz is None:
-                return err()
-            return f"{freq_hz}\n"
-
-        if cmd == "F":
-            if len(parts) < 2:
-                return err()
-            try:
-                freq_hz = int(float(parts[1]))
-            except ValueError:
-                return err()
-            try:
-                self.cat.set_freq(freq_hz)
-                if self.on_activity:
-                    try:
-                        self.on_activity()
-                    except Exception:
-                        pass
-                return ok()
-            except Exception:
-                return err()
-
-        if cmd == "m":
-            mode_name, _ = self.cat.get_mode(main=True)
-            if mode_name is None:
-                return err()
-            return f"{mode_name}\n2400\n"
-
-        if cmd == "M":
-            if len(parts) < 2:
-                return err()
-            mode_name = parts[1].upper()
-            try:
-                self.cat.set_mode(mode_name, main=True)
-                if self.on_activity:
-                    try:
-                        self.on_activity()
-                    except Exception:
-                        pass
-                return ok()
-            except Exception:
-                return err()
-
-        if cmd == "t":
-            try:
-                on = self.cat.get_rts()
-            except Exception:
-                return err()
-            return f"{1 if on else 0}\n"
-
-        if cmd == "T":
-            if len(parts) < 2:
-                return err()
-            v = parts[1].strip()
-            if v not in ("0", "1"):
-                return err()
-            try:
-                self.cat.set_rts(v == "1")
-                if self.on_activity:
-                    try:
-                        self.on_activity()
-                    except Exception:
-                        pass
-                return ok()
-            except Exception:
-                return err()
-
-        return err()
+# CAT 口波特率选 auto：连接时探测（记住每个串口上次的结果）
+AUTO_BAUD = "auto"
 
 
 # ==========================
@@ -276,14 +70,9 @@ class FTX1TkApp:
         self.tcp_port_var = tk.IntVar(value=4532)
         self.cat_port_var = tk.StringVar()
         self.ptt_port_var = tk.StringVar()
-        self.cat_baud_var = tk.StringVar(value=DEFAULT_BAUD_RATE)
+        self.cat_baud_var = tk.StringVar(value=AUTO_BAUD)
         self.ptt_baud_var = tk.StringVar(value=DEFAULT_BAUD_RATE)
-        self.refresh_rate_var = tk.DoubleVar(value=1.0)
-        self._meter_hz = 1.0
-        try:
-            self.refresh_rate_var.trace_add("write", lambda *_: self._on_refresh_rate_changed())
-        except Exception:
-            pass
+        self.auto_info_var = tk.BooleanVar(value=False)
 
         self.status_var = tk.StringVar(value=DISPLAY_TEXT.get("status_disconnected", "Disconnected"))
         self.rigctl_status_var = tk.StringVar(value=DISPLAY_TEXT.get("rigctl_stop", "Rigctl stopped"))
@@ -300,6 +89,8 @@ class FTX1TkApp:
         self._meter_stop = None
         self._meter_queue = None
         self._meter_thread = None
+        # 各表头的历史读数（MeterHistory），表头线程写入，GUI / 日志 / 报警直接读视图
+        self.meter_history = meter_histories()
 
         self._build_gui()
         self.apply_language()
@@ -311,12 +102,6 @@ class FTX1TkApp:
     def _get_cat(self) -> FTX1Cat | None:
         return self.cat
 
-    def _on_refresh_rate_changed(self):
-        try:
-            self._meter_hz = float(self.refresh_rate_var.get())
-        except Exception:
-            self._meter_hz = 1.0
-
     def on_language_changed(self, event=None):
         lang = (self.lang_var.get() or "").strip()
         if lang in I18N_TEXT:
@@ -350,6 +135,7 @@ class FTX1TkApp:
             ("btn_connect", "btn_connect"),
             ("btn_disconnect", "btn_disconnect"),
             ("btn_full_read", "btn_full_read"),
+            ("chk_auto_info", "chk_auto_info"),
         ]:
             widget = getattr(self, attr, None)
             if widget is not None:
@@ -412,13 +198,13 @@ class FTX1TkApp:
         self.lbl_baud1.pack(side="left")
         self.cat_baud_combo = ttk.Combobox(
             top,
-            values=COMMON_BAUD_RATES,
+            values=[AUTO_BAUD] + COMMON_BAUD_RATES,
             width=8,
             state="readonly",
             textvariable=self.cat_baud_var,
         )
         self.cat_baud_combo.pack(side="left", padx=4)
-        self.cat_baud_combo.set(DEFAULT_BAUD_RATE)
+        self.cat_baud_combo.set(AUTO_BAUD)
 
         self.lbl_ptt_port = ttk.Label(top, text=_T("label_ptt_port"))
         self.lbl_ptt_port.pack(side="left", padx=(10, 2))
@@ -450,6 +236,13 @@ class FTX1TkApp:
         self.btn_disconnect.pack(side="left", padx=4)
         self.btn_full_read = ttk.Button(top, text=_T("btn_full_read"), command=self.on_full_read, state="disabled")
         self.btn_full_read.pack(side="left", padx=(12, 4))
+        self.chk_auto_info = ttk.Checkbutton(
+            top,
+            text=_T("chk_auto_info"),
+            variable=self.auto_info_var,
+            command=self.on_auto_info_toggled,
+        )
+        self.chk_auto_info.pack(side="left", padx=4)
 
         lang_frame = ttk.Frame(top)
         lang_frame.pack(side="right", padx=(8, 0))
@@ -493,7 +286,7 @@ class FTX1TkApp:
         bottom = ttk.Frame(self.master, padding=6)
         bottom.pack(side="top", fill="both", expand=True)
 
-        # Meters (meter refresh rate control removed — default 1 Hz)
+        # Meters (polling rates per meter and RX/TX state: MeterPollPolicy)
         self.meters_panel = MetersPanel(bottom, _T)
         self.meters_panel.pack(side="left", fill="both", expand=True, padx=(12, 0))
 
@@ -508,9 +301,13 @@ class FTX1TkApp:
         except Exception:
             ports = []
         devices = [info.device for info in ports]
+        # 本机运行的 ftx1emu 模拟器（pty 没有 RTS，PTT 口用 loop://）和 ftx1d 代理
+        emulators = emulator_ports()
+        cat_devices = devices + emulators + ["ftx1d"]
+        ptt_devices = devices + (["loop://"] if emulators else [])
         try:
-            self.port_combo.configure(values=devices)
-            self.port2_combo.configure(values=devices)
+            self.port_combo.configure(values=cat_devices)
+            self.port2_combo.configure(values=ptt_devices)
         except Exception:
             pass
 
@@ -518,19 +315,23 @@ class FTX1TkApp:
         ptt_preferred = self._find_port_by_keyword(ports, "standard com port")
         if not cat_preferred and devices:
             cat_preferred = devices[0]
+        elif not cat_preferred and emulators:
+            cat_preferred = emulators[0]
         if not ptt_preferred:
             if len(devices) > 1:
                 ptt_preferred = devices[1]
             elif devices:
                 ptt_preferred = devices[0]
+            elif emulators:
+                ptt_preferred = "loop://"
 
         current_cat = (self.cat_port_var.get() or "").strip()
         current_ptt = (self.ptt_port_var.get() or "").strip()
-        if cat_preferred and (not current_cat or current_cat not in devices):
+        if cat_preferred and (not current_cat or current_cat not in cat_devices):
             self.cat_port_var.set(cat_preferred)
         elif not cat_preferred and not current_cat:
             self.cat_port_var.set("")
-        if ptt_preferred and (not current_ptt or current_ptt not in devices):
+        if ptt_preferred and (not current_ptt or current_ptt not in ptt_devices):
             self.ptt_port_var.set(ptt_preferred)
         elif not ptt_preferred and not current_ptt:
             self.ptt_port_var.set("")
@@ -567,11 +368,14 @@ class FTX1TkApp:
         self._scan_com_ports()
         port = (self.cat_port_var.get() or "").strip()
         port2 = (self.ptt_port_var.get() or "").strip()
-        if not port or not port2:
+        # "ftx1d" / "ftx1d:<地址>"：串口由 ftx1d 代理进程持有，通过它连接
+        via_broker = port == "ftx1d" or port.startswith("ftx1d:")
+        if not port or not (port2 or via_broker):
             messagebox.showwarning(DISPLAY_TEXT.get("error_title", "Error"), DISPLAY_TEXT.get("need_cat_and_ptt_ports", "Need CAT and PTT ports"))
             return
+        baud_text = (self.cat_baud_var.get() or DEFAULT_BAUD_RATE).strip()
         try:
-            baud = int((self.cat_baud_var.get() or DEFAULT_BAUD_RATE).strip())
+            baud = 0 if baud_text == AUTO_BAUD else int(baud_text)
         except ValueError:
             messagebox.showwarning(DISPLAY_TEXT.get("error_title", "Error"), DISPLAY_TEXT.get("cat_baud_must_int", "CAT baud must be int"))
             return
@@ -581,12 +385,56 @@ class FTX1TkApp:
             messagebox.showwarning(DISPLAY_TEXT.get("error_title", "Error"), DISPLAY_TEXT.get("ptt_baud_must_int", "PTT baud must be int"))
             return
 
+        if baud_text == AUTO_BAUD and not via_broker:
+            # 探测可能要试到低速率，耗时数秒：放到后台线程，结果回到 Tk 线程再连接
+            self.btn_connect.configure(state="disabled")
+            self.status_var.set(_T("status_baud_probing_fmt").format(port=port))
+
+            def probe():
+                try:
+                    found = auto_baud(port)
+                except Exception:
+                    found = None
+                try:
+                    self.master.after(0, lambda: self._on_baud_probed(port, found, port2, baud2))
+                except Exception:
+                    pass
+
+            threading.Thread(target=probe, name="ftx1-baud-probe", daemon=True).start()
+            return
+        self._connect(port, baud, port2, baud2, via_broker)
+
+    def _on_baud_probed(self, port: str, baud, port2: str, baud2: int):
+        self.btn_connect.configure(state="normal")
+        if baud is None:
+            self.status_var.set(DISPLAY_TEXT.get("status_disconnected", "Disconnected"))
+            messagebox.showerror(
+                DISPLAY_TEXT.get("connect_failed", "Connect failed"),
+                DISPLAY_TEXT.get("err_baud_probe_failed_fmt", "No working baud rate on {port}").format(port=port),
+            )
+            return
+        self._connect(port, baud, port2, baud2, via_broker=False)
+
+    def _connect(self, port: str, baud: int, port2: str, baud2: int, via_broker: bool):
         try:
-            self.cat = FTX1Cat(port=port, baudrate=baud, port2=port2, baudrate2=baud2, timeout=0.3)
+            if via_broker:
+                self.cat = FTX1Client(port[len("ftx1d:"):] or None)
+                if bool(self.auto_info_var.get()) != self.cat.auto_info:
+                    self.cat.set_auto_info(bool(self.auto_info_var.get()))
+            else:
+                self.cat = FTX1Cat(
+                    port=port,
+                    baudrate=baud,
+                    port2=port2,
+                    baudrate2=baud2,
+                    timeout=0.3,
+                    auto_info=bool(self.auto_info_var.get()),
+                )
         except Exception as e:
             self.cat = None
             messagebox.showerror(DISPLAY_TEXT.get("connect_failed", "Connect failed"), str(e))
             return
+        self.cat.add_listener(self._on_cat_push)
 
         self.status_var.set(DISPLAY_TEXT.get("status_connected_fmt", "Connected {port}/{baud} {port2}/{baud2}").format(port=port, baud=baud, port2=port2, baud2=baud2))
         self.btn_connect.configure(state="disabled")
@@ -637,11 +485,43 @@ class FTX1TkApp:
             pass
         if self.meters_panel:
             self.meters_panel.clear()
+        for hist in self.meter_history.values():
+            hist.clear()
 
     def on_full_read(self):
         self._schedule_full_read(delay_ms=0)
 
+    def on_auto_info_toggled(self):
+        cat = self.cat
+        if cat is None:
+            return
+        try:
+            cat.set_auto_info(bool(self.auto_info_var.get()))
+        except Exception as e:
+            messagebox.showerror(DISPLAY_TEXT.get("set_failed", "Set failed"), str(e))
+
+    def _on_cat_push(self, update: dict):
+        # 读线程回调，切回 Tk 线程再动界面
+        try:
+            self.master.after(0, lambda: self._apply_status_update(update))
+        except Exception:
+            pass
+
+    def _apply_status_update(self, update: dict):
+        if "link_up" in update:
+            # 串口断开后 FTX1Cat 自行重连，rigctl 服务保持运行
+            if update["link_up"]:
+                self.status_var.set(_T("status_link_restored_fmt").format(seconds=update.get("recovery_s") or 0.0))
+            else:
+                self.status_var.set(_T("status_link_lost"))
+            return
+        if self.freq_mode_panel and ("freq_hz" in update or "mode_name" in update):
+            self.freq_mode_panel.sync_full_read(update.get("freq_hz"), update.get("mode_name"))
+
     def on_network_activity(self):
+        # AI 模式下频率/模式变化会主动上报，不需要再整机读取
+        if self.cat is not None and self.cat.auto_info:
+            return
         try:
             self.master.after(0, lambda: self._schedule_full_read(delay_ms=1000))
         except Exception:
@@ -667,45 +547,19 @@ class FTX1TkApp:
 
         def worker():
             cat = self.cat
-            result = {}
-            try:
-                result["freq_hz"], _ = cat.get_freq()
-            except Exception:
-                result["freq_hz"] = None
+            bands = self.preamp_agc_panel.get_preamp_bands() if self.preamp_agc_panel else []
+            # 全部读取项一次批量发出，只占一次往返
             try:
-                result["mode_name"], _ = cat.get_mode(main=True)
+                result = cat.read_status(bands)
             except Exception:
-                result["mode_name"] = None
+                result = {"preamp": {band: None for band in bands}}
             try:
                 result["rts"] = bool(cat.get_rts())
             except Exception:
                 result["rts"] = None
 
-            result["preamp"] = {}
-            bands = self.preamp_agc_panel.get_preamp_bands() if self.preamp_agc_panel else []
-            for band in bands:
-                try:
-                    level, _ = cat.get_preamp(band)
-                except Exception:
-                    level = None
-                result["preamp"][band] = level
-
-            try:
-                result["agc_name"], _ = cat.get_agc(main=True)
-            except Exception:
-                result["agc_name"] = None
-
-            try:
-                result["power_dev"], result["power_watts"], _ = cat.get_power_control()
-            except Exception:
-                result["power_dev"], result["power_watts"] = None, None
-
-            try:
-                enabled, freq_hz, _ = cat.get_manual_notch(main=True)
-            except Exception:
-                enabled, freq_hz = None, None
+            enabled = result.get("notch_enabled")
             result["notch_enabled"] = bool(enabled) if enabled is not None else False
-            result["notch_freq_hz"] = freq_hz
 
             try:
                 self.master.after(0, lambda: self._apply_full_read_result(result))
@@ -742,20 +596,25 @@ class FTX1TkApp:
             return
 
         def worker():
+            # 只读当前收/发状态下有意义的表头，各按自己的间隔（见 MeterPollPolicy）
+            policy = MeterPollPolicy()
             while not self._meter_stop.is_set():
-                try:
-                    hz = float(self._meter_hz)
-                except Exception:
-                    hz = 1.0
-                hz = max(min(hz, 5.0), 0.1)
-                sleep_s = 1.0 / hz
-
                 cat = self.cat
                 if cat is None:
                     self._meter_stop.wait(0.2)
                     continue
                 try:
-                    data = cat.read_all_meters()
+                    ids = policy.due(cat.is_transmitting())
+                    if not ids:
+                        self._meter_stop.wait(policy.next_due())
+                        continue
+                    fresh = cat.read_meters(ids)
+                    now = time.monotonic()
+                    for name, item in fresh.items():
+                        hist = self.meter_history.get(name)
+                        if hist is not None:
+                            hist.append(item["raw"], now)
+                    data = policy.update(ids, fresh, now)
                 except Exception:
                     data = None
                 try:
@@ -764,7 +623,7 @@ class FTX1TkApp:
                     self._meter_queue.put_nowait(data)
                 except Exception:
                     pass
-                self._meter_stop.wait(sleep_s)
+                self._meter_stop.wait(policy.next_due() if data is not None else 1.0)
 
         self._meter_thread = threading.Thread(target=worker, daemon=True)
         self._meter_thread.start()
@@ -0,0 +1,259 @@
+"""
+ftx1mem：FTX-1 存储器（Memory Channel）批量读写。
+
+命令格式按 FT-710 系列：
+    MR P1(5 通道号) ;                                   读取
+    MR/MW P1(5) P2(9 频率) P3(±4 CLAR 偏移) P4(RX CLAR) P5(TX CLAR)
+          P6(模式) P7(通道类型) P8(CTCSS/DCS) P9(00) P10(SHIFT) ;
+    MT P1(5) ;  /  MT P1(5) P2(12 字符标签) ;          标签读取 / 写入
+空通道对 MR 回 "?;"。
+
+所有查询一次排进调度队列、流水线发出，写入按组一次写出，
+下载/上传 99 个通道只需几秒；可导出/导入 CSV，用于在多台电台之间同步存储器：
+
+    python ftx1mem.py --port COM11 --port2 COM12 export memories.csv
+    python ftx1mem.py --port COM21 --port2 COM22 import memories.csv --verify
+"""
+
+import argparse
+import csv
+import time
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from ftx1cat import (
+    DISPLAY_TEXT,
+    MODE_TO_P2,
+    P2_TO_MODE,
+    PRIO_FULL_READ,
+    FTX1Cat,
+)
+
+
+MEMORY_CHANNELS = range(1, 100)
+TAG_LEN = 12
+
+# 上传时每组写入的通道数：一组在一次写入中发出，组间可以插入 PTT 等高优先级命令
+UPLOAD_GROUP = 10
+
+
+class MemoryChannel(NamedTuple):
+    channel: int
+    freq_hz: int
+    mode_name: str
+    clar_offset_hz: int = 0
+    rx_clar: bool = False
+    tx_clar: bool = False
+    ch_type: int = 1
+    tone_mode: int = 0
+    shift: int = 0
+    tag: str = ""
+
+
+CSV_FIELDS = MemoryChannel._fields
+
+_MODE_BY_BYTE = {ord(k): v for k, v in P2_TO_MODE.items()}
+
+
+# ==========================
+# 帧解析 / 构造
+# ==========================
+
+def _parse_mr(r: bytes) -> Optional[MemoryChannel]:
+    # MR ch(2:7) freq(7:16) clar(16:21) rx(21) tx(22) mode(23) type(24) tone(25) 00(26:28) shift(28) ;(29)
+    if len(r) != 30 or r[:2] != b"MR" or r[29:] != b";":
+        return None
+    ch, freq, clar = r[2:7], r[7:16], r[17:21]
+    if not (ch.isdigit() and freq.isdigit() and clar.isdigit() and r[16:17] in (b"+", b"-")):
+        return None
+    mode_name = _MODE_BY_BYTE.get(r[23])
+    flags = r[21:23] + r[24:26] + r[28:29]
+    if mode_name is None or not flags.isdigit():
+        return None
+    return MemoryChannel(
+        channel=int(ch),
+        freq_hz=int(freq),
+        mode_name=mode_name,
+        clar_offset_hz=int(clar) * (-1 if r[16:17] == b"-" else 1),
+        rx_clar=r[21:22] == b"1",
+        tx_clar=r[22:23] == b"1",
+        ch_type=int(r[24:25]),
+        tone_mode=int(r[25:26]),
+        shift=int(r[28:29]),
+    )
+
+
+def _parse_mt(r: bytes) -> Optional[str]:
+    # MT ch(2:7) tag(7:19) ;
+    if len(r) != 8 + TAG_LEN or r[:2] != b"MT" or not r[2:7].isdigit() or r[-1:] != b";":
+        return None
+    return r[7:-1].decode("ascii", errors="replace").rstrip()
+
+
+def _check_channel(ch: MemoryChannel) -> None:
+    if ch.channel not in MEMORY_CHANNELS:
+        raise ValueError(DISPLAY_TEXT["err_mem_channel_fmt"].format(channel=ch.channel))
+    if not (0 <= ch.freq_hz <= 999_999_999):
+        raise ValueError(DISPLAY_TEXT["err_mem_freq_fmt"].format(channel=ch.channel, freq_hz=ch.freq_hz))
+    if ch.mode_name.upper() not in MODE_TO_P2:
+        raise ValueError(DISPLAY_TEXT["err_invalid_mode_fmt"].format(mode_name=ch.mode_name))
+    if abs(ch.clar_offset_hz) > 9999:
+        raise ValueError(DISPLAY_TEXT["err_mem_clar_fmt"].format(channel=ch.channel))
+    # MW 里各占一位，多一位会把后面的字段整体错开
+    for field in ("ch_type", "tone_mode", "shift"):
+        value = getattr(ch, field)
+        if not isinstance(value, int) or not (0 <= value <= 9):
+            raise ValueError(DISPLAY_TEXT["err_mem_flag_fmt"].format(channel=ch.channel, field=field, value=value))
+    if len(ch.tag) > TAG_LEN or not ch.tag.isascii():
+        raise ValueError(DISPLAY_TEXT["err_mem_tag_fmt"].format(channel=ch.channel, n=TAG_LEN))
+
+
+def _mw_cmd(ch: MemoryChannel) -> Tuple[str, str, Tuple[str, ...]]:
+    """返回 (MW 命令, 对应的 MR 查询, 回读应接受的应答)。"""
+    body = (
+        f"{ch.channel:05d}{ch.freq_hz:09d}"
+        f"{'-' if ch.clar_offset_hz < 0 else '+'}{abs(ch.clar_offset_hz):04d}"
+        f"{int(ch.rx_clar)}{int(ch.tx_clar)}{MODE_TO_P2[ch.mode_name.upper()]}"
+        f"{ch.ch_type}{ch.tone_mode}00{ch.shift}"
+    )
+    return f"MW{body}", f"MR{ch.channel:05d}", (f"MR{body}",)
+
+
+def _mt_cmd(ch: MemoryChannel) -> Tuple[str, str, Tuple[str, ...]]:
+    cmd = f"MT{ch.channel:05d}{ch.tag:<{TAG_LEN}}"
+    return cmd, f"MT{ch.channel:05d}", (cmd,)
+
+
+# ==========================
+# 批量读写
+# ==========================
+
+class MemoryBank:
+    """
+    一台电台的存储器表：
+
+        bank = MemoryBank(cat)
+        bank.download()          # 读入全部通道
+        bank.to_csv("mem.csv")
+        other = MemoryBank(cat2)
+        other.from_csv("mem.csv")
+        other.upload(verify=True)
+
+    table 为 {通道号: MemoryChannel}，只含非空通道；
+    last_rate 为上一次下载/上传的 通道数/秒。
+    """
+
+    def __init__(self, cat: FTX1Cat):
+        self.cat = cat
+        self.table: Dict[int, MemoryChannel] = {}
+        self.last_rate = 0.0
+
+    def download(self, channels: Iterable[int] = MEMORY_CHANNELS, tags: bool = True) -> Dict[int, MemoryChannel]:
+        """MR（和 MT）全部一次排队、流水线读取，空通道跳过。"""
+        channels = list(channels)
+        cmds = [f"MR{n:05d}" for n in channels]
+        if tags:
+            cmds += [f"MT{n:05d}" for n in channels]
+        t0 = time.perf_counter()
+        resps = self.cat.query_raw(cmds, PRIO_FULL_READ)
+        elapsed = time.perf_counter() - t0
+
+        table = {}
+        for i, n in enumerate(channels):
+            ch = _parse_mr(resps[i])
+            if ch is None or ch.channel != n:
+                continue
+            if tags:
+                ch = ch._replace(tag=_parse_mt(resps[len(channels) + i]) or "")
+            table[n] = ch
+        self.table = table
+        self.last_rate = len(channels) / elapsed if elapsed > 0 else 0.0
+        return table
+
+    def upload(self, verify: bool = False, tags: bool = True) -> int:
+        """
+        把 table 写入电台，返回写入的通道数。
+        全部通道先校验，有错误时一个也不写；verify 时每组写完批量回读比对。
+        """
+        channels = [self.table[n] for n in sorted(self.table)]
+        for ch in channels:
+            _check_channel(ch)
+        t0 = time.perf_counter()
+        for i in range(0, len(channels), UPLOAD_GROUP):
+            cmds = []
+            for ch in channels[i:i + UPLOAD_GROUP]:
+                cmds.append(_mw_cmd(ch))
+                if tags:
+                    cmds.append(_mt_cmd(ch))
+            self.cat.commit_raw(cmds, verify)
+        elapsed = time.perf_counter() - t0
+        self.last_rate = len(channels) / elapsed if elapsed > 0 else 0.0
+        return len(channels)
+
+    def to_csv(self, path: str) -> None:
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            for n in sorted(self.table):
+                writer.writerow(self.table[n]._asdict())
+
+    def from_csv(self, path: str) -> Dict[int, MemoryChannel]:
+        table = {}
+        with open(path, newline="", encoding="utf-8") as f:
+            for line_no, row in enumerate(csv.DictReader(f), start=2):
+                try:
+                    ch = MemoryChannel(
+                        channel=int(row["channel"]),
+                        freq_hz=int(row["freq_hz"]),
+                        mode_name=row["mode_name"].strip().upper(),
+                        clar_offset_hz=int(row.get("clar_offset_hz") or 0),
+                        rx_clar=(row.get("rx_clar") or "").strip().lower() in ("1", "true"),
+                        tx_clar=(row.get("tx_clar") or "").strip().lower() in ("1", "true"),
+                        ch_type=int(row.get("ch_type") or 1),
+                        tone_mode=int(row.get("tone_mode") or 0),
+                        shift=int(row.get("shift") or 0),
+                        tag=(row.get("tag") or "").rstrip(),
+                    )
+                    _check_channel(ch)
+                except (KeyError, ValueError) as e:
+                    raise ValueError(DISPLAY_TEXT["err_mem_csv_fmt"].format(path=path, line=line_no, e=e)) from None
+                table[ch.channel] = ch
+        self.table = table
+        return table
+
+
+# ==========================
+# 命令行
+# ==========================
+
+def main():
+    ap = argparse.ArgumentParser(description="FTX-1 memory channel export/import")
+    ap.add_argument("--port", default="COM11", help="CAT port")
+    ap.add_argument("--baud", type=int, default=38400)
+    ap.add_argument("--port2", default="COM12", help="PTT (RTS) port")
+    ap.add_argument("--first", type=int, default=MEMORY_CHANNELS.start)
+    ap.add_argument("--last", type=int, default=MEMORY_CHANNELS.stop - 1)
+    ap.add_argument("--no-tags", action="store_true", help="skip MT channel tags")
+    sub = ap.add_subparsers(dest="action", required=True)
+    sub.add_parser("export").add_argument("csv")
+    imp = sub.add_parser("import")
+    imp.add_argument("csv")
+    imp.add_argument("--verify", action="store_true")
+    args = ap.parse_args()
+
+    cat = FTX1Cat(port=args.port, baudrate=args.baud, port2=args.port2, timeout=0.5)
+    try:
+        bank = MemoryBank(cat)
+        if args.action == "export":
+            bank.download(range(args.first, args.last + 1), tags=not args.no_tags)
+            bank.to_csv(args.csv)
+            n = len(bank.table)
+        else:
+            bank.from_csv(args.csv)
+            n = bank.upload(verify=args.verify, tags=not args.no_tags)
+        print(DISPLAY_TEXT["log_mem_done_fmt"].format(n=n, rate=bank.last_rate))
+    finally:
+        cat.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+ftx1rigctl：Hamlib NET rigctl 服务器，不依赖 Tk。
+
+WSJT-X / JTDX 等选 "Hamlib NET rigctl" 连到这里共享电台。
+GUI 和 ftx1d 都用它：
+
+    python ftx1d.py --port COM11 --port2 COM12 --rigctl-port 4532
+
+cat 可以是 FTX1Cat，也可以是 ftx1d.FTX1Client 等接口相同的对象。
+"""
+
+import socket
+import threading
+
+from ftx1cat import DISPLAY_TEXT, FTX1Cat
+
+
+class RigctlTCPServer(threading.Thread):
+    def __init__(self, cat: FTX1Cat, host: str = "127.0.0.1", port: int = 4532, on_activity=None):
+        super().__init__(daemon=True)
+        self.cat = cat
+        self.host = host
+        self.port = port
+        self.on_activity = on_activity
+        self._stop_event = threading.Event()
+        self._server_sock = None
+
+    def stop(self):
+        self._stop_event.set()
+        if self._server_sock:
+            try:
+                self._server_sock.close()
+            except Exception:
+                pass
+
+    def run(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server_sock = sock
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((self.host, self.port))
+            sock.listen(5)
+        except OSError as e:
+            print(DISPLAY_TEXT["log_rigctl_listen_failed_fmt"].format(e=e))
+            return
+
+        print(DISPLAY_TEXT["log_rigctl_listen_fmt"].format(host=self.host, port=self.port))
+
+        while not self._stop_event.is_set():
+            try:
+                sock.settimeout(1.0)
+                try:
+                    conn, addr = sock.accept()
+                except socket.timeout:
+                    continue
+            except OSError:
+                break
+
+            print(DISPLAY_TEXT["log_rigctl_client_fmt"].format(addr=addr))
+            th = threading.Thread(target=self.handle_client, args=(conn,), daemon=True)
+            th.start()
+
+        print(DISPLAY_TEXT["log_rigctl_exit"])
+
+    def handle_client(self, conn: socket.socket):
+        with conn:
+            conn.settimeout(20)
+            f = conn.makefile("rwb", buffering=0)
+            while not self._stop_event.is_set():
+                try:
+                    line = f.readline()
+                except Exception:
+                    break
+                if not line:
+                    break
+                try:
+                    text = line.decode("utf-8", errors="ignore").strip()
+                except Exception:
+                    continue
+                if not text:
+                    continue
+
+                parts = text.split()
+                cmd = parts[0]
+
+                if cmd.lower() == "q":
+                    break
+
+                resp = self._handle_command(parts)
+                try:
+                    f.write(resp.encode("utf-8"))
+                except Exception:
+                    break
+
+    def _handle_command(self, parts):
+        def ok():
+            return "RPRT 0\n"
+
+        def err():
+            return "RPRT -1\n"
+
+        cmd = parts[0]
+
+        if cmd.startswith("\\"):
+            long_cmd = cmd.lower()
+            if long_cmd == "\\get_powerstat":
+                return "1\n"
+            if long_cmd == "\\chk_vfo":
+                return "0\n"
+            if long_cmd == "\\dump_state":
+                lines = [
+                    "1",
+                    "6",
+                    "0",
+                    "0 0 0 0 0 0 0",
+                    "0 0 0 0 0 0 0",
+                    "0 0",
+                    "0 0",
+                    "0",
+                    "0",
+                    "0",
+                    "0",
+                    "0 0 0 0 0 0 0 0",
+                    "0 0 0 0 0 0 0 0",
+                    "0x00000000",
+                    "0x00000000",
+                    "0x00000000",
+                    "0x00000000",
+                    "0x00000000",
+                    "0x00000000",
+                    "vfo_opts=0x00000000",
+                    "ptt_type=0x00000001",
+                    "targetable_vfo=0x00000000",
+                    "has_set_vfo=0",
+                    "has_get_vfo=0",
+                    "has_set_freq=1",
+                    "has_get_freq=1",
+                    "has_set_conf=0",
+                    "has_get_conf=0",
+                    "has_power2mW=0",
+                    "has_mw2power=0",
+                    "timeout=0",
+                    "rig_model=6",
+                    "rigctl_version=4.5.5",
+                    "agc_levels=",
+                    "done",
+                    "0",
+                ]
+                return "\n".join(lines) + "\n"
+            return err()
+
+        if cmd == "f":
+            freq_hz, _ = self.cat.get_freq()
+            if freq_hz is None:
+                return err()
+            return f"{freq_hz}\n"
+
+        if cmd == "F":
+            if len(parts) < 2:
+                return err()
+            try:
+                freq_hz = int(float(parts[1]))
+            except ValueError:
+                return err()
+            try:
+                self.cat.set_freq(freq_hz)
+                if self.on_activity:
+                    try:
+                        self.on_activity()
+                    except Exception:
+                        pass
+                return ok()
+            except Exception:
+                return err()
+
+        if cmd == "m":
+            mode_name, _ = self.cat.get_mode(main=True)
+            if mode_name is None:
+                return err()
+            return f"{mode_name}\n2400\n"
+
+        if cmd == "M":
+            if len(parts) < 2:
+                return err()
+            mode_name = parts[1].upper()
+            try:
+                self.cat.set_mode(mode_name, main=True)
+                if self.on_activity:
+                    try:
+                        self.on_activity()
+                    except Exception:
+                        pass
+                return ok()
+            except Exception:
+                return err()
+
+        if cmd == "t":
+            try:
+                on = self.cat.get_rts()
+            except Exception:
+                return err()
+            return f"{1 if on else 0}\n"
+
+        if cmd == "T":
+            if len(parts) < 2:
+                return err()
+            v = parts[1].strip()
+            if v not in ("0", "1"):
+                return err()
+            try:
+                self.cat.set_rts(v == "1")
+                if self.on_activity:
+                    try:
+                        self.on_activity()
+                    except Exception:
+                        pass
+                return ok()
+            except Exception:
+                return err()
+
+        return err()
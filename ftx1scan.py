@@ -0,0 +1,159 @@
+"""
+ftx1scan：频段扫描，记录 S 表（或其他 meter）随频率的变化。
+
+每一步 = FTX1Cat.tune_and_read_meter()：改 MAIN 频率 (FA set) + 读一次 RMn。
+FA 不回应答，RM 的应答不等：第 i 步的 RMn 排队后紧接着发第 i+1 步的 FA，
+电台按顺序处理，读到的仍是第 i 步频率上的值；在途查询由 CatScheduler 限制在 depth 条以内。
+dwell_s > 0 时从 FA 写出起至少等 dwell_s 再读表头（AGC / 表头稳定时间）。
+
+结果为 NumPy 结构化数组（SCAN_DTYPE），边扫边写入 .npy（memmap），中途中断也保留已扫部分：
+
+    python ftx1scan.py --port COM11 --port2 COM12 --start 7000000 --stop 7200000 --step 500 --out 40m.npy
+"""
+
+import argparse
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+import numpy as np
+
+from ftx1cat import (
+    DISPLAY_TEXT,
+    PRIO_FULL_READ,
+    FTX1Cat,
+)
+
+
+# 每步一行：t 为 RM 应答到达时刻（相对扫描开始，秒）；未读到的 raw 为 -1，value 为 NaN
+SCAN_DTYPE = np.dtype(
+    [
+        ("t", "f8"),
+        ("freq_hz", "i8"),
+        ("raw", "i2"),
+        ("value", "f4"),
+    ]
+)
+
+# 最多提前排队的步数；排得太多 stop() 后还要等队列里的命令发完
+SCAN_WINDOW = 16
+
+# 每扫这么多步把 memmap 刷到磁盘一次
+FLUSH_EVERY = 256
+
+
+def scan_freqs(start_hz: int, stop_hz: int, step_hz: int) -> np.ndarray:
+    """start..stop（含 stop）按 step 的频率表。"""
+    if step_hz <= 0 or start_hz < 0 or stop_hz < start_hz or stop_hz > 999_999_999:
+        raise ValueError(DISPLAY_TEXT["err_scan_range_fmt"].format(start=start_hz, stop=stop_hz, step=step_hz))
+    return np.arange(start_hz, stop_hz + 1, step_hz, dtype=np.int64)
+
+
+class BandScan:
+    """
+    在一个 FTX1Cat 上扫描一段频率：
+
+        scan = BandScan(cat, 7_000_000, 7_200_000, 500, dwell_s=0.02, path="40m.npy")
+        data = scan.run()
+        print(scan.steps_per_s)
+
+    run() 阻塞直到扫完或 stop()；on_step(i, row) 在扫描线程里按步调用（用于进度显示）。
+    扫描结束后频率停在最后一步，缓存里的 FA 同步更新。
+    """
+
+    def __init__(
+        self,
+        cat: FTX1Cat,
+        start_hz: int,
+        stop_hz: int,
+        step_hz: int,
+        dwell_s: float = 0.0,
+        meter_id: int = 1,
+        path: Optional[str] = None,
+        on_step: Optional[Callable[[int, np.void], None]] = None,
+    ):
+        self.cat = cat
+        self.freqs = scan_freqs(start_hz, stop_hz, step_hz)
+        self.dwell_s = max(0.0, dwell_s)
+        self.meter_id = meter_id
+        self.path = path
+        self.on_step = on_step
+        self.steps_done = 0
+        self.steps_per_s = 0.0
+        self._stop = threading.Event()
+        if path:
+            self.data = np.lib.format.open_memmap(path, mode="w+", dtype=SCAN_DTYPE, shape=self.freqs.shape)
+        else:
+            self.data = np.zeros(self.freqs.shape, dtype=SCAN_DTYPE)
+        self.data["freq_hz"] = self.freqs
+        self.data["raw"] = -1
+        self.data["value"] = np.nan
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def run(self) -> np.ndarray:
+        pending = deque()   # (步号, 表头读数 Future)
+        t0 = time.perf_counter()
+        try:
+            for i, freq_hz in enumerate(self.freqs):
+                if self._stop.is_set():
+                    break
+                fut = self.cat.tune_and_read_meter(int(freq_hz), self.meter_id, self.dwell_s, PRIO_FULL_READ)
+                pending.append((i, fut))
+                while pending and (len(pending) >= SCAN_WINDOW or pending[0][1].done()):
+                    self._collect(*pending.popleft(), t0)
+            while pending:
+                self._collect(*pending.popleft(), t0)
+        finally:
+            elapsed = time.perf_counter() - t0
+            self.steps_per_s = self.steps_done / elapsed if elapsed > 0 else 0.0
+            if isinstance(self.data, np.memmap):
+                self.data.flush()
+        return self.data[: self.steps_done]
+
+    def _collect(self, i: int, fut, t0: float) -> None:
+        raw, value, _ = fut.result()
+        row = self.data[i]
+        row["t"] = time.perf_counter() - t0
+        if raw is not None:
+            row["raw"] = raw
+            row["value"] = value
+        self.steps_done = i + 1
+        if isinstance(self.data, np.memmap) and self.steps_done % FLUSH_EVERY == 0:
+            self.data.flush()
+        if self.on_step is not None:
+            self.on_step(i, row)
+
+
+# ==========================
+# 命令行
+# ==========================
+
+def main():
+    ap = argparse.ArgumentParser(description="FTX-1 band scan (meter vs. frequency)")
+    ap.add_argument("--port", default="COM11", help="CAT port")
+    ap.add_argument("--baud", type=int, default=38400)
+    ap.add_argument("--port2", default="COM12", help="PTT (RTS) port")
+    ap.add_argument("--start", type=int, required=True, help="start frequency, Hz")
+    ap.add_argument("--stop", type=int, required=True, help="stop frequency, Hz")
+    ap.add_argument("--step", type=int, default=1000, help="step, Hz")
+    ap.add_argument("--dwell", type=float, default=0.0, help="settle time before each meter read, s")
+    ap.add_argument("--meter", type=int, default=1, help="RM meter id (1 = S meter)")
+    ap.add_argument("--out", default="scan.npy", help="output .npy file")
+    args = ap.parse_args()
+
+    cat = FTX1Cat(port=args.port, baudrate=args.baud, port2=args.port2, timeout=0.5)
+    scan = BandScan(cat, args.start, args.stop, args.step, args.dwell, args.meter, args.out)
+    try:
+        scan.run()
+    except KeyboardInterrupt:
+        scan.stop()
+    finally:
+        cat.close()
+    print(DISPLAY_TEXT["log_scan_done_fmt"].format(n=scan.steps_done, rate=scan.steps_per_s, path=args.out))
+
+
+if __name__ == "__main__":
+    main()
@@ -83,7 +83,34 @@ DISPLAY_TEXT_EN = {
  'rts_read_failed_fmt': 'Failed to read RTS state: {e}',
  'set_failed': 'Set failed',
  'status_connected_fmt': 'Connected  CAT:{port}@{baud}  PTT(RTS):{port2}@{baud2}',
- 'status_disconnected': 'Disconnected'
+ 'status_disconnected': 'Disconnected',
+ 'err_set_verify_fmt': 'CAT set not confirmed: sent {cmd!r}, read back {resp!r}',
+ 'chk_auto_info': 'Auto-Info',
+ 'log_broker_listen_fmt': '[ftx1d] Listening on {addr}',
+ 'log_broker_client_fmt': '[ftx1d] Client connected from {addr}',
+ 'err_broker_method_fmt': 'Unknown broker method: {method}',
+ 'err_broker_disconnected': 'Connection to ftx1d lost',
+ 'status_link_lost': 'CAT port lost, reconnecting...',
+ 'status_link_restored_fmt': 'CAT port reconnected in {seconds:.1f}s',
+ 'err_baud_probe_failed_fmt': "No working CAT baud rate found on {port}. Check the radio's CAT RATE menu and the cable.",
+ 'err_transaction_committed': 'Transaction already committed',
+ 'err_mem_channel_fmt': 'Memory channel out of range: {channel}',
+ 'err_mem_freq_fmt': 'Memory channel {channel}: frequency {freq_hz} Hz out of range',
+ 'err_mem_clar_fmt': 'Memory channel {channel}: clarifier offset must be within ±9999 Hz',
+ 'err_mem_tag_fmt': 'Memory channel {channel}: tag must be at most {n} ASCII characters',
+ 'err_mem_csv_fmt': '{path}, line {line}: {e}',
+ 'log_mem_done_fmt': '{n} memory channels, {rate:.1f} channels/s',
+ 'err_scan_range_fmt': 'Invalid scan range: start={start}, stop={stop}, step={step} (Hz)',
+ 'log_scan_done_fmt': '{n} steps, {rate:.1f} steps/s, saved to {path}',
+ 'err_emulator_posix': 'The FTX-1 emulator needs a POSIX pseudo-terminal (Linux/macOS)',
+ 'log_emulator_port_fmt': 'FTX-1 emulator on {port} at {baud} baud (use loop:// as the PTT port). Ctrl+C to stop.',
+ 'err_capture_format_fmt': '{path} is not an FTX-1 CAT capture file',
+ 'log_capture_summary_fmt': '{duration:.3f} s, {writes} writes ({tx} bytes), {reads} reads ({rx} bytes), {opens} port opens',
+ 'err_freq_range_fmt': 'Frequency out of range: {freq_hz} Hz (0 ~ 999999999)',
+ 'err_mem_flag_fmt': 'Memory channel {channel}: {field} must be a single digit 0-9, got {value}',
+ 'status_baud_probing_fmt': 'Probing CAT baud rate on {port}...',
+ 'err_broker_running_fmt': 'Another ftx1d is already listening on {addr}',
+ 'err_broker_path_fmt': '{path} is not a socket or not a private directory of the current user'
 }
 DISPLAY_TEXT_ZH = {
  'agc_read_failed_fmt': 'AGC 读取失败: {e}',
@@ -166,7 +193,34 @@ DISPLAY_TEXT_ZH = {
  'rts_read_failed_fmt': '无法读取 RTS 状态: {e}',
  'set_failed': '设置失败',
  'status_connected_fmt': '已连接 CAT:{port}@{baud}  PTT(RTS):{port2}@{baud2}',
- 'status_disconnected': '未连接'
+ 'status_disconnected': '未连接',
+ 'err_set_verify_fmt': 'CAT 设置未确认：发送 {cmd!r}，回读 {resp!r}',
+ 'chk_auto_info': '自动上报',
+ 'log_broker_listen_fmt': '[ftx1d] 监听 {addr}',
+ 'log_broker_client_fmt': '[ftx1d] 客户端连接自 {addr}',
+ 'err_broker_method_fmt': '代理不支持的方法：{method}',
+ 'err_broker_disconnected': '与 ftx1d 的连接已断开',
+ 'status_link_lost': 'CAT 串口断开，正在重连...',
+ 'status_link_restored_fmt': 'CAT 串口已重连，用时 {seconds:.1f} 秒',
+ 'err_baud_probe_failed_fmt': '{port} 上没有探测到可用的 CAT 波特率，请检查电台 CAT RATE 菜单和连线。',
+ 'err_transaction_committed': '事务已经提交过了',
+ 'err_mem_channel_fmt': '存储器通道号超出范围：{channel}',
+ 'err_mem_freq_fmt': '存储器通道 {channel}：频率 {freq_hz} Hz 超出范围',
+ 'err_mem_clar_fmt': '存储器通道 {channel}：CLAR 偏移须在 ±9999 Hz 以内',
+ 'err_mem_tag_fmt': '存储器通道 {channel}：标签最多 {n} 个 ASCII 字符',
+ 'err_mem_csv_fmt': '{path} 第 {line} 行：{e}',
+ 'log_mem_done_fmt': '存储器 {n} 个通道，{rate:.1f} 通道/秒',
+ 'err_scan_range_fmt': '扫描范围无效：start={start}，stop={stop}，step={step} (Hz)',
+ 'log_scan_done_fmt': '扫描 {n} 步，{rate:.1f} 步/秒，已保存到 {path}',
+ 'err_emulator_posix': 'FTX-1 模拟器需要 POSIX 伪终端（Linux/macOS）',
+ 'log_emulator_port_fmt': 'FTX-1 模拟器：{port}，{baud} 波特（PTT 口用 loop://），Ctrl+C 退出。',
+ 'err_capture_format_fmt': '{path} 不是 FTX-1 CAT 录制文件',
+ 'log_capture_summary_fmt': '{duration:.3f} 秒，写出 {writes} 次（{tx} 字节），读入 {reads} 次（{rx} 字节），打开串口 {opens} 次',
+ 'err_freq_range_fmt': '频率超出范围: {freq_hz} Hz (0 ~ 999999999)',
+ 'err_mem_flag_fmt': '存储器通道 {channel}：{field} 必须是 0-9 的一位数字，实际为 {value}',
+ 'status_baud_probing_fmt': '正在探测 {port} 的 CAT 波特率...',
+ 'err_broker_running_fmt': '已有 ftx1d 在 {addr} 上监听',
+ 'err_broker_path_fmt': '{path} 不是 socket，或不是当前用户私有的目录'
 }
 DISPLAY_TEXT_JA = {
  'agc_read_failed_fmt': 'AGC の読み取りに失敗: {e}',
@@ -249,7 +303,34 @@ DISPLAY_TEXT_JA = {
  'rts_read_failed_fmt': 'RTS 状態の読み取りに失敗: {e}',
  'set_failed': '設定に失敗',
  'status_connected_fmt': '接続済み  CAT:{port}@{baud}  PTT(RTS):{port2}@{baud2}',
- 'status_disconnected': '未接続'
+ 'status_disconnected': '未接続',
+ 'err_set_verify_fmt': 'CAT 設定を確認できません: 送信 {cmd!r}、読み返し {resp!r}',
+ 'chk_auto_info': '自動通知',
+ 'log_broker_listen_fmt': '[ftx1d] 待受 {addr}',
+ 'log_broker_client_fmt': '[ftx1d] クライアント接続 {addr}',
+ 'err_broker_method_fmt': 'ブローカーが対応していないメソッド: {method}',
+ 'err_broker_disconnected': 'ftx1d との接続が切断されました',
+ 'status_link_lost': 'CAT ポートが切断されました。再接続中...',
+ 'status_link_restored_fmt': 'CAT ポート再接続完了（{seconds:.1f} 秒）',
+ 'err_baud_probe_failed_fmt': '{port} で使用可能な CAT ボーレートが見つかりません。無線機の CAT RATE メニューとケーブルを確認してください。',
+ 'err_transaction_committed': 'トランザクションは既にコミットされています',
+ 'err_mem_channel_fmt': 'メモリーチャンネル番号が範囲外: {channel}',
+ 'err_mem_freq_fmt': 'メモリーチャンネル {channel}: 周波数 {freq_hz} Hz が範囲外',
+ 'err_mem_clar_fmt': 'メモリーチャンネル {channel}: クラリファイアのオフセットは ±9999 Hz 以内',
+ 'err_mem_tag_fmt': 'メモリーチャンネル {channel}: タグは ASCII {n} 文字以内',
+ 'err_mem_csv_fmt': '{path} {line} 行目: {e}',
+ 'log_mem_done_fmt': 'メモリー {n} チャンネル、{rate:.1f} ch/秒',
+ 'err_scan_range_fmt': 'スキャン範囲が無効: start={start}, stop={stop}, step={step} (Hz)',
+ 'log_scan_done_fmt': '{n} ステップ、{rate:.1f} ステップ/秒、{path} に保存しました',
+ 'err_emulator_posix': 'FTX-1 エミュレーターには POSIX 疑似端末（Linux/macOS）が必要です',
+ 'log_emulator_port_fmt': 'FTX-1 エミュレーター: {port}、{baud} bps（PTT ポートは loop://）。Ctrl+C で終了。',
+ 'err_capture_format_fmt': '{path} は FTX-1 CAT キャプチャファイルではありません',
+ 'log_capture_summary_fmt': '{duration:.3f} 秒、書き込み {writes} 回（{tx} バイト）、読み込み {reads} 回（{rx} バイト）、ポートオープン {opens} 回',
+ 'err_freq_range_fmt': '周波数が範囲外です: {freq_hz} Hz (0 ~ 999999999)',
+ 'err_mem_flag_fmt': 'メモリチャンネル {channel}: {field} は 0-9 の 1 桁である必要があります（値: {value}）',
+ 'status_baud_probing_fmt': '{port} の CAT ボーレートを検出中...',
+ 'err_broker_running_fmt': '別の ftx1d が既に {addr} で待ち受けています',
+ 'err_broker_path_fmt': '{path} はソケットでないか、現在のユーザー専用のディレクトリではありません'
 }
 DISPLAY_TEXT_RU = {
  'agc_read_failed_fmt': 'Не удалось прочитать AGC: {e}',
@@ -332,7 +413,34 @@ DISPLAY_TEXT_RU = {
  'rts_read_failed_fmt': 'Не удалось прочитать состояние RTS: {e}',
  'set_failed': 'Установка не удалась',
  'status_connected_fmt': 'Подключено  CAT:{port}@{baud}  PTT(RTS):{port2}@{baud2}',
- 'status_disconnected': 'Отключено'
+ 'status_disconnected': 'Отключено',
+ 'err_set_verify_fmt': 'Установка CAT не подтверждена: отправлено {cmd!r}, прочитано {resp!r}',
+ 'chk_auto_info': 'Автоинформ.',
+ 'log_broker_listen_fmt': '[ftx1d] Слушаем {addr}',
+ 'log_broker_client_fmt': '[ftx1d] Клиент подключён: {addr}',
+ 'err_broker_method_fmt': 'Неизвестный метод брокера: {method}',
+ 'err_broker_disconnected': 'Соединение с ftx1d потеряно',
+ 'status_link_lost': 'CAT-порт потерян, переподключение...',
+ 'status_link_restored_fmt': 'CAT-порт переподключён за {seconds:.1f} с',
+ 'err_baud_probe_failed_fmt': 'На {port} не найдена рабочая скорость CAT. Проверьте меню CAT RATE радиостанции и кабель.',
+ 'err_transaction_committed': 'Транзакция уже выполнена',
+ 'err_mem_channel_fmt': 'Номер канала памяти вне диапазона: {channel}',
+ 'err_mem_freq_fmt': 'Канал памяти {channel}: частота {freq_hz} Гц вне диапазона',
+ 'err_mem_clar_fmt': 'Канал памяти {channel}: расстройка должна быть в пределах ±9999 Гц',
+ 'err_mem_tag_fmt': 'Канал памяти {channel}: метка — не более {n} символов ASCII',
+ 'err_mem_csv_fmt': '{path}, строка {line}: {e}',
+ 'log_mem_done_fmt': 'Каналов памяти: {n}, {rate:.1f} кан./с',
+ 'err_scan_range_fmt': 'Неверный диапазон сканирования: start={start}, stop={stop}, step={step} (Гц)',
+ 'log_scan_done_fmt': 'Шагов: {n}, {rate:.1f} шаг/с, сохранено в {path}',
+ 'err_emulator_posix': 'Эмулятору FTX-1 нужен псевдотерминал POSIX (Linux/macOS)',
+ 'log_emulator_port_fmt': 'Эмулятор FTX-1 на {port}, {baud} бод (порт PTT: loop://). Ctrl+C — выход.',
+ 'err_capture_format_fmt': '{path} не является файлом записи CAT FTX-1',
+ 'log_capture_summary_fmt': '{duration:.3f} с, записей {writes} ({tx} байт), чтений {reads} ({rx} байт), открытий порта {opens}',
+ 'err_freq_range_fmt': 'Частота вне диапазона: {freq_hz} Гц (0 ~ 999999999)',
+ 'err_mem_flag_fmt': 'Канал памяти {channel}: {field} должен быть одной цифрой 0-9, получено {value}',
+ 'status_baud_probing_fmt': 'Определение скорости CAT на {port}...',
+ 'err_broker_running_fmt': 'Другой ftx1d уже слушает {addr}',
+ 'err_broker_path_fmt': '{path} не является сокетом или личным каталогом текущего пользователя'
 }
 DISPLAY_TEXT_DE = {
  'agc_read_failed_fmt': 'AGC konnte nicht gelesen werden: {e}',
@@ -415,7 +523,34 @@ DISPLAY_TEXT_DE = {
  'rts_read_failed_fmt': 'RTS-Status konnte nicht gelesen werden: {e}',
  'set_failed': 'Setzen fehlgeschlagen',
  'status_connected_fmt': 'Verbunden  CAT:{port}@{baud}  PTT(RTS):{port2}@{baud2}',
- 'status_disconnected': 'Getrennt'
+ 'status_disconnected': 'Getrennt',
+ 'err_set_verify_fmt': 'CAT-Einstellung nicht bestätigt: gesendet {cmd!r}, zurückgelesen {resp!r}',
+ 'chk_auto_info': 'Auto-Info',
+ 'log_broker_listen_fmt': '[ftx1d] Lauscht auf {addr}',
+ 'log_broker_client_fmt': '[ftx1d] Client verbunden von {addr}',
+ 'err_broker_method_fmt': 'Unbekannte Broker-Methode: {method}',
+ 'err_broker_disconnected': 'Verbindung zu ftx1d verloren',
+ 'status_link_lost': 'CAT-Port getrennt, verbinde erneut...',
+ 'status_link_restored_fmt': 'CAT-Port nach {seconds:.1f} s wieder verbunden',
+ 'err_baud_probe_failed_fmt': 'Keine funktionierende CAT-Baudrate an {port} gefunden. Menü CAT RATE am Funkgerät und Kabel prüfen.',
+ 'err_transaction_committed': 'Transaktion wurde bereits ausgeführt',
+ 'err_mem_channel_fmt': 'Speicherkanal außerhalb des Bereichs: {channel}',
+ 'err_mem_freq_fmt': 'Speicherkanal {channel}: Frequenz {freq_hz} Hz außerhalb des Bereichs',
+ 'err_mem_clar_fmt': 'Speicherkanal {channel}: Clarifier-Ablage muss innerhalb ±9999 Hz liegen',
+ 'err_mem_tag_fmt': 'Speicherkanal {channel}: Name darf höchstens {n} ASCII-Zeichen lang sein',
+ 'err_mem_csv_fmt': '{path}, Zeile {line}: {e}',
+ 'log_mem_done_fmt': '{n} Speicherkanäle, {rate:.1f} Kanäle/s',
+ 'err_scan_range_fmt': 'Ungültiger Scanbereich: start={start}, stop={stop}, step={step} (Hz)',
+ 'log_scan_done_fmt': '{n} Schritte, {rate:.1f} Schritte/s, gespeichert in {path}',
+ 'err_emulator_posix': 'Der FTX-1-Emulator benötigt ein POSIX-Pseudoterminal (Linux/macOS)',
+ 'log_emulator_port_fmt': 'FTX-1-Emulator auf {port} mit {baud} Baud (PTT-Port: loop://). Beenden mit Strg+C.',
+ 'err_capture_format_fmt': '{path} ist keine FTX-1-CAT-Aufzeichnung',
+ 'log_capture_summary_fmt': '{duration:.3f} s, {writes} Schreibvorgänge ({tx} Bytes), {reads} Lesevorgänge ({rx} Bytes), {opens}× Port geöffnet',
+ 'err_freq_range_fmt': 'Frequenz außerhalb des Bereichs: {freq_hz} Hz (0 ~ 999999999)',
+ 'err_mem_flag_fmt': 'Speicherkanal {channel}: {field} muss eine einzelne Ziffer 0-9 sein, erhalten {value}',
+ 'status_baud_probing_fmt': 'CAT-Baudrate auf {port} wird ermittelt...',
+ 'err_broker_running_fmt': 'Ein anderer ftx1d lauscht bereits auf {addr}',
+ 'err_broker_path_fmt': '{path} ist kein Socket bzw. kein privates Verzeichnis des aktuellen Benutzers'
 }
 DISPLAY_TEXT_FR = {
  'agc_read_failed_fmt': 'Échec de lecture de l\'AGC : {e}',
@@ -498,7 +633,34 @@ DISPLAY_TEXT_FR = {
  'rts_read_failed_fmt': 'Échec de lecture de l\'état RTS : {e}',
  'set_failed': 'Réglage échoué',
  'status_connected_fmt': 'Connecté  CAT:{port}@{baud}  PTT(RTS):{port2}@{baud2}',
- 'status_disconnected': 'Déconnecté'
+ 'status_disconnected': 'Déconnecté',
+ 'err_set_verify_fmt': 'Réglage CAT non confirmé : envoyé {cmd!r}, relu {resp!r}',
+ 'chk_auto_info': 'Info auto',
+ 'log_broker_listen_fmt': '[ftx1d] Écoute sur {addr}',
+ 'log_broker_client_fmt': '[ftx1d] Client connecté depuis {addr}',
+ 'err_broker_method_fmt': 'Méthode du broker inconnue : {method}',
+ 'err_broker_disconnected': 'Connexion à ftx1d perdue',
+ 'status_link_lost': 'Port CAT perdu, reconnexion...',
+ 'status_link_restored_fmt': 'Port CAT reconnecté en {seconds:.1f} s',
+ 'err_baud_probe_failed_fmt': 'Aucun débit CAT fonctionnel trouvé sur {port}. Vérifiez le menu CAT RATE de la radio et le câble.',
+ 'err_transaction_committed': 'Transaction déjà validée',
+ 'err_mem_channel_fmt': 'Canal mémoire hors plage : {channel}',
+ 'err_mem_freq_fmt': 'Canal mémoire {channel} : fréquence {freq_hz} Hz hors plage',
+ 'err_mem_clar_fmt': 'Canal mémoire {channel} : le décalage clarifier doit être dans ±9999 Hz',
+ 'err_mem_tag_fmt': "Canal mémoire {channel} : l'étiquette doit faire au plus {n} caractères ASCII",
+ 'err_mem_csv_fmt': '{path}, ligne {line} : {e}',
+ 'log_mem_done_fmt': '{n} canaux mémoire, {rate:.1f} canaux/s',
+ 'err_scan_range_fmt': 'Plage de balayage invalide : start={start}, stop={stop}, step={step} (Hz)',
+ 'log_scan_done_fmt': '{n} pas, {rate:.1f} pas/s, enregistré dans {path}',
+ 'err_emulator_posix': "L'émulateur FTX-1 nécessite un pseudo-terminal POSIX (Linux/macOS)",
+ 'log_emulator_port_fmt': 'Émulateur FTX-1 sur {port} à {baud} bauds (port PTT : loop://). Ctrl+C pour arrêter.',
+ 'err_capture_format_fmt': "{path} n'est pas un fichier de capture CAT FTX-1",
+ 'log_capture_summary_fmt': '{duration:.3f} s, {writes} écritures ({tx} octets), {reads} lectures ({rx} octets), {opens} ouvertures du port',
+ 'err_freq_range_fmt': 'Fréquence hors plage : {freq_hz} Hz (0 ~ 999999999)',
+ 'err_mem_flag_fmt': 'Canal mémoire {channel} : {field} doit être un seul chiffre 0-9, reçu {value}',
+ 'status_baud_probing_fmt': 'Détection du débit CAT sur {port}...',
+ 'err_broker_running_fmt': 'Un autre ftx1d écoute déjà sur {addr}',
+ 'err_broker_path_fmt': "{path} n'est pas un socket ou pas un répertoire privé de l'utilisateur actuel"
 }
 DISPLAY_TEXT_ES = {
  'agc_read_failed_fmt': 'Error al leer AGC: {e}',
@@ -581,7 +743,34 @@ DISPLAY_TEXT_ES = {
  'rts_read_failed_fmt': 'Error al leer el estado RTS: {e}',
  'set_failed': 'Configuración fallida',
  'status_connected_fmt': 'Conectado  CAT:{port}@{baud}  PTT(RTS):{port2}@{baud2}',
- 'status_disconnected': 'Desconectado'
+ 'status_disconnected': 'Desconectado',
+ 'err_set_verify_fmt': 'Ajuste CAT no confirmado: enviado {cmd!r}, leído {resp!r}',
+ 'chk_auto_info': 'Info auto',
+ 'log_broker_listen_fmt': '[ftx1d] Escuchando en {addr}',
+ 'log_broker_client_fmt': '[ftx1d] Cliente conectado desde {addr}',
+ 'err_broker_method_fmt': 'Método del broker desconocido: {method}',
+ 'err_broker_disconnected': 'Se perdió la conexión con ftx1d',
+ 'status_link_lost': 'Puerto CAT perdido, reconectando...',
+ 'status_link_restored_fmt': 'Puerto CAT reconectado en {seconds:.1f} s',
+ 'err_baud_probe_failed_fmt': 'No se encontró una velocidad CAT válida en {port}. Compruebe el menú CAT RATE de la radio y el cable.',
+ 'err_transaction_committed': 'La transacción ya se confirmó',
+ 'err_mem_channel_fmt': 'Canal de memoria fuera de rango: {channel}',
+ 'err_mem_freq_fmt': 'Canal de memoria {channel}: frecuencia {freq_hz} Hz fuera de rango',
+ 'err_mem_clar_fmt': 'Canal de memoria {channel}: el desplazamiento del clarificador debe estar dentro de ±9999 Hz',
+ 'err_mem_tag_fmt': 'Canal de memoria {channel}: la etiqueta debe tener como máximo {n} caracteres ASCII',
+ 'err_mem_csv_fmt': '{path}, línea {line}: {e}',
+ 'log_mem_done_fmt': '{n} canales de memoria, {rate:.1f} canales/s',
+ 'err_scan_range_fmt': 'Rango de barrido no válido: start={start}, stop={stop}, step={step} (Hz)',
+ 'log_scan_done_fmt': '{n} pasos, {rate:.1f} pasos/s, guardado en {path}',
+ 'err_emulator_posix': 'El emulador FTX-1 necesita un pseudoterminal POSIX (Linux/macOS)',
+ 'log_emulator_port_fmt': 'Emulador FTX-1 en {port} a {baud} baudios (puerto PTT: loop://). Ctrl+C para salir.',
+ 'err_capture_format_fmt': '{path} no es un archivo de captura CAT de FTX-1',
+ 'log_capture_summary_fmt': '{duration:.3f} s, {writes} escrituras ({tx} bytes), {reads} lecturas ({rx} bytes), {opens} aperturas del puerto',
+ 'err_freq_range_fmt': 'Frecuencia fuera de rango: {freq_hz} Hz (0 ~ 999999999)',
+ 'err_mem_flag_fmt': 'Canal de memoria {channel}: {field} debe ser un solo dígito 0-9, se recibió {value}',
+ 'status_baud_probing_fmt': 'Detectando la velocidad CAT en {port}...',
+ 'err_broker_running_fmt': 'Ya hay otro ftx1d escuchando en {addr}',
+ 'err_broker_path_fmt': '{path} no es un socket o no es un directorio privado del usuario actual'
 }
 I18N_TEXT = {
     "en": DISPLAY_TEXT_EN,
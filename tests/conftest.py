@@ -0,0 +1,42 @@
+import os
+import sys
+
+import pytest
+import serial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ftx1emu  # noqa: E402
+
+
+class FlakySerial:
+    """包一层串口，fail_writes > 0 时接下来的几次 write 抛 SerialException（模拟 USB 断开）。"""
+
+    fail_writes = 0
+
+    def __init__(self, ser):
+        self._ser = ser
+
+    def __getattr__(self, name):
+        return getattr(self._ser, name)
+
+    def write(self, data):
+        if FlakySerial.fail_writes > 0:
+            FlakySerial.fail_writes -= 1
+            raise serial.SerialException("injected write failure")
+        return self._ser.write(data)
+
+
+@pytest.fixture
+def flaky_factory():
+    FlakySerial.fail_writes = 0
+    yield lambda port, **kwargs: FlakySerial(serial.serial_for_url(port, **kwargs))
+    FlakySerial.fail_writes = 0
+
+
+@pytest.fixture
+def emu():
+    if ftx1emu.termios is None:
+        pytest.skip("emulator needs a POSIX pty")
+    with ftx1emu.FTX1Emulator(latency_s=0.0, register=False) as radio:
+        yield radio
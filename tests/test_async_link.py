@@ -0,0 +1,32 @@
+import asyncio
+
+import pytest
+import serial
+
+from ftx1async import AsyncCatLink
+
+
+class _FailingSerial:
+    baudrate = 38400
+    in_waiting = 0
+
+    def read(self, n):
+        return b""
+
+    def write(self, data):
+        raise serial.SerialException("injected write failure")
+
+
+def test_failed_write_removes_whole_batch_from_demux():
+    async def run():
+        link = AsyncCatLink(_FailingSerial(), asyncio.get_running_loop(), timeout=0.2)
+        try:
+            with pytest.raises(serial.SerialException):
+                await link.write(["FA014074000", "MD0C", "GT00"])
+            with pytest.raises(serial.SerialException):
+                await link.query(["FA"])
+            assert not link._demux._pending
+        finally:
+            link.close()
+
+    asyncio.run(run())
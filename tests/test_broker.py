@@ -0,0 +1,67 @@
+import asyncio
+import os
+import socket
+import stat
+
+import pytest
+
+from ftx1cat import FTX1Cat
+from ftx1d import FTX1Broker, FTX1Client, _ensure_private_dir
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs AF_UNIX")
+
+
+@pytest.fixture
+def cat(emu):
+    cat = FTX1Cat(port=emu.port, port2="loop://", timeout=0.3)
+    yield cat
+    cat.close()
+
+
+def test_socket_is_private_and_not_taken_over(cat, tmp_path):
+    path = str(tmp_path / "ftx1d.sock")
+
+    async def run():
+        first = FTX1Broker(cat, path)
+        await first.start()
+        try:
+            assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+            second = FTX1Broker(cat, path)
+            with pytest.raises(FileExistsError):
+                await second.start()
+            await second.close()
+            # 第一个代理仍然在服务
+            client = FTX1Client(path)
+            try:
+                freq_hz, _ = await asyncio.get_running_loop().run_in_executor(None, client.get_freq)
+                assert freq_hz == 14_074_000
+            finally:
+                client.close()
+        finally:
+            await first.close()
+
+    asyncio.run(run())
+
+
+def test_stale_socket_is_replaced(cat, tmp_path):
+    path = str(tmp_path / "ftx1d.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+
+    async def run():
+        broker = FTX1Broker(cat, path)
+        await broker.start()
+        await broker.close()
+
+    asyncio.run(run())
+
+
+def test_refuses_shared_directory(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    os.chmod(shared, 0o777)
+    with pytest.raises(PermissionError):
+        _ensure_private_dir(str(shared))
+    _ensure_private_dir(str(tmp_path / "private"))
+    assert stat.S_IMODE(os.stat(tmp_path / "private").st_mode) == 0o700
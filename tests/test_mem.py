@@ -0,0 +1,45 @@
+import csv
+
+import pytest
+
+from ftx1mem import CSV_FIELDS, MemoryBank, MemoryChannel, _mw_cmd, _parse_mr
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row._asdict())
+
+
+def test_csv_round_trip(tmp_path):
+    path = str(tmp_path / "mem.csv")
+    bank = MemoryBank(cat=None)
+    bank.table = {
+        1: MemoryChannel(1, 14_074_000, "USB", tag="FT8"),
+        99: MemoryChannel(99, 7_074_000, "LSB", clar_offset_hz=-120, ch_type=2, tone_mode=9, shift=1),
+    }
+    bank.to_csv(path)
+    other = MemoryBank(cat=None)
+    assert other.from_csv(path) == bank.table
+    for ch in bank.table.values():
+        cmd, _, (readback,) = _mw_cmd(ch)
+        assert _parse_mr((readback + ";").encode("ascii")) == ch._replace(tag="")
+
+
+@pytest.mark.parametrize(
+    "row",
+    [
+        MemoryChannel(1, 14_074_000, "USB", ch_type=12),
+        MemoryChannel(1, 14_074_000, "USB", shift=-1),
+        MemoryChannel(1, 14_074_000, "USB", tone_mode=10),
+        MemoryChannel(0, 14_074_000, "USB"),
+        MemoryChannel(100, 14_074_000, "USB"),
+    ],
+)
+def test_csv_rejects_bad_channel(tmp_path, row):
+    path = str(tmp_path / "mem.csv")
+    _write_csv(path, [row])
+    with pytest.raises(ValueError):
+        MemoryBank(cat=None).from_csv(path)
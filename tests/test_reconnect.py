@@ -0,0 +1,66 @@
+import threading
+import time
+
+from conftest import FlakySerial
+from ftx1cat import FTX1Cat
+
+
+def _wait(cond, timeout=5.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if cond():
+            return True
+        time.sleep(0.01)
+    return cond()
+
+
+def _drop_link(cat):
+    """下一次写串口失败，触发断线重连，等恢复完成。"""
+    count = cat.reconnect_stats["count"]
+    result = []
+    FlakySerial.fail_writes = 1
+    th = threading.Thread(target=lambda: result.append(cat.get_mode(max_age=0)), daemon=True)
+    th.start()
+    assert _wait(lambda: cat.reconnect_stats["count"] > count)
+    # 断线时在途的查询留在队列里，恢复后照常得到应答
+    th.join(5.0)
+    assert result and result[0][0] is not None
+
+
+def test_reconnect_keeps_vfo_change_pushed_after_set(emu, flaky_factory):
+    cat = FTX1Cat(port=emu.port, port2="loop://", timeout=0.3, auto_info=True, serial_factory=flaky_factory)
+    try:
+        cat.set_freq(14_100_000)
+        assert _wait(lambda: emu.state["FA"] == "014100000")
+
+        # 旋钮调频：电台主动上报
+        emu.state["FA"] = "007074000"
+        emu.push("FA")
+        assert _wait(lambda: cat.get_freq()[0] == 7_074_000)
+
+        _drop_link(cat)
+        log = list(emu.log)
+        after = log[len(log) - log[::-1].index("ID"):]
+        assert not any(cmd.startswith("FA0") for cmd in after)
+        assert emu.state["FA"] == "007074000"
+        assert emu.state["AI"] == "1"
+        assert cat.get_freq()[0] == 7_074_000
+        assert cat.reconnect_stats["diverged"] == []
+    finally:
+        cat.close()
+
+
+def test_reconnect_reads_back_state_changed_while_disconnected(emu, flaky_factory):
+    cat = FTX1Cat(port=emu.port, port2="loop://", timeout=0.3, serial_factory=flaky_factory)
+    try:
+        cat.set_freq(14_100_000)
+        assert _wait(lambda: emu.state["FA"] == "014100000")
+
+        # 断开期间在面板上改了频率，没有上报
+        emu.state["FA"] = "021074000"
+        _drop_link(cat)
+        assert emu.state["FA"] == "021074000"
+        assert cat.get_freq()[0] == 21_074_000
+        assert cat.reconnect_stats["diverged"] == ["FA"]
+    finally:
+        cat.close()
@@ -0,0 +1,38 @@
+import time
+
+import pytest
+
+from ftx1cat import DEFAULT_STATE_TTL, FTX1Cat, RigStateCache, _freq_cmd
+
+
+@pytest.mark.parametrize("freq_hz", [-1, 1_000_000_000])
+def test_freq_cmd_rejects_out_of_range(freq_hz):
+    with pytest.raises(ValueError):
+        _freq_cmd(freq_hz)
+
+
+def test_set_derived_frame_is_not_reported():
+    cache = RigStateCache()
+    cache.put(b"FA014074000;", reported=False)
+    assert not cache.reported(b"FA")
+    cache.put(b"FA007074000;")
+    assert cache.reported(b"FA")
+
+
+def test_rejected_set_expires_in_ai_mode(emu):
+    cat = FTX1Cat(port=emu.port, port2="loop://", timeout=0.3, auto_info=True)
+    try:
+        cat.set_freq(14_100_000)
+        # 电台没有接受这次 set（真机回 "?;"），频率仍是原来的
+        time.sleep(0.1)
+        emu.state["FA"] = "014074000"
+        assert cat.get_freq()[0] == 14_100_000
+        time.sleep(DEFAULT_STATE_TTL["FA"] + 0.1)
+        assert cat.get_freq()[0] == 14_074_000
+        # 电台报告过的值在 AI 模式下不过期
+        time.sleep(DEFAULT_STATE_TTL["FA"] + 0.1)
+        n = emu.commands
+        assert cat.get_freq()[0] == 14_074_000
+        assert emu.commands == n
+    finally:
+        cat.close()